@@ -0,0 +1,250 @@
+import copy
+from dataclasses import dataclass
+
+from garaga.modulo_circuit import ModuloCircuit, ModuloCircuitElement, WriteOps
+from garaga.modulo_circuit_structs import Cairo1SerializableStruct, u384Array
+
+
+@dataclass(slots=True, frozen=True)
+class ChainLink:
+    """
+    The output struct `output` of circuit `producer` is passed as the input struct `input`
+    of circuit `consumer`, field by field. Indexes refer to the list of chained circuits.
+    """
+
+    producer: int
+    output: str
+    consumer: int
+    input: str
+
+
+@dataclass(slots=True)
+class ChainLiveness:
+    """
+    Result of analyze_chain. Fields are (struct name, index of the element in the struct).
+
+    Attributes:
+        unused_outputs (list[list[tuple[str, int]]]): For each circuit, the output fields not
+            needed by any consumer.
+        unused_inputs (list[list[tuple[str, int]]]): For each circuit, the input fields that no
+            needed output depends on.
+    """
+
+    unused_outputs: list[list[tuple[str, int]]]
+    unused_inputs: list[list[tuple[str, int]]]
+
+
+@dataclass(slots=True)
+class PrunedCircuit:
+    """
+    Result of prune_circuit.
+
+    Attributes:
+        circuit (ModuloCircuit): The circuit without the unused outputs and inputs.
+        kept_inputs (list[int]): The indexes in the original circuit input of the remaining inputs.
+        kept_outputs (list[int]): The indexes in the original circuit output of the remaining outputs.
+    """
+
+    circuit: ModuloCircuit
+    kept_inputs: list[int]
+    kept_outputs: list[int]
+
+
+def _fields(structs: list[Cairo1SerializableStruct], default_name: str, n: int):
+    # (struct name, index in struct) of each element, in the order of the circuit input or output.
+    if not structs:
+        return [(default_name, i) for i in range(n)]
+    fields = [(s.name, i) for s in structs for i in range(len(s))]
+    assert len(fields) == n, f"Structs cover {len(fields)} elements, expected {n}"
+    return fields
+
+
+def input_fields(circuit: ModuloCircuit) -> list[tuple[str, int]]:
+    return _fields(circuit.input_structs, "input", len(circuit.input))
+
+
+def output_fields(circuit: ModuloCircuit) -> list[tuple[str, int]]:
+    return _fields(circuit.output_structs, "output", len(circuit.output))
+
+
+def output_dependencies(circuit: ModuloCircuit) -> list[int]:
+    """
+    Returns for each output element the bitmask of the input elements (indexes in circuit.input)
+    it depends on.
+    """
+    segment = circuit.values_segment
+    deps = {elmt.offset: 1 << i for i, elmt in enumerate(circuit.input)}
+    for offset, item in segment.segment_stacks[WriteOps.BUILTIN].items():
+        mask = 0
+        for o in item.instruction.operands(offset):
+            mask |= deps.get(o, 0)
+        deps[offset] = mask
+    return [deps.get(out.offset, 0) for out in circuit.output]
+
+
+def analyze_chain(
+    circuits: list[ModuloCircuit], links: list[ChainLink]
+) -> ChainLiveness:
+    """
+    Liveness analysis of circuits evaluated one after the other, whose outputs are passed as inputs
+    of later circuits. An output struct not passed to any circuit of the chain is consumed outside
+    of it, and considered live.
+    An output field is live if it is consumed outside of the chain, or passed to a live input field.
+    An input field is live if a live output field of its circuit depends on it.
+    """
+    consumers: dict[tuple[int, str], list[ChainLink]] = {}
+    for link in links:
+        assert link.producer < link.consumer, f"Link {link} goes backwards"
+        consumers.setdefault((link.producer, link.output), []).append(link)
+
+    live_inputs: list[set[tuple[str, int]]] = [set() for _ in circuits]
+    unused_outputs = [[] for _ in circuits]
+    unused_inputs = [[] for _ in circuits]
+    for index in reversed(range(len(circuits))):
+        circuit = circuits[index]
+        live_mask = 0
+        for field, deps in zip(output_fields(circuit), output_dependencies(circuit)):
+            name, i = field
+            links_out = consumers.get((index, name))
+            if links_out is None or any(
+                (link.input, i) in live_inputs[link.consumer] for link in links_out
+            ):
+                live_mask |= deps
+            else:
+                unused_outputs[index].append(field)
+        for i, field in enumerate(input_fields(circuit)):
+            if live_mask >> i & 1:
+                live_inputs[index].add(field)
+            else:
+                unused_inputs[index].append(field)
+    return ChainLiveness(unused_outputs=unused_outputs, unused_inputs=unused_inputs)
+
+
+def _kept_structs(structs, live):
+    # Keeps a struct if any of its fields is live. Only arrays of field elements lose elements,
+    # the other structs keep their type.
+    kept, start = [], 0
+    for s in structs:
+        idx = list(range(start, start + len(s)))
+        start += len(s)
+        live_idx = [i for i in idx if i in live]
+        if isinstance(s, u384Array):
+            if live_idx:
+                kept.append((s, live_idx))
+        elif live_idx:
+            kept.append((s, idx))
+    return kept
+
+
+def prune_circuit(
+    circuit: ModuloCircuit, unused_outputs: list[tuple[str, int]]
+) -> PrunedCircuit:
+    """
+    Rebuilds a Cairo 1 circuit without the given output fields, the instructions they depend on
+    only, and the input fields no remaining output depends on.
+    Structs are removed when none of their fields are used. Otherwise they are kept whole, except
+    arrays of field elements (u384Array) that only keep their used elements.
+    """
+    if circuit.compilation_mode != 1:
+        raise NotImplementedError("Only Cairo 1 circuits can be pruned")
+    segment = circuit.values_segment
+    out_fields = output_fields(circuit)
+    unused = set(unused_outputs)
+    live_out = {i for i, f in enumerate(out_fields) if f not in unused}
+    if circuit.output_structs:
+        kept_out = _kept_structs(circuit.output_structs, live_out)
+        kept_outputs = [i for _, idx in kept_out for i in idx]
+    else:
+        kept_out = None
+        kept_outputs = sorted(live_out)
+
+    # Backward pass: instructions and inputs the kept outputs depend on.
+    needed = {circuit.output[i].offset for i in kept_outputs}
+    for offset, item in reversed(segment.segment_stacks[WriteOps.BUILTIN].items()):
+        if offset in needed:
+            needed.update(item.instruction.operands(offset))
+    live_in = {i for i, elmt in enumerate(circuit.input) if elmt.offset in needed}
+    if circuit.input_structs:
+        kept_in = _kept_structs(circuit.input_structs, live_in)
+        kept_inputs = [i for _, idx in kept_in for i in idx]
+    else:
+        kept_in = None
+        kept_inputs = sorted(live_in)
+
+    pruned = ModuloCircuit(
+        name=circuit.name,
+        curve_id=circuit.curve_id,
+        generic_circuit=circuit.generic_circuit,
+        compilation_mode=1,
+    )
+    elmts: dict[int, ModuloCircuitElement] = {}
+    if kept_in is None:
+        for i in kept_inputs:
+            elmts[circuit.input[i].offset] = pruned.write_element(
+                circuit.input[i].felt, WriteOps.INPUT
+            )
+    else:
+        for struct, idx in kept_in:
+            struct = copy.deepcopy(struct)
+            if isinstance(struct, u384Array):
+                struct.elmts = [circuit.input[i].felt for i in idx]
+            written = pruned.write_struct(struct, WriteOps.INPUT)
+            written = written if isinstance(written, list) else [written]
+            flat = []
+            while written:
+                w = written.pop(0)
+                if isinstance(w, (list, tuple)):
+                    written = list(w) + written
+                else:
+                    flat.append(w)
+            elmts.update(zip([circuit.input[i].offset for i in idx], flat))
+
+    for offset, item in segment.segment_stacks[WriteOps.CONSTANT].items():
+        if offset in needed:
+            elmts[offset] = pruned.set_or_get_constant(item.felt)
+    for offset, item in segment.segment_stacks[WriteOps.BUILTIN].items():
+        if offset in needed:
+            elmts[offset] = pruned.replay_instruction(item.instruction, offset, elmts)
+
+    if kept_out is None:
+        pruned.extend_output([elmts[circuit.output[i].offset] for i in kept_outputs])
+    else:
+        for struct, idx in kept_out:
+            struct = copy.copy(struct)
+            struct.elmts = [elmts[circuit.output[i].offset] for i in idx]
+            pruned.extend_struct_output(struct)
+    return PrunedCircuit(
+        circuit=pruned, kept_inputs=kept_inputs, kept_outputs=kept_outputs
+    )
+
+
+def minimise_chain(
+    circuits: list[ModuloCircuit], links: list[ChainLink]
+) -> tuple[list[PrunedCircuit], ChainLiveness]:
+    """
+    Drops from each circuit of a chain the outputs no later circuit needs, and then the inputs
+    (and instructions) no remaining output depends on. See analyze_chain.
+    """
+    liveness = analyze_chain(circuits, links)
+    return [
+        prune_circuit(circuit, unused)
+        for circuit, unused in zip(circuits, liveness.unused_outputs)
+    ], liveness
+
+
+def mpcheck_chain_links(
+    n_circuits: int, n_pairs: int, n_fixed_g2: int
+) -> list[ChainLink]:
+    """
+    Links of the BN254 multi-pairing check chain: the init bit circuit, n_circuits - 2 bit
+    circuits, then the finalize circuit, as wired by multi_pairing_check.cairo.
+    """
+    links = []
+    for j in range(n_circuits - 1):
+        for i in range(n_pairs - n_fixed_g2):
+            links.append(ChainLink(j, f"Q{i}", j + 1, f"Q_{n_fixed_g2 + i}"))
+        last = j + 1 == n_circuits - 1
+        lhs, ci = ("new_lhs", "c_i") if j == 0 else ("lhs_i_plus_one", "ci_plus_one")
+        links.append(ChainLink(j, lhs, j + 1, "previous_lhs" if last else "lhs_i"))
+        links.append(ChainLink(j, ci, j + 1, "c_n_minus_3" if last else "ci"))
+    return links
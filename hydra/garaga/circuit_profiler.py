@@ -0,0 +1,161 @@
+import os
+import sys
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+PROFILED_OPS = ("ADDMOD", "MULMOD", "INV", "ASSERT_EQ")
+
+_GARAGA_DIR = os.path.dirname(os.path.abspath(__file__))
+# ModuloCircuit methods emitting the instructions themselves. They are not builder methods and
+# are left out of the stacks, so that counts are attributed to their callers.
+_PRIMITIVES = {
+    "write_element",
+    "write_elements",
+    "set_or_get_constant",
+    "add",
+    "sub",
+    "mul",
+    "inv",
+    "div",
+    "neg",
+    "double",
+    "square",
+    "sum",
+    "product",
+    "add_and_assert",
+    "sub_and_assert",
+    "mul_and_assert",
+    "_profile",
+}
+_MODULO_CIRCUIT_FILE = os.path.join(_GARAGA_DIR, "modulo_circuit.py")
+
+_active_profiler: "CircuitProfiler | None" = None
+
+
+class CircuitProfiler:
+    """
+    Attributes the modulo builtin instructions of circuits to the builder methods that emitted them.
+
+    Each recorded instruction is tagged with the stack of garaga functions active at the time
+    it was written, from the outermost to the innermost, each frame labelled as
+    "<module>.<function>" (e.g. "miller_tower.double_step", "fp2.fp2_mul").
+    The root of every stack is the name of the circuit.
+
+    Attributes:
+        stacks (dict[tuple[str, ...], Counter]): Operation counts per call stack.
+    """
+
+    def __init__(self):
+        self.stacks: dict[tuple[str, ...], Counter] = defaultdict(Counter)
+
+    def record(self, circuit_name: str, op: str, frame=None) -> None:
+        """
+        Records an operation (one of PROFILED_OPS) at the current call stack.
+        The frames outside of the garaga package and the ModuloCircuit primitives are skipped.
+        """
+        frame = frame if frame is not None else sys._getframe(1)
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
+            if (
+                filename.startswith(_GARAGA_DIR)
+                # Comprehensions and lambdas are attributed to the enclosing function.
+                and not code.co_name.startswith("<")
+                and not (
+                    filename == _MODULO_CIRCUIT_FILE and code.co_name in _PRIMITIVES
+                )
+            ):
+                module = os.path.splitext(os.path.basename(filename))[0]
+                labels.append(f"{module}.{code.co_name}")
+            frame = frame.f_back
+        labels.append(circuit_name)
+        self.stacks[tuple(reversed(labels))][op] += 1
+
+    def totals(self) -> Counter:
+        total = Counter()
+        for counts in self.stacks.values():
+            total.update(counts)
+        return total
+
+    def flat(self) -> dict[str, dict[str, Counter]]:
+        """
+        Returns for each label the "self" counts (instructions emitted while it was the innermost
+        frame) and the "total" counts (instructions emitted while it was anywhere in the stack).
+        """
+        res: dict[str, dict[str, Counter]] = defaultdict(
+            lambda: {"self": Counter(), "total": Counter()}
+        )
+        for stack, counts in self.stacks.items():
+            res[stack[-1]]["self"].update(counts)
+            # A recursive function is only counted once per stack.
+            for label in set(stack):
+                res[label]["total"].update(counts)
+        return dict(res)
+
+    def flat_table(self, sort_by: str = "MULMOD") -> str:
+        """
+        Returns a text table of the self and total counts per label, sorted by total count of sort_by.
+        """
+        flat = self.flat()
+        rows = sorted(
+            flat.items(),
+            key=lambda kv: (-kv[1]["total"][sort_by], -sum(kv[1]["total"].values())),
+        )
+        width = max([len("label")] + [len(label) for label in flat])
+        header = f"{'label':<{width}}" + "".join(
+            f" {op + ' self':>14} {op + ' total':>15}" for op in PROFILED_OPS
+        )
+        lines = [header, "-" * len(header)]
+        for label, counts in rows:
+            lines.append(
+                f"{label:<{width}}"
+                + "".join(
+                    f" {counts['self'][op]:>14} {counts['total'][op]:>15}"
+                    for op in PROFILED_OPS
+                )
+            )
+        return "\n".join(lines)
+
+    def folded_stacks(self, ops: tuple[str, ...] = PROFILED_OPS) -> str:
+        """
+        Returns the stacks in the folded format of flamegraph.pl and speedscope :
+        one "frame1;frame2;...;frameN count" line per stack, counting the given operations.
+        """
+        lines = []
+        for stack, counts in sorted(self.stacks.items()):
+            count = sum(counts[op] for op in ops)
+            if count:
+                lines.append(f"{';'.join(stack)} {count}")
+        return "\n".join(lines)
+
+    def write_folded_stacks(self, path: str, ops: tuple[str, ...] = PROFILED_OPS):
+        with open(path, "w") as f:
+            f.write(self.folded_stacks(ops) + "\n")
+
+
+def get_active_profiler() -> CircuitProfiler | None:
+    return _active_profiler
+
+
+@contextmanager
+def profile_circuits(
+    profiler: CircuitProfiler | None = None,
+) -> Iterator[CircuitProfiler]:
+    """
+    Profiles every ModuloCircuit created inside the block into a single CircuitProfiler.
+
+    Usage:
+        with profile_circuits() as profiler:
+            circuit = MillerTowerCircuit(...)
+            ...
+        print(profiler.flat_table())
+    """
+    global _active_profiler
+    previous = _active_profiler
+    _active_profiler = profiler if profiler is not None else CircuitProfiler()
+    try:
+        yield _active_profiler
+    finally:
+        _active_profiler = previous
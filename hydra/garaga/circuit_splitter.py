@@ -0,0 +1,228 @@
+from dataclasses import dataclass
+
+from garaga.modulo_circuit import (
+    OP_STEPS,
+    ModBuiltinOps,
+    ModuloCircuit,
+    ModuloCircuitElement,
+    WriteOps,
+)
+from garaga.modulo_circuit_structs import u384Array
+
+INPUT_WRITE_OPS = (WriteOps.INPUT, WriteOps.COMMIT, WriteOps.WITNESS, WriteOps.FELT)
+
+
+@dataclass(slots=True)
+class CircuitSplit:
+    """
+    The result of split_circuit.
+
+    Each part i > 0 takes as input the struct "live" output by part i - 1, followed by the struct
+    "input" holding the inputs of the original circuit it uses (if any). Each part i < k - 1
+    outputs the struct "live" holding the values computed so far that are still needed afterwards.
+    The last part outputs the same values (and structs) as the original circuit.
+
+    Attributes:
+        parts (list[ModuloCircuit]): The k sub-circuits, in evaluation order.
+        inputs (list[list[int]]): For each part, the indexes in the original circuit input of the
+            elements of its "input" struct.
+        cuts (list[int]): The indexes of the first instruction of parts 1..k-1 in the original circuit.
+        live_counts (list[int]): The number of values crossing each cut.
+        weights (list[float]): The estimated steps of the instructions of each part.
+    """
+
+    parts: list[ModuloCircuit]
+    inputs: list[list[int]]
+    cuts: list[int]
+    live_counts: list[int]
+    weights: list[float]
+
+
+def _choose_cuts(
+    weights: list[float], live: list[int], n_parts: int, tolerance: float
+) -> list[int]:
+    """
+    For each cut j, picks the position with the fewest live values among the positions where the
+    weight of the instructions before the cut is within j/k ± tolerance/(2k) of the total weight.
+    The windows are disjoint, so the cuts are increasing and each minimises its live count.
+    """
+    prefix = [0.0]
+    for w in weights:
+        prefix.append(prefix[-1] + w)
+    total = prefix[-1]
+    cuts = []
+    for j in range(1, n_parts):
+        target = total * j / n_parts
+        margin = total * tolerance / (2 * n_parts)
+        window = [
+            c
+            for c in range(max(cuts[-1] + 1 if cuts else 1, 1), len(weights))
+            if abs(prefix[c] - target) <= margin
+        ]
+        if not window:
+            # Instructions heavier than the margin, take the closest position.
+            window = [
+                min(
+                    range(cuts[-1] + 1 if cuts else 1, len(weights)),
+                    key=lambda c: abs(prefix[c] - target),
+                )
+            ]
+        cuts.append(min(window, key=lambda c: (live[c], abs(prefix[c] - target))))
+    return cuts
+
+
+def split_circuit(
+    circuit: ModuloCircuit, n_parts: int, tolerance: float = 0.2
+) -> CircuitSplit:
+    """
+    Splits a traced Cairo 1 circuit into n_parts sub-circuits, evaluated one after the other.
+    The cuts are chosen so that the steps of the parts (see OP_STEPS) are balanced within the
+    tolerance, and with the fewest values crossing each cut.
+    Values needed by a later part are passed from part to part through the "live" glue structs.
+
+    Args:
+        circuit (ModuloCircuit): A circuit in compilation mode 1, before compilation.
+        n_parts (int): The number of sub-circuits.
+        tolerance (float): The allowed deviation of each cut from a perfectly balanced cut,
+            relative to the weight of a part.
+
+    Returns:
+        CircuitSplit: The sub-circuits and the cuts.
+    """
+    if circuit.compilation_mode != 1:
+        raise NotImplementedError("Only Cairo 1 circuits can be split")
+    segment = circuit.values_segment
+    ops = list(segment.segment_stacks[WriteOps.BUILTIN].items())
+    if not 1 <= n_parts <= len(ops):
+        raise ValueError(f"Cannot split {len(ops)} instructions in {n_parts} parts")
+
+    weights = [
+        (
+            OP_STEPS["ADDMOD"]
+            if item.instruction.operation == ModBuiltinOps.ADD
+            else OP_STEPS["MULMOD"]
+        )
+        for _, item in ops
+    ]
+    op_index = {offset: i for i, (offset, _) in enumerate(ops)}
+    output_offsets = [out.offset for out in circuit.output]
+
+    # Index of the last instruction reading each computed value (len(ops) for the outputs).
+    last_use = {offset: i for i, (offset, _) in enumerate(ops)}
+    for i, (offset, item) in enumerate(ops):
+        for o in item.instruction.operands(offset):
+            if o in op_index:
+                last_use[o] = max(last_use[o], i)
+    for o in output_offsets:
+        if o in op_index:
+            last_use[o] = len(ops)
+    # live[c]: number of computed values defined before instruction c and read from c onwards.
+    delta = [0] * (len(ops) + 2)
+    for offset, i in op_index.items():
+        if last_use[offset] > i:
+            delta[i + 1] += 1
+            delta[last_use[offset] + 1] -= 1
+    live = []
+    acc = 0
+    for c in range(len(ops) + 1):
+        acc += delta[c]
+        live.append(acc)
+
+    cuts = _choose_cuts(weights, live, n_parts, tolerance)
+    bounds = [0] + cuts + [len(ops)]
+
+    input_index = {elmt.offset: i for i, elmt in enumerate(circuit.input)}
+    parts = []
+    inputs = []
+    # Offsets (in the original circuit) of the elements of the previous "live" struct.
+    carried: list[int] = []
+    for j in range(n_parts):
+        start, end = bounds[j], bounds[j + 1]
+        suffix = f"_{j}"
+        part = ModuloCircuit(
+            name=circuit.name[: 31 - len(suffix)] + suffix,
+            curve_id=circuit.curve_id,
+            generic_circuit=circuit.generic_circuit,
+            compilation_mode=1,
+        )
+        elmts: dict[int, ModuloCircuitElement] = {}
+        if carried:
+            live_in = part.write_struct(
+                u384Array("live", [segment[o].felt for o in carried]), WriteOps.INPUT
+            )
+            elmts.update(zip(carried, live_in))
+
+        inputs_used = sorted(
+            {
+                o
+                for offset, item in ops[start:end]
+                for o in item.instruction.operands(offset)
+                if segment[o].write_source in INPUT_WRITE_OPS
+            }
+            | (
+                {
+                    o
+                    for o in output_offsets
+                    if segment[o].write_source in INPUT_WRITE_OPS
+                }
+                if j == n_parts - 1
+                else set()
+            )
+        )
+        if inputs_used:
+            elmts.update(
+                zip(
+                    inputs_used,
+                    part.write_struct(
+                        u384Array("input", [segment[o].felt for o in inputs_used]),
+                        WriteOps.INPUT,
+                    ),
+                )
+            )
+
+        for offset, item in ops[start:end]:
+            for o in item.instruction.operands(offset):
+                if segment[o].write_source == WriteOps.CONSTANT and o not in elmts:
+                    elmts[o] = part.set_or_get_constant(segment[o].felt)
+            elmts[offset] = part.replay_instruction(item.instruction, offset, elmts)
+
+        def output_element(o: int) -> ModuloCircuitElement:
+            # Values received as input are re-emitted with an addition, so that every output
+            # is computed by the part.
+            if segment[o].write_source == WriteOps.BUILTIN and start <= op_index[o]:
+                return elmts[o]
+            return part.add(elmts[o], part.set_or_get_constant(0))
+
+        if j < n_parts - 1:
+            carried = [
+                offset
+                for offset, i in op_index.items()
+                if i < end and last_use[offset] >= end
+            ]
+            part.extend_struct_output(
+                u384Array("live", [output_element(o) for o in carried])
+            )
+        else:
+            for o in output_offsets:
+                if segment[o].write_source == WriteOps.CONSTANT and o not in elmts:
+                    elmts[o] = part.set_or_get_constant(segment[o].felt)
+            mapped = {o: output_element(o) for o in dict.fromkeys(output_offsets)}
+            if circuit.output_structs:
+                for struct in circuit.output_structs:
+                    part.extend_struct_output(
+                        struct.__class__(
+                            struct.name, [mapped[elt.offset] for elt in struct.elmts]
+                        )
+                    )
+            else:
+                part.extend_output([mapped[o] for o in output_offsets])
+        parts.append(part)
+        inputs.append([input_index[o] for o in inputs_used])
+
+    return CircuitSplit(
+        parts=parts,
+        inputs=inputs,
+        cuts=cuts,
+        live_counts=[live[c] for c in cuts],
+        weights=[sum(weights[bounds[j] : bounds[j + 1]]) for j in range(n_parts)],
+    )
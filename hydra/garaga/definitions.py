@@ -1,5 +1,7 @@
 import functools
+import math
 import random
+import secrets
 from dataclasses import dataclass
 from enum import Enum
 from typing import TypeAlias
@@ -242,6 +244,57 @@ class TwistedEdwardsCurve(WeierstrassCurve):
         )
         return (x, y)
 
+    def to_weierstrass_batch(
+        self, points_twisted: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """
+        Batch version of to_weierstrass. All the denominators share a single modular inversion.
+        """
+        a = self.a_twisted
+        d = self.d_twisted
+        p = self.p
+        denominators = []
+        for x_twisted, y_twisted in points_twisted:
+            denominators.append(12 - 12 * y_twisted)
+            denominators.append(4 * x_twisted - 4 * x_twisted * y_twisted)
+        inverses = batch_inverse(denominators, p)
+        return [
+            (
+                (5 * a + a * y_twisted - 5 * d * y_twisted - d) * inverses[2 * i] % p,
+                (a + a * y_twisted - d * y_twisted - d) * inverses[2 * i + 1] % p,
+            )
+            for i, (x_twisted, y_twisted) in enumerate(points_twisted)
+        ]
+
+    def to_twistededwards_batch(
+        self, points_weierstrass: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """
+        Batch version of to_twistededwards. All the denominators share a single modular inversion.
+        """
+        a = self.a_twisted
+        d = self.d_twisted
+        p = self.p
+        # With y = n / m, the x coordinate of to_twistededwards is
+        # (a - d)(1 + y) / (4 y_w (1 - y)) = (a - d)(m + n) / (4 y_w (m - n)),
+        # so both denominators are known before any inversion.
+        numerators = []
+        denominators = []
+        for x_weirstrass, y_weirstrass in points_weierstrass:
+            n = (5 * a - 12 * x_weirstrass - d) % p
+            m = (-12 * x_weirstrass - a + 5 * d) % p
+            numerators.append(n)
+            denominators.append(m)
+            denominators.append(4 * y_weirstrass * (m - n))
+        inverses = batch_inverse(denominators, p)
+        return [
+            (
+                (a - d) * (m + n) * inverses[2 * i + 1] % p,
+                n * inverses[2 * i] % p,
+            )
+            for i, (n, m) in enumerate(zip(numerators, denominators[::2]))
+        ]
+
 
 @dataclass(slots=True, frozen=True)
 class PairingCurve(WeierstrassCurve):
@@ -454,6 +507,81 @@ CURVES: dict[int, WeierstrassCurve] = {
     ),
 }
 
+# Endomorphisms used for fast subgroup membership tests, see
+# - M. Scott, "A note on group membership tests for G1, G2 and GT on BLS pairing-friendly curves", 2021.
+# - El Housni, Guillevic, Piellard, "Co-factor clearing and subgroup membership testing on pairing-friendly curves", 2022, §4.3.
+
+# σ(x, y) = (β·x, y) with β a primitive cube root of unity in Fp.
+# P ∈ G1 <=> σ(P) = [-x²]P
+G1_SIGMA_BETA: dict[int, int] = {
+    BLS12_381_ID: 0x5F19672FDF76CE51BA69C6076A0F77EADDB3A93BE6F89688DE17D813620A00022E01FFFFFFFEFFFE,
+}
+
+# ψ(x, y) = (ψx·conj(x), ψy·conj(y)), the untwist-Frobenius-twist endomorphism of the twist.
+# BN254 (D-type twist): ψx = ξ^((p-1)/3), ψy = ξ^((p-1)/2).
+# BLS12-381 (M-type twist): ψx = 1/ξ^((p-1)/3), ψy = 1/ξ^((p-1)/2).
+G2_PSI_COEFFS: dict[int, tuple[tuple[int, int], tuple[int, int]]] = {
+    BN254_ID: (
+        (
+            0x2FB347984F7911F74C0BEC3CF559B143B78CC310C2C3330C99E39557176F553D,
+            0x16C9E55061EBAE204BA4CC8BD75A079432AE2A1D0B7C9DCE1665D51C640FCBA2,
+        ),
+        (
+            0x63CF305489AF5DCDC5EC698B6E2F9B9DBAAE0EDA9C95998DC54014671A0135A,
+            0x7C03CBCAC41049A0704B5A7EC796F2B21807DC98FA25BD282D37F632623B0E3,
+        ),
+    ),
+    BLS12_381_ID: (
+        (
+            0x0,
+            0x1A0111EA397FE699EC02408663D4DE85AA0D857D89759AD4897D29650FB85F9B409427EB4F49FFFD8BFD00000000AAAD,
+        ),
+        (
+            0x135203E60180A68EE2E9C448D77A2CD91C3DEDD930B1CF60EF396489F61EB45E304466CF3E67FA0AF1EE7B04121BDEA2,
+            0x6AF0E0437FF400B6831E36D6BD17FFE48395DABC2D3435E77F76E17009241C5EE67992F72EC05F4C81084FBEDE3CC09,
+        ),
+    ),
+}
+
+# ψ acts as [p] = [t - 1] on G2, and P ∈ G2 <=> ψ(P) = [t - 1]P
+# with t - 1 = 6x² for BN curves and t - 1 = x for BLS12 curves.
+G2_PSI_EIGENVALUE: dict[int, int] = {
+    BN254_ID: 6 * CURVES[BN254_ID].x ** 2,
+    BLS12_381_ID: CURVES[BLS12_381_ID].x,
+}
+
+# Smallest prime factor of the G2 cofactor #E'(Fp2) / n, used by batch_is_in_prime_order_subgroup.
+# BN254: 10069 · 5864401 · p222, BLS12-381: 13² · 23² · 2713 · 11953 · 262069 · p446.
+G2_COFACTOR_SMALLEST_PRIME: dict[int, int] = {
+    BN254_ID: 10069,
+    BLS12_381_ID: 13,
+}
+DEFAULT_BATCH_SUBGROUP_CHECK_SOUNDNESS_BITS = 64
+
+
+def batch_inverse(values: list[int], p: int) -> list[int]:
+    """
+    Inverts all the values modulo p with a single modular inversion (Montgomery's trick).
+
+    Raises:
+    ValueError: If one of the values is not invertible modulo p.
+    """
+    prefix_products = []
+    acc = 1
+    for v in values:
+        prefix_products.append(acc)
+        acc = acc * v % p
+    try:
+        acc_inv = pow(acc, -1, p)
+    except ValueError:
+        zero_index = next(i for i, v in enumerate(values) if v % p == 0)
+        raise ValueError(f"Value at index {zero_index} is not invertible modulo p")
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = acc_inv * prefix_products[i] % p
+        acc_inv = acc_inv * values[i] % p
+    return inverses
+
 
 def is_generator(g: int, p: int) -> bool:
     """
@@ -534,28 +662,131 @@ def get_base_field(
     Raises:
     ValueError: If the field_type is invalid.
     """
-    if isinstance(curve_id, CurveID):
-        curve_id = curve_id.value
-
-    curve = CURVES[curve_id]
+    context = get_curve_context(curve_id)
     if field_type == PyFelt:
-        return BaseField(curve.p)
+        return context.base_field
     elif field_type == Fp2:
-        assert isinstance(curve, PairingCurve)
-        return BaseFp2Field(curve.p)
+        return context.base_fp2_field
     else:
         raise ValueError(f"Invalid field type: {field_type}. Expected PyFelt or Fp2.")
 
 
 def get_irreducible_poly(curve_id: int | CurveID, extension_degree: int) -> Polynomial:
+    return get_curve_context(curve_id).irreducible_poly(extension_degree)
+
+
+class CurveContext:
+    """
+    Constants and derived values of a curve, computed once on first access.
+    Use get_curve_context to get the shared instance of a curve. The returned objects are
+    shared between callers and must not be mutated.
+
+    Attributes:
+        curve_id (int): The identifier of the elliptic curve.
+        curve (WeierstrassCurve): The curve parameters, CURVES[curve_id].
+        base_field (BaseField): The base field Fp of the curve.
+    """
+
+    def __init__(self, curve_id: int):
+        self.curve_id = curve_id
+        self.curve = CURVES[curve_id]
+        self.base_field = BaseField(self.curve.p)
+        self._irreducible_polys: dict[int, Polynomial] = {}
+        self._frobenius_maps: dict[tuple[int, int], list[list[tuple[int, int]]]] = {}
+
+    @functools.cached_property
+    def base_fp2_field(self) -> BaseFp2Field:
+        assert isinstance(self.curve, PairingCurve)
+        return BaseFp2Field(self.curve.p)
+
+    @functools.cached_property
+    def non_residue(self) -> "E2":
+        """
+        The non-residue of Fp2 used to build the Fp6 tower.
+        """
+        from garaga.hints.tower_backup import E2  # avoids cycle
+
+        assert isinstance(self.curve, PairingCurve)
+        return E2(self.curve.nr_a0, self.curve.nr_a1, self.curve.p)
+
+    def irreducible_poly(self, extension_degree: int) -> Polynomial:
+        poly = self._irreducible_polys.get(extension_degree)
+        if poly is None:
+            assert isinstance(self.curve, PairingCurve)
+            field = self.base_field
+            poly = Polynomial(
+                coefficients=[
+                    field(x) for x in self.curve.irreducible_polys[extension_degree]
+                ]
+            )
+            self._irreducible_polys[extension_degree] = poly
+        return poly
+
+    @functools.cached_property
+    def line_line_sparsity(self) -> tuple[int, ...]:
+        """
+        Sparsity of the product of two line functions in Fp12, see precompute_lineline_sparsity.
+        """
+        assert isinstance(self.curve, PairingCurve)
+        field = self.base_field
+        line = Polynomial([field(x) for x in self.curve.line_function_sparsity])
+        ll = line * line % self.irreducible_poly(12)
+        return tuple(get_sparsity(ll.coefficients)[0:12])
+
+    def frobenius_maps(
+        self, extension_degree: int, frob_power: int
+    ) -> list[list[tuple[int, int]]]:
+        """
+        The constants of the Frobenius map x -> x^(p^frob_power) in the direct extension, see
+        garaga.hints.frobenius.generate_frobenius_maps.
+        """
+        key = (extension_degree, frob_power)
+        maps = self._frobenius_maps.get(key)
+        if maps is None:
+            from garaga.hints.frobenius import generate_frobenius_maps  # avoids cycle
+
+            _, maps = generate_frobenius_maps(
+                self.curve_id, extension_degree, frob_power
+            )
+            self._frobenius_maps[key] = maps
+        return maps
+
+    @functools.cached_property
+    def swu_params(self) -> tuple[PyFelt, PyFelt, PyFelt]:
+        """
+        The (A, B, Z) constants of the simplified SWU map, as base field elements.
+        """
+        swu_params = self.curve.swu_params
+        if swu_params is None:
+            raise NotImplementedError(f"SWU map for curve {self.curve_id} is not set")
+        field = self.base_field
+        return field(swu_params.A), field(swu_params.B), field(swu_params.Z)
+
+    @functools.cached_property
+    def isogeny_to_g1_map(self) -> tuple["RationalFunction", "RationalFunction"]:
+        from garaga.signature import get_isogeny_to_g1_map  # avoids cycle
+
+        return get_isogeny_to_g1_map(CurveID(self.curve_id))
+
+    @functools.cached_property
+    def isogeny_to_g2_map(self) -> tuple["RationalFunction", "RationalFunction"]:
+        from garaga.signature import get_isogeny_to_g2_map  # avoids cycle
+
+        return get_isogeny_to_g2_map(CurveID(self.curve_id))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_curve_context(curve_id: int) -> CurveContext:
+    return CurveContext(curve_id)
+
+
+def get_curve_context(curve_id: int | CurveID) -> CurveContext:
+    """
+    Returns the memoised CurveContext of a curve.
+    """
     if isinstance(curve_id, CurveID):
         curve_id = curve_id.value
-    curve = CURVES[curve_id]
-    assert isinstance(curve, PairingCurve)
-    field = get_base_field(curve_id)
-    return Polynomial(
-        coefficients=[field(x) for x in curve.irreducible_polys[extension_degree]]
-    )
+    return _get_curve_context(curve_id)
 
 
 @dataclass(slots=True)
@@ -679,14 +910,33 @@ class G1Point:
                 if not tentative_point.is_in_prime_order_subgroup():
                     return tentative_point
 
-    def is_in_prime_order_subgroup(self) -> bool:
+    def is_in_prime_order_subgroup(self, use_endomorphism: bool = True) -> bool:
         """
         Checks if the point is in the prime order subgroup.
+        Unless use_endomorphism is False, avoids the scalar multiplication by the group order when possible:
+        - if the cofactor is 1, any point on the curve is in the subgroup,
+        - on BLS12-381, checks σ(P) = [-x²]P (see G1_SIGMA_BETA).
+
+        Args:
+            use_endomorphism (bool): Whether to use the fast checks (default is True).
 
         Returns:
             bool: True if the point is in the prime order subgroup, False otherwise.
         """
-        return self.scalar_mul(CURVES[self.curve_id.value].n).is_infinity()
+        if self.is_infinity():
+            return True
+        curve = CURVES[self.curve_id.value]
+        if use_endomorphism and not self.iso_point:
+            if curve.h == 1:
+                return self.is_on_curve()
+            if self.curve_id.value in G1_SIGMA_BETA:
+                # σ(P) = [-x²]P <=> (β·x, -y) = [x²]P
+                x2P = self.scalar_mul(curve.x**2)
+                return (
+                    G1_SIGMA_BETA[self.curve_id.value] * self.x % curve.p == x2P.x
+                    and -self.y % curve.p == x2P.y
+                )
+        return self.scalar_mul(curve.n).is_infinity()
 
     def is_on_curve(self) -> bool:
         """
@@ -726,6 +976,7 @@ class G1Point:
     def get_nG(curve_id: CurveID, n: int) -> "G1Point":
         """
         Returns the scalar multiplication of the generator point on a given curve by the scalar n.
+        Uses a lazily built fixed-base table of the generator (see garaga.fixed_base).
 
         Args:
             curve_id (CurveID): The identifier of the elliptic curve.
@@ -737,12 +988,14 @@ class G1Point:
         Raises:
             AssertionError: If n is not less than the order of the curve.
         """
+        from garaga.fixed_base import get_fixed_base_table  # avoids cycle
+
         assert (
             n < CURVES[curve_id.value].n
         ), "n must be less than the order of the curve"
 
-        gen = G1Point(CURVES[curve_id.value].Gx, CURVES[curve_id.value].Gy, curve_id)
-        return gen.scalar_mul(n)
+        x, y = get_fixed_base_table(curve_id.value).mul(n)
+        return G1Point(x, y, curve_id)
 
     @staticmethod
     def msm(points: list["G1Point"], scalars: list[int]) -> "G1Point":
@@ -870,6 +1123,93 @@ class G1Point:
         )
 
 
+# Size in bytes of an integer in a packed buffer: N_LIMBS 96-bit limbs.
+PACKED_INT_BYTES = N_LIMBS * 96 // 8
+
+
+def pack_ints_le(values: list[int]) -> bytes:
+    """
+    Packs non-negative integers < 2^384 into a contiguous buffer of PACKED_INT_BYTES little-endian
+    bytes each. garaga_rs accepts such a buffer wherever it expects a flattened list of coordinates.
+    """
+    return b"".join(v.to_bytes(PACKED_INT_BYTES, "little") for v in values)
+
+
+def unpack_ints_le(buffer: bytes | bytearray | memoryview) -> list[int]:
+    """
+    Inverse of pack_ints_le.
+    """
+    buffer = memoryview(buffer)
+    return [
+        int.from_bytes(buffer[i : i + PACKED_INT_BYTES], "little")
+        for i in range(0, len(buffer), PACKED_INT_BYTES)
+    ]
+
+
+@dataclass(slots=True)
+class G1PointBatch:
+    """
+    A batch of G1 points stored as packed coordinates x0, y0, x1, y1, ... in a contiguous
+    little-endian buffer (see pack_ints_le).
+    The buffer is handed to garaga_rs through the buffer protocol, so points kept in a batch
+    are not converted to Python ints on every call. The point at infinity is stored as (0, 0).
+
+    Attributes:
+        curve_id (CurveID): The identifier of the elliptic curve.
+        buffer (bytes | bytearray | memoryview): The packed coordinates.
+    """
+
+    curve_id: CurveID
+    buffer: bytes | bytearray | memoryview
+
+    def __post_init__(self):
+        if len(memoryview(self.buffer)) % (2 * PACKED_INT_BYTES) != 0:
+            raise ValueError(
+                f"Buffer length must be a multiple of {2 * PACKED_INT_BYTES} bytes"
+            )
+
+    @staticmethod
+    def from_points(
+        points: list[G1Point], curve_id: CurveID | None = None
+    ) -> "G1PointBatch":
+        if curve_id is None:
+            if len(points) == 0:
+                raise ValueError("Unspecified curve")
+            curve_id = points[0].curve_id
+        if any(point.curve_id != curve_id for point in points):
+            raise ValueError("Points are not on the same curve")
+        return G1PointBatch(
+            curve_id, pack_ints_le([v for point in points for v in (point.x, point.y)])
+        )
+
+    def __len__(self) -> int:
+        return len(memoryview(self.buffer)) // (2 * PACKED_INT_BYTES)
+
+    def __getitem__(self, index: int) -> G1Point:
+        if not -len(self) <= index < len(self):
+            raise IndexError("G1PointBatch index out of range")
+        index %= len(self)
+        x, y = unpack_ints_le(
+            memoryview(self.buffer)[
+                2 * index * PACKED_INT_BYTES : 2 * (index + 1) * PACKED_INT_BYTES
+            ]
+        )
+        return G1Point(x, y, self.curve_id)
+
+    def coordinates(self) -> list[int]:
+        """
+        Returns the flattened list of coordinates [x0, y0, x1, y1, ...].
+        """
+        return unpack_ints_le(self.buffer)
+
+    def to_points(self) -> list[G1Point]:
+        coordinates = self.coordinates()
+        return [
+            G1Point(coordinates[i], coordinates[i + 1], self.curve_id)
+            for i in range(0, len(coordinates), 2)
+        ]
+
+
 @dataclass(frozen=True)
 class G2Point:
     """
@@ -921,6 +1261,53 @@ class G2Point:
         x = E2(*self.x, p)
         return y**2 == x**3 + a * x + b
 
+    def psi(self) -> "G2Point":
+        """
+        Applies the endomorphism ψ = untwist ∘ Frobenius ∘ twist (see G2_PSI_COEFFS).
+        """
+        from garaga.hints.tower_backup import E2
+
+        if self.is_infinity():
+            return self
+        p = CURVES[self.curve_id.value].p
+        psi_x, psi_y = G2_PSI_COEFFS[self.curve_id.value]
+        x = E2(*self.x, p).conjugate() * E2(*psi_x, p)
+        y = E2(*self.y, p).conjugate() * E2(*psi_y, p)
+        return G2Point((x.a0, x.a1), (y.a0, y.a1), self.curve_id)
+
+    def is_in_prime_order_subgroup(self, use_endomorphism: bool = True) -> bool:
+        """
+        Checks if the point is in the prime order subgroup.
+        Arithmetic is done in Python since garaga_rs only accepts points of the subgroup.
+
+        Args:
+            use_endomorphism (bool): Check ψ(P) = [t - 1]P (see G2_PSI_EIGENVALUE),
+                instead of [n]P = O (default is True).
+
+        Returns:
+            bool: True if the point is in the prime order subgroup, False otherwise.
+        """
+        from garaga.hints.tower_backup import E2
+
+        if self.is_infinity():
+            return True
+        curve = CURVES[self.curve_id.value]
+        p = curve.p
+        if not use_endomorphism:
+            _, _, Z = _g2_jacobian_mul(self, curve.n)
+            return Z == E2.zero(p)
+
+        k = G2_PSI_EIGENVALUE[self.curve_id.value]
+        X, Y, Z = _g2_jacobian_mul(self, abs(k))
+        if Z == E2.zero(p):
+            return False
+        if k < 0:
+            Y = -Y
+        psi = self.psi()
+        ZZ = Z * Z
+        # Affine (x, y) equals Jacobian (X, Y, Z) iff X = x·Z² and Y = y·Z³
+        return X == E2(*psi.x, p) * ZZ and Y == E2(*psi.y, p) * ZZ * Z
+
     @staticmethod
     def gen_random_point(curve_id: CurveID) -> "G2Point":
         """
@@ -929,23 +1316,38 @@ class G2Point:
         curve = CURVES[curve_id.value]
         assert isinstance(curve, PairingCurve)
         scalar = random.randint(1, curve.n - 1)
-        a = (curve.G2x[0], curve.G2x[1], curve.G2y[0], curve.G2y[1])
-        b = garaga_rs.g2_scalar_mul(curve_id.value, a, scalar)
-        return G2Point((b[0], b[1]), (b[2], b[3]), curve_id)
+        return G2Point.get_nG(curve_id, scalar)
+
+    @staticmethod
+    def gen_random_point_not_in_subgroup(curve_id: CurveID) -> "G2Point":
+        """
+        Generates a random point on the twist that is not in the prime order subgroup.
+        """
+        curve = CURVES[curve_id.value]
+        assert isinstance(curve, PairingCurve)
+        field = get_base_field(curve_id, Fp2)
+        b = field((curve.b20, curve.b21))
+        while True:
+            x = field.random()
+            y2 = x * x * x + x * curve.a + b
+            if not y2.is_quad_residue():
+                continue
+            point = G2Point(x.value, y2.sqrt().value, curve_id)
+            if not point.is_in_prime_order_subgroup(use_endomorphism=False):
+                return point
 
     @staticmethod
     def get_nG(curve_id: CurveID, n: int) -> "G2Point":
         """
         Returns the scalar multiplication of the generator point on a given curve by the scalar n.
+        Uses the fixed-base generator tables of garaga_rs, built on first use.
         """
         assert (
             n < CURVES[curve_id.value].n
         ), "n must be less than the order of the curve"
 
         if curve_id.value in GARAGA_RS_SUPPORTED_CURVES:
-            curve = CURVES[curve_id.value]
-            a = (curve.G2x[0], curve.G2x[1], curve.G2y[0], curve.G2y[1])
-            b = garaga_rs.g2_scalar_mul(curve_id.value, a, n)
+            b = garaga_rs.g2_generator_mul(curve_id.value, n % CURVES[curve_id.value].n)
             return G2Point((b[0], b[1]), (b[2], b[3]), curve_id)
         else:
             raise NotImplementedError(
@@ -991,8 +1393,29 @@ class G2Point:
 
     @staticmethod
     def msm(points: list["G2Point"], scalars: list[int]) -> "G2Point":
+        """
+        Computes Σ scalars[i] * points[i].
+        On curves supported by garaga_rs, the whole MSM is done in a single call (Pippenger).
+        """
         assert all(isinstance(p, G2Point) for p in points)
         assert len(points) == len(scalars)
+        assert len(points) > 0, "points must not be empty"
+        curve_id = points[0].curve_id
+        if curve_id.value in GARAGA_RS_SUPPORTED_CURVES:
+            if any(p.curve_id != curve_id for p in points):
+                raise ValueError("Points are not on the same curve")
+            n = CURVES[curve_id.value].n
+            args = []
+            ks = []
+            for P, s in zip(points, scalars):
+                if P.is_infinity():
+                    continue
+                args.extend((P.x[0], P.x[1], P.y[0], P.y[1]))
+                ks.append(s % n)
+            if not ks:
+                return G2Point((0, 0), (0, 0), curve_id)
+            c = garaga_rs.g2_msm(curve_id.value, args, ks)
+            return G2Point((c[0], c[1]), (c[2], c[3]), curve_id)
         muls = [P.scalar_mul(s) for P, s in zip(points, scalars)]
         scalar_mul = functools.reduce(lambda acc, p: acc.add(p), muls)
         return scalar_mul
@@ -1009,6 +1432,218 @@ class G2Point:
         )
 
 
+def _g2_jacobian_double(X, Y, Z):
+    # dbl-2009-l, a = 0
+    A = X * X
+    B = Y * Y
+    C = B * B
+    D = (X + B) * (X + B) - A - C
+    D = D + D
+    E = A + A + A
+    X3 = E * E - D - D
+    Y3 = E * (D - X3) - C * 8
+    Z3 = Y * Z * 2
+    return X3, Y3, Z3
+
+
+def _g2_jacobian_add_affine(X, Y, Z, x, y):
+    # madd-2007-bl
+    zero = Z.zero(Z.p)
+    if Z == zero:
+        return x, y, Z.one(Z.p)
+    ZZ = Z * Z
+    H = x * ZZ - X
+    r = (y * Z * ZZ - Y) * 2
+    if H == zero:
+        if r == zero:
+            return _g2_jacobian_double(x, y, Z.one(Z.p))
+        return Z.one(Z.p), Z.one(Z.p), zero
+    HH = H * H
+    I = HH * 4
+    J = H * I
+    V = X * I
+    X3 = r * r - J - V - V
+    Y3 = r * (V - X3) - Y * J * 2
+    Z3 = (Z + H) * (Z + H) - ZZ - HH
+    return X3, Y3, Z3
+
+
+def _g2_jacobian_mul(point: "G2Point", k: int):
+    """
+    Left-to-right double-and-add of a G2 point, in Python and Jacobian coordinates.
+    Unlike garaga_rs, accepts points outside of the prime order subgroup.
+    Returns (X, Y, Z) as E2 elements, Z = 0 for the point at infinity.
+    """
+    from garaga.hints.tower_backup import E2
+
+    p = CURVES[point.curve_id.value].p
+    x, y = E2(*point.x, p), E2(*point.y, p)
+    X, Y, Z = E2.one(p), E2.one(p), E2.zero(p)
+    for bit in bin(k)[2:]:
+        X, Y, Z = _g2_jacobian_double(X, Y, Z)
+        if bit == "1":
+            X, Y, Z = _g2_jacobian_add_affine(X, Y, Z, x, y)
+    return X, Y, Z
+
+
+def _smallest_prime_factor(n: int) -> int:
+    i = 2
+    while i * i <= n:
+        if n % i == 0:
+            return i
+        i += 1
+    return n
+
+
+def _g2_jacobian_add(X1, Y1, Z1, X2, Y2, Z2):
+    # add-2007-bl
+    zero = Z1.zero(Z1.p)
+    if Z1 == zero:
+        return X2, Y2, Z2
+    if Z2 == zero:
+        return X1, Y1, Z1
+    Z1Z1 = Z1 * Z1
+    Z2Z2 = Z2 * Z2
+    U1 = X1 * Z2Z2
+    S1 = Y1 * Z2 * Z2Z2
+    H = X2 * Z1Z1 - U1
+    r = (Y2 * Z1 * Z1Z1 - S1) * 2
+    if H == zero:
+        if r == zero:
+            return _g2_jacobian_double(X1, Y1, Z1)
+        return Z1.one(Z1.p), Z1.one(Z1.p), zero
+    I = (H + H) * (H + H)
+    J = H * I
+    V = U1 * I
+    X3 = r * r - J - V - V
+    Y3 = r * (V - X3) - S1 * J * 2
+    Z3 = ((Z1 + Z2) * (Z1 + Z2) - Z1Z1 - Z2Z2) * H
+    return X3, Y3, Z3
+
+
+def _batch_subgroup_check_params(
+    smallest_cofactor_prime: int, soundness_bits: int, n_points: int
+) -> tuple[int, int]:
+    """
+    Returns (scalar_bits, rounds) for batch_is_in_prime_order_subgroup.
+    In one round, a point with a non-zero component of order divisible by a prime q is missed
+    with probability at most 1/q + 2^-scalar_bits, over the choice of its random scalar.
+    A round costs about n_points + 2^(scalar_bits + 1) additions (bucket method), the
+    scalar size minimising the total cost is chosen.
+    """
+    q = smallest_cofactor_prime
+    best = None
+    for scalar_bits in range(1, q.bit_length() + 8):
+        error = 1 / q + 2**-scalar_bits
+        if error >= 1:
+            continue
+        rounds = math.ceil(soundness_bits / -math.log2(error))
+        cost = rounds * (n_points + 2 ** (scalar_bits + 1))
+        if best is None or cost < best[0]:
+            best = (cost, scalar_bits, rounds)
+    return best[1], best[2]
+
+
+def _g1_linear_combination(points: list[G1Point], scalars: list[int]) -> G1Point:
+    # Bucket method with the fastecdsa C binding, which handles doubling and the
+    # point at infinity (0, 0), and accepts points outside of the prime order subgroup.
+    curve = CURVES[points[0].curve_id.value]
+    params = tuple(
+        str(v) for v in (curve.p, curve.a, curve.b, curve.n, curve.Gx, curve.Gy)
+    )
+    buckets = [("0", "0")] * (max(scalars) + 1)
+    for P, k in zip(points, scalars):
+        if k:
+            buckets[k] = curvemath.add(*buckets[k], str(P.x), str(P.y), *params)
+    # Σ k·B_k = Σ_j Σ_{k >= j} B_k
+    running, total = ("0", "0"), ("0", "0")
+    for bucket in reversed(buckets[1:]):
+        running = curvemath.add(*running, *bucket, *params)
+        total = curvemath.add(*total, *running, *params)
+    return G1Point(int(total[0]), int(total[1]), points[0].curve_id)
+
+
+def _g2_linear_combination(points: list["G2Point"], scalars: list[int]) -> "G2Point":
+    # Bucket method in Python and Jacobian coordinates, see _g1_linear_combination.
+    from garaga.hints.tower_backup import E2
+
+    curve_id = points[0].curve_id
+    p = CURVES[curve_id.value].p
+    infinity = (E2.one(p), E2.one(p), E2.zero(p))
+    buckets = [infinity] * (max(scalars) + 1)
+    for P, k in zip(points, scalars):
+        if k:
+            buckets[k] = _g2_jacobian_add_affine(*buckets[k], E2(*P.x, p), E2(*P.y, p))
+    running, total = infinity, infinity
+    for bucket in reversed(buckets[1:]):
+        running = _g2_jacobian_add(*running, *bucket)
+        total = _g2_jacobian_add(*total, *running)
+    X, Y, Z = total
+    if Z == E2.zero(p):
+        return G2Point.infinity(curve_id)
+    z_inv = Z.__inv__()
+    z_inv2 = z_inv * z_inv
+    x, y = X * z_inv2, Y * z_inv2 * z_inv
+    return G2Point((x.a0, x.a1), (y.a0, y.a1), curve_id)
+
+
+def batch_is_in_prime_order_subgroup(
+    points: list[G1Point] | list["G2Point"],
+    soundness_bits: int = DEFAULT_BATCH_SUBGROUP_CHECK_SOUNDNESS_BITS,
+) -> list[bool]:
+    """
+    Checks if each point is in the prime order subgroup, checking random linear combinations
+    S = Σ r_i·P_i of the whole batch instead of each point.
+    The points are on the curve (G1Point and G2Point check it on construction).
+
+    The scalars r_i are small and drawn with the secrets module. The number of rounds depends
+    on the smallest prime factor q of the cofactor, since a component of order q goes unnoticed
+    whenever q | r_i. If every S is in the subgroup, all points are accepted. A batch that
+    contains a point outside of the subgroup passes with probability at most 2^-soundness_bits.
+    As soon as a round fails, each point is checked individually.
+
+    Args:
+        points (list[G1Point] | list[G2Point]): Points of the same group and curve.
+        soundness_bits (int): The statistical soundness of the batch check.
+
+    Returns:
+        list[bool]: For each point, True if it is in the prime order subgroup.
+    """
+    if len(points) == 0:
+        return []
+    point_type = type(points[0])
+    curve_id = points[0].curve_id
+    if any(type(P) != point_type or P.curve_id != curve_id for P in points):
+        raise ValueError("Points are not in the same group")
+    points_not_inf = [P for P in points if not P.is_infinity()]
+    if len(points_not_inf) == 0:
+        return [True] * len(points)
+
+    curve = CURVES[curve_id.value]
+    if point_type == G1Point:
+        if any(P.iso_point for P in points):
+            raise ValueError("Iso points are not supported")
+        if curve.h == 1:
+            return [True] * len(points)
+        smallest_cofactor_prime = _smallest_prime_factor(curve.h)
+        linear_combination = _g1_linear_combination
+    else:
+        smallest_cofactor_prime = G2_COFACTOR_SMALLEST_PRIME[curve_id.value]
+        linear_combination = _g2_linear_combination
+
+    scalar_bits, rounds = _batch_subgroup_check_params(
+        smallest_cofactor_prime, soundness_bits, len(points_not_inf)
+    )
+    for _ in range(rounds):
+        scalars = [secrets.randbits(scalar_bits) for _ in points_not_inf]
+        if max(scalars) == 0:
+            continue
+        S = linear_combination(points_not_inf, scalars)
+        if not S.is_in_prime_order_subgroup():
+            return [P.is_in_prime_order_subgroup() for P in points]
+    return [True] * len(points)
+
+
 @dataclass(slots=True)
 class G1G2Pair:
     p: G1Point
@@ -1087,6 +1722,71 @@ class G1G2Pair:
                 "G1G2Pair.miller is not implemented for this curve"
             )
 
+    @staticmethod
+    def _flatten_for_batch(
+        batches: list[list["G1G2Pair"]], curve_id: CurveID | None
+    ) -> tuple[CurveID, list[list[int]]]:
+        if curve_id is None:
+            if len(batches) == 0 or len(batches[0]) == 0:
+                raise ValueError("Unspecified curve")
+            curve_id = batches[0][0].curve_id
+        args = []
+        for pairs in batches:
+            batch_args = []
+            for pair in pairs:
+                if pair.curve_id != curve_id:
+                    raise ValueError("Pairs are not on the same curve")
+                batch_args.extend(
+                    (
+                        pair.p.x,
+                        pair.p.y,
+                        pair.q.x[0],
+                        pair.q.x[1],
+                        pair.q.y[0],
+                        pair.q.y[1],
+                    )
+                )
+            args.append(batch_args)
+        return curve_id, args
+
+    @staticmethod
+    def pair_batch(
+        batches: list[list["G1G2Pair"]], curve_id: CurveID = None
+    ) -> list["E12"]:
+        """
+        Computes G1G2Pair.pair for many independent lists of pairs at once.
+        garaga_rs validates the points and computes the multi-pairings on all cores, without holding the GIL.
+        Raises ValueError if a point is not in its prime order subgroup.
+        """
+        from garaga.hints.tower_backup import E12  # avoids cycle
+
+        curve_id, args = G1G2Pair._flatten_for_batch(batches, curve_id)
+        if curve_id.value in GARAGA_RS_SUPPORTED_CURVES:
+            res = garaga_rs.multi_pairing_batch(curve_id.value, args)
+            return [E12(r, curve_id.value) for r in res]
+        else:
+            raise NotImplementedError(
+                "G1G2Pair.pair_batch is not implemented for this curve"
+            )
+
+    @staticmethod
+    def miller_batch(
+        batches: list[list["G1G2Pair"]], curve_id: CurveID = None
+    ) -> list["E12"]:
+        """
+        Computes G1G2Pair.miller for many independent lists of pairs at once. See pair_batch.
+        """
+        from garaga.hints.tower_backup import E12  # avoids cycle
+
+        curve_id, args = G1G2Pair._flatten_for_batch(batches, curve_id)
+        if curve_id.value in GARAGA_RS_SUPPORTED_CURVES:
+            res = garaga_rs.multi_miller_loop_batch(curve_id.value, args)
+            return [E12(r, curve_id.value) for r in res]
+        else:
+            raise NotImplementedError(
+                "G1G2Pair.miller_batch is not implemented for this curve"
+            )
+
 
 # v^6 - 18v^3 + 82
 # w^12 - 18w^6 + 82
@@ -1231,14 +1931,7 @@ def DT12(X: list[PyFelt], curve_id: int) -> list[PyFelt]:
 
 
 def precompute_lineline_sparsity(curve_id: int):
-    curve = CURVES[curve_id]
-    assert isinstance(curve, PairingCurve)
-    field = get_base_field(curve_id)
-    line_sparsity = curve.line_function_sparsity
-    line = Polynomial([field(x) for x in line_sparsity])
-    ll = line * line % get_irreducible_poly(curve_id, 12)
-    ll_sparsity = get_sparsity(ll.coefficients)
-    return ll_sparsity[0:12]
+    return list(get_curve_context(curve_id).line_line_sparsity)
 
 
 def replace_consecutive_zeros(lst):
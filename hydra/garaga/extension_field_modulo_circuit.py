@@ -1,11 +1,13 @@
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 from garaga.algebra import Polynomial, PyFelt
 from garaga.definitions import N_LIMBS, get_irreducible_poly
 from garaga.hints.extf_mul import (
     nondeterministic_extension_field_div,
-    nondeterministic_extension_field_mul_divmod,
+    nondeterministic_extension_field_mul_divmod_batch,
+    nondeterministic_extension_field_mul_rem,
 )
 from garaga.modulo_circuit import BATCH_SIZE, ModuloCircuitElement, WriteOps
 from garaga.poseidon_transcript import CairoPoseidonTranscript
@@ -13,6 +15,8 @@ from garaga.precompiled_circuits.fp2 import Fp2Circuits
 
 POSEIDON_BUILTIN_SIZE = 6
 POSEIDON_OUTPUT_S1_INDEX = 4
+# Degrees of the powers of z needed to evaluate the sparse line functions, per curve id.
+LINES_Z_POWERS_DEGREES = {0: (1, 2, 3, 6, 7, 9), 1: (1, 2, 3, 6, 8)}
 
 
 # Represents the state of the accumulation of the equation
@@ -34,7 +38,8 @@ class AccPolyInstructionType(Enum):
 @dataclass(slots=True)
 class AccumulatePolyInstructions:
     Pis: list[list[list[ModuloCircuitElement]]] = field(default_factory=list)
-    Qis: list[Polynomial] = field(default_factory=list)
+    # None until computed by ExtensionFieldModuloCircuit.compute_pending_quotients.
+    Qis: list[Polynomial | None] = field(default_factory=list)
     Ris: list[list[ModuloCircuitElement]] = field(default_factory=list)
     Ps_sparsities: list[None | list[list[int]]] = field(default_factory=list)
     r_sparsities: list[None | list[int]] = field(default_factory=list)
@@ -47,7 +52,7 @@ class AccumulatePolyInstructions:
         self,
         type: AccPolyInstructionType,
         Pis: list[list[ModuloCircuitElement]],
-        Q: Polynomial,
+        Q: Polynomial | None,
         R: list[ModuloCircuitElement],
         Ps_sparsities: None | list[list[int] | None] = None,
         r_sparsity: None | list[int] = None,
@@ -63,6 +68,41 @@ class AccumulatePolyInstructions:
         self.n += 1
 
 
+@lru_cache(maxsize=32)
+def z_powers_values(z: int, p: int, max_degree: int) -> tuple[int, ...]:
+    """
+    Returns (z, z^2, ..., z^max_degree) mod p. Cached, so that the hint values of the powers of
+    the same z are computed once for all the circuits of a verification.
+    """
+    powers = [z % p]
+    for _ in range(1, max_degree):
+        powers.append(powers[-1] * z % p)
+    return tuple(powers)
+
+
+def rlc_accumulate_quotients(
+    Qis: list[Polynomial], rlc_coeffs: list[ModuloCircuitElement], p: int
+) -> list[int]:
+    """
+    Returns the coefficients of Q = Σ(ci * Qi) mod p, without trailing zeros.
+    The sum is kept in integers and reduced once. Zero coefficients of the Qi, such as the ones
+    left by products of sparse lines, are skipped.
+    """
+    acc: list[int] = []
+    for Q, c in zip(Qis, rlc_coeffs):
+        c = c.value
+        coeffs = Q.coefficients
+        if len(coeffs) > len(acc):
+            acc.extend([0] * (len(coeffs) - len(acc)))
+        for j, q in enumerate(coeffs):
+            if q.value:
+                acc[j] += q.value * c
+    acc = [x % p for x in acc]
+    while acc and acc[-1] == 0:
+        acc.pop()
+    return acc
+
+
 class ExtensionFieldModuloCircuit(Fp2Circuits):
     def __init__(
         self,
@@ -138,6 +178,14 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
         ]
 
     def create_lines_z_powers(self, z: PyFelt):
+        # Reuse the powers imported with import_z_powers if they are all available.
+        degrees = LINES_Z_POWERS_DEGREES[self.curve_id]
+        cached = self.powers.get(z.offset, [])
+        if all(d <= len(cached) and cached[d - 1] is not None for d in degrees):
+            self.z_powers = [
+                cached[i] if i + 1 in degrees else None for i in range(degrees[-1])
+            ]
+            return
         powers = [z]
         if self.curve_id == 0:
             powers.append(self.square(z, "compute z^2"))  # z^2 at index 1
@@ -150,6 +198,7 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
             powers.append(
                 self.mul(powers[6], powers[1], "compute z^9")
             )  # z^9 at index 8
+            self.register_powers(z, powers)
             self.z_powers = powers
         elif self.curve_id == 1:
             # Need z^2, z^3, z^6, Z^8:
@@ -162,10 +211,32 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
             powers.append(
                 self.mul(powers[5], powers[1], "compute z^8")
             )  # z^8 at index 4
+            self.register_powers(z, powers)
             self.z_powers = powers
         else:
             raise ValueError(f"Invalid curve id: {self.curve_id}")
 
+    def import_z_powers(
+        self,
+        powers: list[PyFelt | ModuloCircuitElement | None],
+        write_source: WriteOps = WriteOps.INPUT,
+    ) -> list[ModuloCircuitElement | None]:
+        """
+        Uses the powers [z, z^2, ..., z^n] of z computed once for a chain of circuits, instead of
+        computing them again (None for the powers not needed).
+        PyFelt powers are written with write_source, as circuit inputs (WriteOps.INPUT) or as hint
+        values (WriteOps.WITNESS). ModuloCircuitElement powers must already be in the circuit.
+        Later calls to create_powers_of_Z and create_lines_z_powers with z reuse them.
+        """
+        assert powers and powers[0] is not None, "z must be imported"
+        powers = [
+            (self.write_element(p, write_source) if isinstance(p, PyFelt) else p)
+            for p in powers
+        ]
+        self.register_powers(powers[0], powers)
+        self.z_powers = powers
+        return powers
+
     def create_powers_of_Z(
         self,
         Z: PyFelt | ModuloCircuitElement,
@@ -182,17 +253,14 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
             pass
         else:
             raise ValueError(f"Invalid type for Z: {type(Z)}")
-        powers = [Z]
         if not mock:
-            for i in range(2, max_degree + 1):
-                powers.append(self.mul(powers[-1], powers[0], comment=f"Compute z^{i}"))
+            powers = self.get_powers(Z, max_degree, "z")
         else:
-            powers = powers + [
-                self.write_element(
-                    self.field(Z.value**i), write_source=WriteOps.WITNESS
-                )
-                for i in range(2, max_degree + 1)
+            powers = [Z] + [
+                self.write_element(self.field(x), write_source=WriteOps.WITNESS)
+                for x in z_powers_values(Z.value, self.field.p, max_degree)[1:]
             ]
+            self.register_powers(Z, powers)
         self.z_powers = powers
         return powers
 
@@ -303,7 +371,7 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
             Ps
         ), f"len(Ps_sparsities)={len(Ps_sparsities)} != len(Ps)={len(Ps)}"
 
-        Q, R = nondeterministic_extension_field_mul_divmod(
+        R = nondeterministic_extension_field_mul_rem(
             Ps, self.curve_id, extension_degree
         )
 
@@ -312,10 +380,11 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
         if not any(sparsity for sparsity in Ps_sparsities) or not r_sparsity:
             self.ops_counter["EXTF_MUL_DENSE"] += 1
 
+        # Q is computed with the other pending quotients.
         self.accumulate_poly_instructions[acc_index].append(
             AccPolyInstructionType.MUL,
             Ps,
-            Polynomial(Q),
+            None,
             R,
             Ps_sparsities,
             r_sparsity,
@@ -334,13 +403,9 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
         )
         x_over_y = self.write_elements(x_over_y, WriteOps.COMMIT)
 
-        Q, _ = nondeterministic_extension_field_mul_divmod(
-            [x_over_y, Y], self.curve_id, extension_degree
-        )
-        # R should be X
-        Q = Polynomial(Q)
+        # R should be X. Q is computed with the other pending quotients.
         self.accumulate_poly_instructions[acc_index].append(
-            AccPolyInstructionType.DIV, Pis=[x_over_y, Y], Q=Q, R=X
+            AccPolyInstructionType.DIV, Pis=[x_over_y, Y], Q=None, R=X
         )
         return x_over_y
 
@@ -361,20 +426,68 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
         )
         y_inv = self.write_elements(y_inv, WriteOps.COMMIT)
 
-        Q, _ = nondeterministic_extension_field_mul_divmod(
-            [y_inv, Y], self.curve_id, extension_degree
-        )
         # R should be One. Passed at mocked modulo circuits element since fully determined by its sparsity.
-        Q = Polynomial(Q)
+        # Q is computed with the other pending quotients.
         self.accumulate_poly_instructions[acc_index].append(
             AccPolyInstructionType.DIV,
             Pis=[y_inv, Y],
-            Q=Q,
+            Q=None,
             R=one,
             r_sparsity=[2] + [0] * (extension_degree - 1),
         )
         return y_inv
 
+    def compute_pending_quotients(
+        self,
+        acc_index: int = 0,
+        rlc_coeffs: list[PyFelt | ModuloCircuitElement] = None,
+    ) -> list[int] | None:
+        """
+        Computes in a single call to garaga_rs the quotients Qi of the accumulated products, which
+        extf_mul, extf_div and extf_inv leave pending since only their remainders are needed right
+        away.
+        If rlc_coeffs is given, also returns the coefficients of Q = Σ(ci * Qi) mod p for the first
+        len(rlc_coeffs) products, without trailing zeros (see rlc_accumulate_quotients).
+        """
+        instructions = self.accumulate_poly_instructions[acc_index]
+        rlc_coeffs = rlc_coeffs or []
+        pending = [i for i, Q in enumerate(instructions.Qis) if Q is None]
+        # The batched RLC applies to the first products of the batch.
+        with_coeff = [i for i in pending if i < len(rlc_coeffs)]
+        batch = with_coeff + [i for i in pending if i >= len(rlc_coeffs)]
+        big_Q = []
+        if batch:
+            extension_degree = len(instructions.Ris[batch[0]])
+            assert all(len(instructions.Ris[i]) == extension_degree for i in batch)
+            Qs, _, big_Q = nondeterministic_extension_field_mul_divmod_batch(
+                [instructions.Pis[i] for i in batch],
+                self.curve_id,
+                extension_degree,
+                [rlc_coeffs[i] for i in with_coeff],
+            )
+            for i, Q in zip(batch, Qs):
+                instructions.Qis[i] = Polynomial(Q)
+        if not rlc_coeffs:
+            return None
+        # Quotients computed before (square torus) are accumulated here.
+        known = [
+            i
+            for i in range(min(len(rlc_coeffs), instructions.n))
+            if i not in with_coeff
+        ]
+        known_Q = rlc_accumulate_quotients(
+            [instructions.Qis[i] for i in known],
+            [rlc_coeffs[i] for i in known],
+            self.field.p,
+        )
+        big_Q = [c.value for c in big_Q] if with_coeff else []
+        big_Q = big_Q + [0] * (len(known_Q) - len(big_Q))
+        for j, c in enumerate(known_Q):
+            big_Q[j] = (big_Q[j] + c) % self.field.p
+        while big_Q and big_Q[-1] == 0:
+            big_Q.pop()
+        return big_Q
+
     def conjugate_e12d(
         self, e12d: list[ModuloCircuitElement]
     ) -> list[ModuloCircuitElement]:
@@ -541,24 +654,22 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
         c0 = self.write_cairo_native_felt(self.field(self.transcript.s1))
         ##################################################################
         ################ Compute Qs ################
-        Qs = [Polynomial([self.field.zero()]) for _ in range(2)]
+        Qs = [[self.field.zero()] for _ in range(2)]
 
         for acc_index in acc_indexes:
-            self.accumulate_poly_instructions[acc_index].rlc_coeffs.append(c0)
-            # Computes Q = Σ(ci * Qi)
-            Qs[acc_index] = self.accumulate_poly_instructions[acc_index].Qis[0] * c0
-            for i in range(1, self.accumulate_poly_instructions[acc_index].n):
-                self.accumulate_poly_instructions[acc_index].rlc_coeffs.append(
-                    self.mul(
-                        self.accumulate_poly_instructions[acc_index].rlc_coeffs[i - 1],
-                        c0,
-                    )
+            instructions = self.accumulate_poly_instructions[acc_index]
+            instructions.rlc_coeffs.append(c0)
+            for i in range(1, instructions.n):
+                instructions.rlc_coeffs.append(
+                    self.mul(instructions.rlc_coeffs[i - 1], c0)
                 )
-                Qs[acc_index] += (
-                    self.accumulate_poly_instructions[acc_index].Qis[i]
-                    * self.accumulate_poly_instructions[acc_index].rlc_coeffs[i]
+            # Computes Q = Σ(ci * Qi)
+            Qs[acc_index] = [
+                self.field(c)
+                for c in self.compute_pending_quotients(
+                    acc_index, instructions.rlc_coeffs
                 )
-            Qs[acc_index] = Qs[acc_index].get_coeffs()
+            ] or [self.field.zero()]
             # Extend Q with zeros if needed to match the minimal expected degree.
             Qs[acc_index] = Qs[acc_index] + [self.field.zero()] * (
                 (acc_index + 1) * extension_degree - 1 - len(Qs[acc_index])
@@ -647,7 +758,6 @@ class ExtensionFieldModuloCircuit(Fp2Circuits):
             "RLC": self.accumulate_poly_instructions[0].n
             + self.accumulate_poly_instructions[1].n,
         }
-
         return summary
 
     def compile_circuit_cairo_zero(
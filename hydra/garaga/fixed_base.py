@@ -0,0 +1,122 @@
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from fastecdsa import curvemath
+
+from garaga.definitions import CURVES
+
+CACHE_DIR = "build/fixed_base_cache"
+DEFAULT_WINDOW_BITS = 8
+# When True, tables are loaded from / saved to CACHE_DIR instead of being rebuilt
+# in every process. Off by default: building a table takes ~0.1s per curve.
+PERSIST_TABLES = False
+
+
+def _curvemath_params(curve_id: int) -> tuple[str, ...]:
+    curve = CURVES[curve_id]
+    return (
+        str(curve.p),
+        str(curve.a),
+        str(curve.b),
+        str(curve.n),
+        str(curve.Gx),
+        str(curve.Gy),
+    )
+
+
+@dataclass(slots=True)
+class FixedBaseTable:
+    """
+    Windowed fixed-base table for the generator G of a curve.
+
+    table[i][d - 1] = d * 2^(window_bits * i) * G, so that for a scalar k with base 2^window_bits
+    digits k_i, k * G = Σ table[i][k_i - 1] (zero digits are skipped).
+    A multiplication costs ceil(log2(n) / window_bits) affine additions and no doublings.
+
+    Attributes:
+        curve_id (int): The identifier of the elliptic curve.
+        window_bits (int): The number of scalar bits consumed per table row.
+        table (list[list[tuple[int, int]]]): The affine multiples of G, row by row.
+    """
+
+    curve_id: int
+    window_bits: int
+    table: list[list[tuple[int, int]]]
+
+    def mul(self, scalar: int) -> tuple[int, int]:
+        """
+        Computes scalar * G. Returns (0, 0) for the point at infinity.
+        """
+        scalar = scalar % CURVES[self.curve_id].n
+        params = _curvemath_params(self.curve_id)
+        mask = (1 << self.window_bits) - 1
+        x, y = "0", "0"
+        i = 0
+        while scalar:
+            digit = scalar & mask
+            if digit:
+                px, py = self.table[i][digit - 1]
+                # Fastecdsa C binding. Handles doubling and the point at infinity.
+                x, y = curvemath.add(x, y, str(px), str(py), *params)
+            scalar >>= self.window_bits
+            i += 1
+        return int(x), int(y)
+
+
+def build_fixed_base_table(curve_id: int, window_bits: int) -> FixedBaseTable:
+    curve = CURVES[curve_id]
+    params = _curvemath_params(curve_id)
+    n_rows = -(-curve.n.bit_length() // window_bits)
+    base = (str(curve.Gx), str(curve.Gy))
+    table = []
+    for _ in range(n_rows):
+        row = [base]
+        for _ in range(2**window_bits - 2):
+            row.append(curvemath.add(*row[-1], *base, *params))
+        # 2^window_bits * base = (2^window_bits - 1) * base + base
+        base = curvemath.add(*row[-1], *base, *params)
+        table.append([(int(x), int(y)) for x, y in row])
+    return FixedBaseTable(curve_id, window_bits, table)
+
+
+def save_fixed_base_table(table: FixedBaseTable):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    filename = f"{CACHE_DIR}/fixed_base_{table.curve_id}_{table.window_bits}.json"
+    with open(filename, "w") as f:
+        json.dump([[[hex(x), hex(y)] for x, y in row] for row in table.table], f)
+
+
+def load_fixed_base_table(curve_id: int, window_bits: int) -> FixedBaseTable | None:
+    filename = f"{CACHE_DIR}/fixed_base_{curve_id}_{window_bits}.json"
+    if os.path.exists(filename):
+        with open(filename, "r") as f:
+            data = json.load(f)
+        return FixedBaseTable(
+            curve_id,
+            window_bits,
+            [[(int(x, 16), int(y, 16)) for x, y in row] for row in data],
+        )
+    return None
+
+
+@lru_cache(maxsize=32)
+def get_fixed_base_table(
+    curve_id: int, window_bits: int = DEFAULT_WINDOW_BITS
+) -> FixedBaseTable:
+    """
+    Returns the fixed-base table of the generator of the given curve, building it on first use.
+    If PERSIST_TABLES is set, the table is loaded from disk when available and saved after being built.
+    """
+    if PERSIST_TABLES:
+        table = load_fixed_base_table(curve_id, window_bits)
+        if table is not None:
+            return table
+
+    table = build_fixed_base_table(curve_id, window_bits)
+
+    if PERSIST_TABLES:
+        save_fixed_base_table(table)
+
+    return table
@@ -5,12 +5,21 @@ from dataclasses import dataclass
 
 from garaga import garaga_rs
 from garaga.algebra import Fp2, FunctionFelt, Polynomial, PyFelt, RationalFunction, T
-from garaga.definitions import CURVES, CurveID, G1Point, G2Point, get_base_field
+from garaga.definitions import (
+    CURVES,
+    STARK,
+    CurveID,
+    G1Point,
+    G1PointBatch,
+    G2Point,
+    get_base_field,
+)
 from garaga.hints.neg_3 import (
     construct_digit_vectors,
     neg_3_base_le,
     positive_negative_multiplicities,
 )
+from garaga.hints.verification import VerificationLevel
 from garaga.poseidon_transcript import hades_permutation
 
 
@@ -43,7 +52,7 @@ def get_ec_group_class_from_ec_point(P: G1Point | G2Point) -> type[G1Point | G2P
 
 
 def derive_ec_point_from_X(
-    x: PyFelt | int | Fp2, curve_id: CurveID
+    x: PyFelt | int | Fp2, curve_id: CurveID, use_rust: bool = True
 ) -> tuple[PyFelt, PyFelt, list[PyFelt]] | tuple[Fp2, Fp2, list[Fp2]]:
     """
     From a "random" x coordinate (in practice obtained via the Cairo Poseidon252 hash), finds via a
@@ -62,11 +71,17 @@ def derive_ec_point_from_X(
 
     This is used to verify the existence of the square roots in Cairo.
     See the derive_ec_point_from_X cairo function in ec_ops.cairo.
+
+    Base field x coordinates that fit in a felt252 are handled by garaga_rs if use_rust is True.
     """
     field = get_base_field(curve_id.value)
     if isinstance(x, int):
         x = field(x)
 
+    if use_rust and isinstance(x, PyFelt) and x.value < STARK:
+        (x, y), g_rhs_roots = garaga_rs.derive_ec_point_from_x(x.value, curve_id.value)
+        return field(x), field(y), [field(root) for root in g_rhs_roots]
+
     def rhs_compute(x: PyFelt | Fp2) -> PyFelt | Fp2:
         """
         Compute the right hand side of the Weirstrass equation.
@@ -118,11 +133,13 @@ def derive_ec_point_from_X(
 
 
 def zk_ecip_hint(
-    Bs: list[G1Point] | list[G2Point], scalars: list[int], use_rust: bool = True
+    Bs: list[G1Point] | list[G2Point] | G1PointBatch,
+    scalars: list[int],
+    use_rust: bool = True,
 ) -> tuple[G1Point | G2Point, FunctionFelt[T]]:
     """
     Inputs:
-    - Bs: list of points on the curve
+    - Bs: list of points on the curve, or a G1PointBatch (handed to garaga_rs without conversion)
     - scalars: list of scalars
     Returns:
     - Q: MSM of Bs by scalars contained in dss matrix
@@ -134,14 +151,22 @@ def zk_ecip_hint(
     """
     assert len(Bs) == len(scalars)
 
-    ec_group_class = get_ec_group_class_from_ec_point(Bs[0])
+    if isinstance(Bs, G1PointBatch):
+        if not use_rust:
+            Bs = Bs.to_points()
+        ec_group_class = G1Point
+    else:
+        ec_group_class = get_ec_group_class_from_ec_point(Bs[0])
     if ec_group_class == G1Point and use_rust:
-        pts = []
-        c_id = Bs[0].curve_id
-        for pt in Bs:
-            pts.extend([pt.x, pt.y])
-        field_type = get_field_type_from_ec_point(Bs[0])
-        field = get_base_field(c_id.value, field_type)
+        if isinstance(Bs, G1PointBatch):
+            pts = Bs.buffer
+            c_id = Bs.curve_id
+        else:
+            pts = []
+            c_id = Bs[0].curve_id
+            for pt in Bs:
+                pts.extend([pt.x, pt.y])
+        field = get_base_field(c_id.value, PyFelt)
 
         q, a_num, a_den, b_num, b_den = garaga_rs.zk_ecip_hint(
             pts, list(scalars), c_id.value
@@ -157,6 +182,32 @@ def zk_ecip_hint(
             RationalFunction(Polynomial(a_num), Polynomial(a_den)),
             RationalFunction(Polynomial(b_num), Polynomial(b_den)),
         )
+    elif ec_group_class == G2Point and use_rust:
+        c_id = Bs[0].curve_id
+        pts = []
+        for pt in Bs:
+            pts.extend([pt.x[0], pt.x[1], pt.y[0], pt.y[1]])
+        field = get_base_field(c_id.value, Fp2)
+
+        q, a_num, a_den, b_num, b_den = garaga_rs.zk_ecip_hint_g2(
+            pts, list(scalars), c_id.value
+        )
+
+        def to_fp2_coeffs(coeffs: list[int], default: Fp2) -> list[Fp2]:
+            return [
+                field((coeffs[i], coeffs[i + 1])) for i in range(0, len(coeffs), 2)
+            ] or [default]
+
+        a_num = to_fp2_coeffs(a_num, field.zero())
+        a_den = to_fp2_coeffs(a_den, field.one())
+        b_num = to_fp2_coeffs(b_num, field.zero())
+        b_den = to_fp2_coeffs(b_den, field.one())
+
+        Q = G2Point((q[0], q[1]), (q[2], q[3]), c_id)
+        sum_dlog = FunctionFelt(
+            RationalFunction(Polynomial(a_num), Polynomial(a_den)),
+            RationalFunction(Polynomial(b_num), Polynomial(b_den)),
+        )
     else:
         dss = construct_digit_vectors(scalars)
         Q, Ds = ecip_functions(Bs, dss)
@@ -175,12 +226,18 @@ def verify_ecip(
     sum_dlog: FunctionFelt[T] = None,
     A0: G1Point | G2Point = None,
     use_rust: bool = True,
+    verification_level: VerificationLevel | str = VerificationLevel.FULL,
 ) -> bool:
     """
     Verifies the zk-ecip hint.
     If Q, sum_dlog are not provided from a previous computation of the zk_ecip_hint, it will compute them.
     If the random point A0 is not provided for verifying the hint, a random one will be sampled.
+    With VerificationLevel.SAMPLED, only the check at the random point is done, without the final
+    msm. With VerificationLevel.OFF, nothing is checked.
     """
+    verification_level = VerificationLevel(verification_level)
+    if verification_level == VerificationLevel.OFF:
+        return True
     # Prover :
     if Q is None or sum_dlog is None:
         Q, sum_dlog = zk_ecip_hint(Bs, scalars, use_rust)
@@ -244,9 +301,10 @@ def verify_ecip(
     assert LHS == RHS, f"LHS: {LHS}, RHS: {RHS}"
 
     #########
-    assert Q == ec_group_class.msm(
-        Bs, scalars
-    )  # Sanity check. Not part of the verification.
+    if verification_level == VerificationLevel.FULL:
+        assert Q == ec_group_class.msm(
+            Bs, scalars
+        )  # Sanity check. Not part of the verification.
     ##########
     return True
 
@@ -690,7 +748,6 @@ def n_coeffs_from_n_points(n_points: int, batched: bool) -> tuple[int, int, int,
 if __name__ == "__main__":
     import random
 
-    from garaga.definitions import STARK
     from garaga.hints.io import int_array_to_u384_array, int_to_u384
 
     random.seed(0)
@@ -30,6 +30,74 @@ def nondeterministic_extension_field_mul_divmod(
     return (z_polyq_coeffs, z_polyr_coeffs)
 
 
+def nondeterministic_extension_field_mul_rem(
+    Ps: list[list[PyFelt | ModuloCircuitElement]],
+    curve_id: int,
+    extension_degree: int,
+) -> list[PyFelt]:
+    """
+    From a list of Polynomials Ps = [P1, ..., Pn]
+    Returns R(X) = Π(Pi)(X) mod P_irr(X), the result of the multiplication in the extension field,
+    without the quotient Q(X). Computed in Python, so that the quotients of all the products can
+    be computed later in a single call with nondeterministic_extension_field_mul_divmod_batch.
+    """
+    field = get_base_field(curve_id)
+    p = field.p
+    P_irr = get_irreducible_poly(curve_id, extension_degree)
+    # P_irr is monic and sparse: X^d = -Σ(c_k * X^k) mod P_irr.
+    reduction = [
+        (k, c.value)
+        for k, c in enumerate(P_irr.coefficients[:extension_degree])
+        if c.value != 0
+    ]
+
+    def reduce(coeffs: list[int]) -> list[int]:
+        for d in range(len(coeffs) - 1, extension_degree - 1, -1):
+            c = coeffs[d] % p
+            if c != 0:
+                for k, c_k in reduction:
+                    coeffs[d - extension_degree + k] -= c * c_k
+        coeffs = [x % p for x in coeffs[:extension_degree]]
+        return coeffs + [0] * (extension_degree - len(coeffs))
+
+    r = reduce([c.value for c in Ps[0]])
+    for P in Ps[1:]:
+        # Zero coefficients, such as the ones of sparse lines, are skipped.
+        terms = [(j, c.value) for j, c in enumerate(P) if c.value != 0]
+        prod = [0] * (len(r) + len(P) - 1)
+        for i, a in enumerate(r):
+            if a != 0:
+                for j, b in terms:
+                    prod[i + j] += a * b
+        r = reduce(prod)
+    return [field(c) for c in r]
+
+
+def nondeterministic_extension_field_mul_divmod_batch(
+    products: list[list[list[PyFelt | ModuloCircuitElement]]],
+    curve_id: int,
+    extension_degree: int,
+    rlc_coeffs: list[PyFelt | ModuloCircuitElement] = None,
+) -> tuple[list[list[PyFelt]], list[list[PyFelt]], list[PyFelt]]:
+    """
+    Batched version of nondeterministic_extension_field_mul_divmod, in a single call to garaga_rs.
+    Returns (Qs, Rs, big_Q) where (Qs[i], Rs[i]) is the result for products[i],
+    and big_Q(X) = Σ(c_i * Q_i(X)) for the coefficients c_i of rlc_coeffs,
+    applied to the first len(rlc_coeffs) products.
+    """
+    field = get_base_field(curve_id)
+    rlc_coeffs = rlc_coeffs or []
+    assert len(rlc_coeffs) <= len(
+        products
+    ), f"{len(rlc_coeffs)} rlc coefficients for {len(products)} products"
+    ps = [[[c.value for c in P] for P in Ps] for Ps in products]
+    qs, rs, big_q = garaga_rs.nondeterministic_extension_field_mul_divmod_batch(
+        curve_id, extension_degree, ps, [c.value for c in rlc_coeffs]
+    )
+    to_felts = lambda coeffs: [field(c) for c in coeffs] if coeffs else [field.zero()]
+    return ([to_felts(q) for q in qs], [to_felts(r) for r in rs], to_felts(big_q))
+
+
 def nondeterministic_square_torus(
     A: list[PyFelt | ModuloCircuitElement],
     curve_id: int,
@@ -42,6 +42,17 @@ def to_hex_str(value: str | int):
         raise TypeError(f"Expected str or int, got {type(value).__name__}")
 
 
+def _bigint_value(x: int | ModuloCircuitElement | PyFelt | bytes) -> int:
+    if isinstance(x, int):
+        return x
+    elif isinstance(x, (ModuloCircuitElement, PyFelt)):
+        return x.value
+    elif isinstance(x, bytes):
+        return int.from_bytes(x, byteorder="big")
+    else:
+        raise ValueError(f"Invalid type for bigint_split: {type(x)}")
+
+
 # Split a bigint into its limbs.
 # Accepts int, ModuloCircuitElement, PyFelt, or bytes.
 # Returns the limbs in little-endian order.
@@ -50,14 +61,13 @@ def to_hex_str(value: str | int):
 def bigint_split(
     x: int | ModuloCircuitElement | PyFelt | bytes, n_limbs: int = 4, base: int = 2**96
 ) -> list[int]:
-    if isinstance(x, int):
-        pass
-    elif isinstance(x, (ModuloCircuitElement, PyFelt)):
-        x = x.value
-    elif isinstance(x, bytes):
-        x = int.from_bytes(x, byteorder="big")
-    else:
-        raise ValueError(f"Invalid type for bigint_split: {type(x)}")
+    x = _bigint_value(x)
+    if base & (base - 1) == 0:
+        # Power of two base: the last limb holds the remaining high bits, as with divmod.
+        shift = base.bit_length() - 1
+        return [x >> (shift * i) & (base - 1) for i in range(n_limbs - 1)] + [
+            x >> (shift * (n_limbs - 1))
+        ]
 
     coeffs = []
     degree = n_limbs - 1
@@ -260,11 +270,25 @@ def bigint_split_array(
     base: int = 2**96,
     prepend_length=False,
 ) -> list[int]:
-    xs = []
-    if prepend_length:
-        xs.append(len(x))
-    for e in x:
-        xs.extend(bigint_split(e, n_limbs, base))
+    """
+    The limbs of each element of x (see bigint_split), optionally preceded by the length of x.
+    For power of two bases, the limbs are computed for all elements at once, one limb index at a
+    time, into a preallocated list.
+    """
+    if base & (base - 1):
+        xs = [len(x)] if prepend_length else []
+        for e in x:
+            xs.extend(bigint_split(e, n_limbs, base))
+        return xs
+
+    values = [_bigint_value(e) for e in x]
+    start = 1 if prepend_length else 0
+    xs = [len(values)] * (start + n_limbs * len(values))
+    shift = base.bit_length() - 1
+    mask = base - 1
+    for i in range(n_limbs - 1):
+        xs[start + i :: n_limbs] = [v >> (shift * i) & mask for v in values]
+    xs[start + n_limbs - 1 :: n_limbs] = [v >> (shift * (n_limbs - 1)) for v in values]
     return xs
 
 
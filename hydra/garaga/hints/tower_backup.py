@@ -6,7 +6,13 @@ import random
 from dataclasses import dataclass
 
 from garaga.algebra import ModuloCircuitElement, Polynomial, PyFelt
-from garaga.definitions import CURVES, direct_to_tower, get_base_field, tower_to_direct
+from garaga.definitions import (
+    CURVES,
+    direct_to_tower,
+    get_base_field,
+    get_curve_context,
+    tower_to_direct,
+)
 
 
 @dataclass(slots=True)
@@ -146,7 +152,7 @@ class E6:
     def __init__(self, x: list[int | PyFelt | E2], curve_id: int):
         curve = CURVES[curve_id]
         self.curve_id = curve_id
-        self.non_residue = E2(curve.nr_a0, curve.nr_a1, curve.p)
+        self.non_residue = get_curve_context(curve_id).non_residue
         if isinstance(x[0], int):
             self.b0 = E2(x[0], x[1], curve.p)
             self.b1 = E2(x[2], x[3], curve.p)
@@ -0,0 +1,73 @@
+import itertools
+from contextlib import contextmanager
+from enum import Enum
+from typing import Iterator
+
+
+class VerificationLevel(Enum):
+    """
+    How much of the sanity checks of the hint builders is run.
+    OFF: No check.
+    SAMPLED: Only one request in sample_rate is checked, and only with the random point checks
+        (verify_ecip skips its final msm).
+    FULL: Every request is checked, including the final msm of verify_ecip.
+    """
+
+    OFF = "off"
+    SAMPLED = "sampled"
+    FULL = "full"
+
+
+DEFAULT_SAMPLE_RATE = 16
+
+_verification_level: VerificationLevel = VerificationLevel.FULL
+_sample_rate: int = DEFAULT_SAMPLE_RATE
+_sampled_requests = itertools.count()
+
+
+def get_verification_level() -> VerificationLevel:
+    return _verification_level
+
+
+def set_verification_level(
+    level: VerificationLevel | str, sample_rate: int = DEFAULT_SAMPLE_RATE
+):
+    """
+    Sets the global verification level, used by the hint builders called without one.
+    """
+    global _verification_level, _sample_rate
+    assert sample_rate >= 1, f"Invalid sample rate: {sample_rate}"
+    _verification_level = VerificationLevel(level)
+    _sample_rate = sample_rate
+
+
+@contextmanager
+def verification_level(
+    level: VerificationLevel | str, sample_rate: int = DEFAULT_SAMPLE_RATE
+) -> Iterator[VerificationLevel]:
+    """
+    Sets the global verification level inside the block.
+
+    Usage:
+        with verification_level("sampled", sample_rate=100):
+            calldata = builder.serialize_to_calldata()
+    """
+    previous = (_verification_level, _sample_rate)
+    set_verification_level(level, sample_rate)
+    try:
+        yield _verification_level
+    finally:
+        set_verification_level(*previous)
+
+
+def resolve_verification_level(
+    level: VerificationLevel | str | None = None,
+) -> VerificationLevel:
+    """
+    Returns the level of a request: its own level if given, the global one otherwise.
+    With SAMPLED, the requests not sampled are downgraded to OFF.
+    """
+    level = _verification_level if level is None else VerificationLevel(level)
+    if level == VerificationLevel.SAMPLED and next(_sampled_requests) % _sample_rate:
+        return VerificationLevel.OFF
+    return level
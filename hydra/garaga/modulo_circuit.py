@@ -3,11 +3,14 @@ from enum import Enum, auto
 from typing import List, Union
 
 from garaga.algebra import BaseField, ModuloCircuitElement, PyFelt
+from garaga.circuit_profiler import CircuitProfiler, get_active_profiler
 from garaga.definitions import BASE, CURVES, N_LIMBS, STARK, CurveID, get_sparsity
 from garaga.hints.io import bigint_split
 from garaga.modulo_circuit_structs import Cairo1SerializableStruct, u384
 
 BATCH_SIZE = 1  # Batch Size, only used in cairo 0 mode.
+# Weight in steps of the modulo builtin operations (see the README).
+OP_STEPS = {"ADDMOD": 4, "MULMOD": 8, "ASSERT_EQ": 2}
 
 
 class WriteOps(Enum):
@@ -51,6 +54,17 @@ class ModuloCircuitInstruction:
     result_offset: int
     comment: str | None
 
+    def operands(self, offset: int) -> list[int]:
+        """
+        Returns the offsets read by the instruction writing the value at `offset`.
+        (For a sub or an inverse, the written value is one of the operands of the builtin.)
+        """
+        return [
+            o
+            for o in (self.left_offset, self.right_offset, self.result_offset)
+            if o is not None and o != offset
+        ]
+
 
 @dataclass(slots=True, frozen=True)
 class ValueSegmentItem:
@@ -315,6 +329,8 @@ class ModuloCircuit:
         add_offsets (list[tuple]): A list of tuples representing the offsets involved in addition operations.
         mul_offsets (list[tuple]): A list of tuples representing the offsets involved in multiplication operations.
         constants (dict[str, ModuloElement]): A dictionary mapping constant names to their ModuloElement representations.
+        powers (dict[int, list[ModuloElement | None]]): For each element (by offset) whose powers were computed,
+            the powers [x, x^2, ..., x^n] available in the circuit (None for the ones not computed).
     """
 
     def __init__(
@@ -336,11 +352,32 @@ class ModuloCircuit:
             name=name, compilation_mode=compilation_mode
         )
         self.constants: dict[int, ModuloCircuitElement] = dict()
+        self.powers: dict[int, list[ModuloCircuitElement | None]] = dict()
         self.generic_circuit = generic_circuit
         self.compilation_mode = compilation_mode
         self.exact_output_refs_needed = None
         self.input_structs: list[Cairo1SerializableStruct] = []
         self.do_not_inline = False
+        self.profiler: CircuitProfiler | None = get_active_profiler()
+
+    def enable_profiling(self) -> CircuitProfiler:
+        """
+        Starts attributing the instructions written from now on to the builder methods emitting them.
+        See garaga.circuit_profiler.profile_circuits to profile circuits created in a block.
+        """
+        if self.profiler is None:
+            self.profiler = CircuitProfiler()
+        return self.profiler
+
+    def _profile(self, instruction: ModuloCircuitInstruction, result_offset: int):
+        if instruction.operation == ModBuiltinOps.ADD:
+            op = "ADDMOD"
+        elif instruction.right_offset in (None, result_offset):
+            # The written value is the unknown operand of the MUL (inverse or division hint).
+            op = "INV"
+        else:
+            op = "MULMOD"
+        self.profiler.record(self.name, op)
 
     @property
     def values_offset(self) -> int:
@@ -399,9 +436,32 @@ class ModuloCircuit:
                 instruction,
             )
         )
+        if self.profiler is not None and instruction is not None:
+            self._profile(instruction, value_offset)
         res = ModuloCircuitElement(elmt, value_offset)
         return res
 
+    def replay_instruction(
+        self,
+        instruction: ModuloCircuitInstruction,
+        offset: int,
+        elmts: dict[int, ModuloCircuitElement],
+    ) -> ModuloCircuitElement:
+        """
+        Writes to this circuit the operation of an instruction of another circuit, which wrote the
+        value at `offset`. elmts maps the offsets of the other circuit to elements of this circuit.
+        """
+        left = elmts.get(instruction.left_offset)
+        if instruction.operation == ModBuiltinOps.ADD:
+            if instruction.right_offset == offset:
+                return self.sub(
+                    elmts[instruction.result_offset], left, instruction.comment
+                )
+            return self.add(left, elmts[instruction.right_offset], instruction.comment)
+        if instruction.right_offset in (None, offset):
+            return self.inv(left, instruction.comment)
+        return self.mul(left, elmts[instruction.right_offset], instruction.comment)
+
     def write_struct(
         self,
         struct: Cairo1SerializableStruct,
@@ -783,6 +843,8 @@ class ModuloCircuit:
             ModBuiltinOps.ADD, c.offset, b.offset, a.offset, comment
         )
         self.values_segment.assert_eq_instructions.append(instruction)
+        if self.profiler is not None:
+            self.profiler.record(self.name, "ASSERT_EQ")
         return c
 
     def add_and_assert(
@@ -805,6 +867,8 @@ class ModuloCircuit:
             ModBuiltinOps.ADD, a.offset, b.offset, c.offset, comment
         )
         self.values_segment.assert_eq_instructions.append(instruction)
+        if self.profiler is not None:
+            self.profiler.record(self.name, "ASSERT_EQ")
         return c
 
     def mul_and_assert(
@@ -822,8 +886,72 @@ class ModuloCircuit:
             ModBuiltinOps.MUL, a.offset, b.offset, c.offset, comment
         )
         self.values_segment.assert_eq_instructions.append(instruction)
+        if self.profiler is not None:
+            self.profiler.record(self.name, "ASSERT_EQ")
         return c
 
+    def register_powers(
+        self,
+        x: ModuloCircuitElement,
+        powers: list[ModuloCircuitElement | None],
+    ):
+        """
+        Records powers [x, x^2, ..., x^n] of x computed outside of get_powers (None for the ones
+        not computed), so that later evaluations at x can reuse them.
+        """
+        assert powers and powers[0].offset == x.offset
+        cached = self.powers.setdefault(x.offset, [x])
+        cached.extend([None] * (len(powers) - len(cached)))
+        for i, power in enumerate(powers):
+            if cached[i] is None:
+                cached[i] = power
+
+    def get_powers(
+        self, x: ModuloCircuitElement, max_degree: int, var_name: str = "x"
+    ) -> list[ModuloCircuitElement]:
+        """
+        Returns [x, x^2, ..., x^max_degree], computing only the powers of x not available yet.
+        """
+        cached = self.powers.setdefault(x.offset, [x])
+        cached.extend([None] * (max_degree - len(cached)))
+        for i in range(1, max_degree):
+            if cached[i] is None:
+                cached[i] = self.mul(
+                    cached[i - 1], x, comment=f"Compute {var_name}^{i + 1}"
+                )
+        return cached[:max_degree]
+
+    def _missing_powers(self, x: ModuloCircuitElement, max_degree: int) -> int:
+        cached = self.powers.get(x.offset, [x])
+        return sum(
+            1 for i in range(1, max_degree) if i >= len(cached) or cached[i] is None
+        )
+
+    def _constant_value(self, elmt: ModuloCircuitElement | None) -> int | None:
+        # None coefficients are zero (see mul).
+        if elmt is None:
+            return 0
+        if self.values_segment.segment[elmt.offset].write_source == WriteOps.CONSTANT:
+            return elmt.value
+        return None
+
+    def _eval_costs(
+        self, poly: list[ModuloCircuitElement], z: ModuloCircuitElement
+    ) -> tuple[float, float]:
+        """
+        Estimated steps of evaluating poly at z with Horner's method, and with powers of z (the
+        ones not available yet included). Constant zero coefficients are skipped by both methods,
+        constant one coefficients don't need a multiplication with powers of z.
+        """
+        add, mul = OP_STEPS["ADDMOD"], OP_STEPS["MULMOD"]
+        coeffs = [self._constant_value(c) for c in poly]
+        horner = (len(poly) - 1) * mul + add * sum(1 for c in coeffs[:-1] if c != 0)
+        degree = max((i for i, c in enumerate(coeffs) if c != 0), default=0)
+        powers = self._missing_powers(z, degree) * mul + sum(
+            add + (mul if c != 1 else 0) for c in coeffs[1:] if c != 0
+        )
+        return horner, powers
+
     def eval_horner(
         self,
         poly: list[ModuloCircuitElement],
@@ -832,24 +960,38 @@ class ModuloCircuit:
         var_name: str = "z",
     ):
         """
-        Evaluates a polynomial at point z using Horner's method.
+        Evaluates a polynomial at point z using Horner's method, or using the powers of z if it is
+        cheaper given the powers of z already available in the circuit (see _eval_costs).
         Assumes that the polynomial is in the form a0 + a1*z + a2*z^2 + ... + an*z^n, indexed with the constant coefficient first.
         """
         if poly_name is None:
             poly_name = "UnnamedPoly"
 
+        horner_cost, powers_cost = self._eval_costs(poly, z)
+        if powers_cost < horner_cost:
+            degree = max(
+                (i for i, c in enumerate(poly) if self._constant_value(c) != 0),
+                default=0,
+            )
+            return self._eval_poly_in_powers(
+                poly[: degree + 1],
+                self.get_powers(z, degree, var_name),
+                poly_name,
+                var_name,
+            )
+
         # Regular Horner evaluation
         acc = poly[-1]  # Start with the highest degree coefficient
         for i in range(len(poly) - 2, -1, -1):
-            acc = self.add(
-                poly[i],
-                self.mul(
-                    acc,
-                    z,
-                    comment=f"Eval {poly_name} Horner step: multiply by {var_name}",
-                ),
-                comment=f"Eval {poly_name} Horner step: add coefficient_{i}",
+            acc = self.mul(
+                acc, z, comment=f"Eval {poly_name} Horner step: multiply by {var_name}"
             )
+            if self._constant_value(poly[i]) != 0:
+                acc = self.add(
+                    poly[i],
+                    acc,
+                    comment=f"Eval {poly_name} Horner step: add coefficient_{i}",
+                )
 
         return acc
 
@@ -864,25 +1006,43 @@ class ModuloCircuit:
         Evaluates a polynomial at precomputed powers of X.
         Assumes that the polynomial is in the form a0 + a1*x + a2*x^2 + ... + an*x^n, indexed with the constant coefficient first.
         Assumes that X_powers is a list of powers of X, such that X_powers[i] = X^(i+1).
+        The powers are cached for later evaluations at X (see eval_horner).
         """
         if poly_name is None:
             poly_name = "UnnamedPoly"
         assert len(poly) - 1 <= len(
             X_powers
         ), f"Expected at least {len(poly) - 1} powers of X to evaluate P, got {len(X_powers)}"
+        self.register_powers(X_powers[0], X_powers)
+        return self._eval_poly_in_powers(poly, X_powers, poly_name, var_name)
 
-        acc = poly[0]
+    def _eval_poly_in_powers(
+        self,
+        poly: list[ModuloCircuitElement],
+        X_powers: list[ModuloCircuitElement],
+        poly_name: str,
+        var_name: str,
+    ) -> ModuloCircuitElement:
+        # Constant zero coefficients are skipped, constant one coefficients add the power directly.
+        acc = poly[0] if self._constant_value(poly[0]) != 0 else None
         for i in range(1, len(poly)):
+            match self._constant_value(poly[i]):
+                case 0:
+                    continue
+                case 1:
+                    term = X_powers[i - 1]
+                case _:
+                    term = self.mul(
+                        poly[i],
+                        X_powers[i - 1],
+                        comment=f"Eval {poly_name} step coeff_{i} * {var_name}^{i}",
+                    )
             acc = self.add(
                 acc,
-                self.mul(
-                    poly[i],
-                    X_powers[i - 1],
-                    comment=f"Eval {poly_name} step coeff_{i} * {var_name}^{i}",
-                ),
+                term,
                 comment=f"Eval {poly_name} step + (coeff_{i} * {var_name}^{i})",
             )
-        return acc
+        return acc if acc is not None else self.set_or_get_constant(0)
 
     def extend_output(self, elmts: list[ModuloCircuitElement]):
         """
@@ -1140,17 +1300,11 @@ class ModuloCircuit:
                         assert offset == result_offset
         return code
 
-    def compile_circuit_cairo_1(
-        self,
-        function_name: str = None,
-        pub: bool = False,
-    ) -> str:
+    def _cairo1_signature(self) -> tuple[str, bool, str, bool]:
         """
-        Defines the Cairo 1 function code for the compiled circuit.
+        Returns the input signature of the Cairo 1 function of the circuit, whether the input is
+        given as structs, its output signature and whether the output is returned as structs.
         """
-        name = function_name or self.values_segment.name
-        function_name = f"run_{name}_circuit"
-        curve_index = CurveID.find_value_in_string(name)
         return_is_struct = False
         input_is_struct = False
         if self.output_structs:
@@ -1178,6 +1332,37 @@ class ModuloCircuit:
                 )
         else:
             signature_input = "mut input: Array<u384>"
+        return signature_input, input_is_struct, signature_output, return_is_struct
+
+    def compile_cairo1_shared_wrapper(
+        self, function_name: str, shared_function_name: str
+    ) -> str:
+        """
+        Cairo 1 function `run_{function_name}_circuit` with the signature of the circuit, calling the
+        generic function `run_{shared_function_name}_circuit` with the curve index of the circuit.
+        """
+        signature_input, input_is_struct, signature_output, _ = self._cairo1_signature()
+        args = [s.name for s in self.input_structs] if input_is_struct else ["input"]
+        return (
+            f"#[inline(always)]\npub fn run_{function_name}_circuit({signature_input})->{signature_output} {{\n"
+            f"    run_{shared_function_name}_circuit({', '.join(args)}, {self.curve_id})\n"
+            "}\n"
+        )
+
+    def compile_circuit_cairo_1(
+        self,
+        function_name: str = None,
+        pub: bool = False,
+    ) -> str:
+        """
+        Defines the Cairo 1 function code for the compiled circuit.
+        """
+        name = function_name or self.values_segment.name
+        function_name = f"run_{name}_circuit"
+        curve_index = CurveID.find_value_in_string(name)
+        signature_input, input_is_struct, signature_output, return_is_struct = (
+            self._cairo1_signature()
+        )
 
         if pub:
             prefix = "pub "
@@ -1295,6 +1480,58 @@ class ModuloCircuit:
             code += const_array
         return code, function_name
 
+    def instruction_graph(self) -> dict:
+        """
+        JSON serialisable description of what the compiler reads from the circuit: the value
+        segment (write sources, constants and instructions with their comments), the assert_eq
+        instructions, the input and output structs and the output.
+        """
+
+        def instruction(ins: ModuloCircuitInstruction | None) -> list | None:
+            if ins is None:
+                return None
+            return [
+                ins.operation.name,
+                ins.left_offset,
+                ins.right_offset,
+                ins.result_offset,
+                ins.comment,
+            ]
+
+        def struct(s: Cairo1SerializableStruct) -> list:
+            return [type(s).__name__, s.name, len(s)]
+
+        segment = self.values_segment
+        return {
+            "name": self.name,
+            "curve_id": self.curve_id,
+            "generic_circuit": self.generic_circuit,
+            "compilation_mode": self.compilation_mode,
+            "do_not_inline": self.do_not_inline,
+            "exact_output_refs_needed": (
+                None
+                if self.exact_output_refs_needed is None
+                else [elmt.offset for elmt in self.exact_output_refs_needed]
+            ),
+            "segment": [
+                [
+                    offset,
+                    item.write_source.name,
+                    item.value if item.write_source == WriteOps.CONSTANT else None,
+                    instruction(item.instruction),
+                ]
+                for offset, item in segment.segment.items()
+            ],
+            "assert_eq": [instruction(ins) for ins in segment.assert_eq_instructions],
+            "input_structs": [struct(s) for s in self.input_structs],
+            "output": [elmt.offset for elmt in self.output],
+            "output_structs": (
+                None
+                if self.output_structs is None
+                else [struct(s) for s in self.output_structs]
+            ),
+        }
+
     def summarize(self):
         add_count, mul_count, assert_eq_count = self.values_segment.summarize()
         summary = {
@@ -1305,7 +1542,6 @@ class ModuloCircuit:
             "POSEIDON": 0,
             "RLC": 0,
         }
-
         return summary
 
 
@@ -79,6 +79,14 @@ class Cairo1SerializableStruct(ABC):
     def _serialize_to_calldata(self) -> list[int]:
         pass
 
+    @property
+    def calldata_n_limbs(self) -> int | None:
+        """
+        The number of 96-bit limbs of each element, if the calldata of the struct is only the limbs
+        of its elements (see serialize_structs_to_calldata). None otherwise.
+        """
+        return None
+
     def serialize_to_calldata(self, *args, **kwargs) -> list[int]:
         data = self._serialize_to_calldata(*args, **kwargs)
         # print(
@@ -87,6 +95,29 @@ class Cairo1SerializableStruct(ABC):
         return data
 
 
+def serialize_structs_to_calldata(structs: list[Cairo1SerializableStruct]) -> list[int]:
+    """
+    The concatenated calldata of structs. The elements of consecutive structs with the same
+    calldata_n_limbs are split together, in a single io.bigint_split_array call.
+    """
+    cd = []
+    run: list[ModuloCircuitElement | PyFelt] = []
+    run_n_limbs = None
+    for struct in structs:
+        n_limbs = struct.calldata_n_limbs
+        if n_limbs != run_n_limbs and run:
+            cd.extend(io.bigint_split_array(run, n_limbs=run_n_limbs))
+            run = []
+        run_n_limbs = n_limbs
+        if n_limbs is None:
+            cd.extend(struct._serialize_to_calldata())
+        else:
+            run.extend(struct.elmts)
+    if run:
+        cd.extend(io.bigint_split_array(run, n_limbs=run_n_limbs))
+    return cd
+
+
 class StructArray(Cairo1SerializableStruct, Generic[T]):
     elmts: list[T]
 
@@ -164,10 +195,7 @@ class Struct(Cairo1SerializableStruct):
         return sum(len(elmt) for elmt in self.elmts)
 
     def _serialize_to_calldata(self) -> list[int]:
-        cd = []
-        for elmt in self.elmts:
-            cd.extend(elmt.serialize_to_calldata())
-        return cd
+        return serialize_structs_to_calldata(self.elmts)
 
 
 class StructSpan(Cairo1SerializableStruct, Generic[T]):
@@ -227,8 +255,7 @@ class StructSpan(Cairo1SerializableStruct, Generic[T]):
                 raise ValueError(f"Invalid option: {option}")
 
         cd.append(len(self.elmts))
-        for elmt in self.elmts:
-            cd.extend(elmt._serialize_to_calldata())
+        cd.extend(serialize_structs_to_calldata(self.elmts))
         return cd
 
 
@@ -275,6 +302,10 @@ class u384(Cairo1SerializableStruct):
         assert len(self.elmts) == 1
         return io.bigint_split_array(self.elmts, prepend_length=False)
 
+    @property
+    def calldata_n_limbs(self) -> int:
+        return 4
+
     def extract_from_circuit_output(
         self, offset_to_reference_map: dict[int, str]
     ) -> str:
@@ -446,10 +477,7 @@ class Tuple(Cairo1SerializableStruct):
             return f"let ({','.join([elmt.name for elmt in self.elmts])}):{self.struct_name} = {raw_struct};\n"
 
     def _serialize_to_calldata(self) -> list[int]:
-        cd = []
-        for elmt in self.elmts:
-            cd.extend(elmt._serialize_to_calldata())
-        return cd
+        return serialize_structs_to_calldata(self.elmts)
 
     def extract_from_circuit_output(
         self, offset_to_reference_map: dict[int, str]
@@ -776,6 +804,10 @@ class G1PointCircuit(Cairo1SerializableStruct):
     def _serialize_to_calldata(self) -> list[int]:
         return io.bigint_split_array(self.elmts, prepend_length=False)
 
+    @property
+    def calldata_n_limbs(self) -> int:
+        return 4
+
     def extract_from_circuit_output(
         self, offset_to_reference_map: dict[int, str]
     ) -> str:
@@ -1022,6 +1054,15 @@ class E12D(Cairo1SerializableStruct):
         else:
             raise ValueError(f"Unsupported bit length for E12D: {bits}")
 
+    @property
+    def calldata_n_limbs(self) -> int | None:
+        bits: int = self.bits
+        if bits <= 288:
+            return 3
+        elif bits <= 384:
+            return 4
+        return None
+
     def dump_to_circuit_input(self) -> str:
         bits: int = self.elmts[0].p.bit_length()
         code = ""
@@ -1099,6 +1140,10 @@ class E12T(Cairo1SerializableStruct):
     def _serialize_to_calldata(self) -> list[int]:
         return io.bigint_split_array(self.elmts, n_limbs=4, prepend_length=False)
 
+    @property
+    def calldata_n_limbs(self) -> int:
+        return 4
+
     def dump_to_circuit_input(self) -> str:
         code = ""
         for i in range(len(self)):
@@ -1171,6 +1216,15 @@ class E12DMulQuotient(Cairo1SerializableStruct):
         else:
             raise ValueError(f"Unsupported bit length for E12D: {bits}")
 
+    @property
+    def calldata_n_limbs(self) -> int | None:
+        bits: int = self.bits
+        if bits <= 288:
+            return 3
+        elif bits <= 384:
+            return 4
+        return None
+
     def dump_to_circuit_input(self) -> str:
         bits: int = self.elmts[0].p.bit_length()
         code = ""
@@ -1244,6 +1298,10 @@ class MillerLoopResultScalingFactor(Cairo1SerializableStruct):
         else:
             return io.bigint_split_array(self.elmts, n_limbs=4, prepend_length=False)
 
+    @property
+    def calldata_n_limbs(self) -> int:
+        return 3 if self.bits <= 288 else 4
+
     def __len__(self) -> int:
         if self.elmts is not None:
             assert len(self.elmts) == 6
@@ -1,7 +1,15 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
+from garaga import modulo_circuit, modulo_circuit_structs
 from garaga.definitions import CurveID
+from garaga.precompiled_circuits.compilable_circuits import base
 from garaga.precompiled_circuits.compilable_circuits.apply_isogeny import (
     ApplyIsogenyCircuit,
 )
@@ -9,7 +17,9 @@ from garaga.precompiled_circuits.compilable_circuits.base import (
     cairo1_tests_header,
     compilation_mode_to_file_header,
     compile_circuit,
+    compile_single_circuit,
     create_cairo1_test,
+    create_circuit_instances,
     format_cairo_files_in_parallel,
 )
 from garaga.precompiled_circuits.compilable_circuits.cairo1_mpcheck_circuits import (
@@ -443,6 +453,109 @@ ALL_CAIRO_CIRCUITS = {
     # },
 }
 
+MANIFEST_FILE = "build/circuits_manifest.json"
+
+
+@lru_cache(maxsize=1)
+def compiler_version() -> str:
+    """
+    Hash of the sources turning traced circuits into Cairo code: changing them invalidates the
+    manifest of generated files.
+    """
+    h = hashlib.sha256()
+    for module in (modulo_circuit, modulo_circuit_structs, base):
+        with open(module.__file__, "rb") as f:
+            h.update(f.read())
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def circuit_digest(circuit) -> str:
+    """
+    Content hash of a compiled circuit: its instruction graph together with the compiler version.
+    """
+    graph = json.dumps(circuit.instruction_graph(), sort_keys=True)
+    return hashlib.sha256((compiler_version() + graph).encode()).hexdigest()
+
+
+def file_digest(
+    circuit_digests: dict[str, str],
+    codes: set[str],
+    full_function_names: set[str],
+    tests: set[str],
+    curve_ids: set[CurveID],
+    output_sizes_exceeding_limit: set[int],
+    compilation_mode: int,
+) -> str:
+    """
+    Content hash of a generated file: the digests of its circuits, the code and tests emitted for
+    them (which also depend on the inputs of the compilable circuits), and what its header depends
+    on.
+    """
+    content = {
+        "compiler": compiler_version(),
+        "compilation_mode": compilation_mode,
+        "curve_ids": sorted(curve_id.name for curve_id in curve_ids),
+        "output_sizes": sorted(output_sizes_exceeding_limit),
+        "circuits": dict(sorted(circuit_digests.items())),
+        "codes": sorted(codes),
+        "full_function_names": sorted(full_function_names),
+        "tests": sorted(tests),
+    }
+    return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_manifest(path: str) -> dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def unchanged_files(
+    manifest: dict[str, dict], digests: dict[str, str], PRECOMPILED_CIRCUITS_DIR: str
+) -> set[str]:
+    """
+    Returns the files whose digest is the one in the manifest, and whose content on disk is still
+    the one written (and formatted) when the manifest was last updated.
+    """
+    unchanged = set()
+    for filename, digest in digests.items():
+        entry = manifest.get(filename)
+        path = f"{PRECOMPILED_CIRCUITS_DIR}{filename}.cairo"
+        if (
+            entry is not None
+            and entry["digest"] == digest
+            and os.path.exists(path)
+            and _file_sha256(path) == entry["sha256"]
+        ):
+            unchanged.add(filename)
+    return unchanged
+
+
+def write_manifest(
+    path: str,
+    manifest: dict[str, dict],
+    digests: dict[str, str],
+    PRECOMPILED_CIRCUITS_DIR: str,
+) -> None:
+    manifest = dict(manifest)
+    for filename, digest in digests.items():
+        manifest[filename] = {
+            "digest": digest,
+            "sha256": _file_sha256(f"{PRECOMPILED_CIRCUITS_DIR}{filename}.cairo"),
+        }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+        f.write("\n")
+
 
 def initialize_compilation(
     PRECOMPILED_CIRCUITS_DIR: str, CIRCUITS_TO_COMPILE: dict
@@ -451,31 +564,25 @@ def initialize_compilation(
     dict[str, set[str]],
     dict[str, set[str]],
     dict[str, set[str]],
-    dict[str, open],
 ]:
     """
-    Initialize the compilation process by creating the necessary directories and files.
+    Initialize the compilation process by creating the necessary directories.
     Returns :
         - filenames_used: set of all filenames that will be used
         - codes: dict of sets of strings, where each set contains the compiled circuits for a given filename
         - cairo1_tests_functions: dict of sets of strings, where each set contains the cairo1 tests for a given filename
         - cairo1_full_function_names: dict of sets of strings, where each set contains the full function names for a given filename
-        - files: dict of open files, where each file is for a given filename
     """
     create_directory(PRECOMPILED_CIRCUITS_DIR)
     filenames_used = set([v["filename"] for v in CIRCUITS_TO_COMPILE.values()])
     codes = {filename: set() for filename in filenames_used}
     cairo1_tests_functions = {filename: set() for filename in filenames_used}
     cairo1_full_function_names = {filename: set() for filename in filenames_used}
-    files = {
-        f: open(f"{PRECOMPILED_CIRCUITS_DIR}{f}.cairo", "w") for f in filenames_used
-    }
     return (
         filenames_used,
         codes,
         cairo1_tests_functions,
         cairo1_full_function_names,
-        files,
     )
 
 
@@ -532,6 +639,170 @@ impl MyDrp_{num_outputs}<
             )
 
 
+@dataclass(slots=True)
+class CompilationResult:
+    """
+    The part of the .cairo file `filename_key` produced by one circuit class, curve and params.
+    """
+
+    filename_key: str
+    codes: list[str]
+    full_function_names: list[str]
+    tests: set[str]
+    output_lengths: list[int]
+    digests: dict[str, str]
+    shared: list[tuple[str, str] | None]
+
+
+def shared_circuit_key(circuit) -> str:
+    """
+    Digest of the instruction graph of a circuit without its name and curve, and of the Cairo
+    types of its inputs. Circuits of different curves with the same key only differ by their
+    modulus.
+    """
+    graph = circuit.instruction_graph()
+    del graph["name"], graph["curve_id"]
+    graph["inputs"] = [
+        [s.serialize_input_signature(), s.dump_to_circuit_input()]
+        for s in circuit.input_structs
+    ]
+    return hashlib.sha256(json.dumps(graph, sort_keys=True).encode()).hexdigest()
+
+
+def shared_circuit(circuit_instance) -> tuple[str, str] | None:
+    """
+    For a compiled curve-specific Cairo 1 circuit, returns its shared_circuit_key and the code of
+    the curve-specific function calling the generic function that can replace it for all curves
+    (see generic_circuit_code).
+    """
+    circuit = circuit_instance.circuit
+    shared_name = circuit_instance.name.upper()
+    if (
+        circuit.generic_circuit
+        or circuit.compilation_mode != 1
+        or circuit.is_empty_circuit()
+        or CurveID.find_value_in_string(shared_name) is not None
+    ):
+        return None
+    wrapper_code = circuit.compile_cairo1_shared_wrapper(
+        f"{CurveID(circuit.curve_id).name}_{shared_name}", shared_name
+    )
+    return shared_circuit_key(circuit), wrapper_code
+
+
+def generic_circuit_code(
+    task: tuple[dict, CurveID, list], index: int, compilation_mode: int
+) -> tuple[str, str]:
+    """
+    Traces and compiles again the index-th circuit of a task, and returns the name and the code of
+    the generic function (taking the curve index) that can replace it for all the curves sharing
+    its shared_circuit_key.
+    """
+    circuit_info, curve_id, params = task
+    circuit_instance = create_circuit_instances(
+        circuit_info["class"], curve_id, params, compilation_mode
+    )[index]
+    compile_single_circuit(circuit_instance)
+    circuit = circuit_instance.circuit
+    circuit.generic_circuit = True
+    try:
+        shared_code, shared_function_name = circuit.compile_circuit_cairo_1(
+            circuit_instance.name.upper(), pub=True
+        )
+    finally:
+        circuit.generic_circuit = False
+    return shared_function_name, shared_code
+
+
+def compilation_tasks(CIRCUITS_TO_COMPILE: dict) -> list[tuple[dict, CurveID, list]]:
+    """
+    Splits the circuits to compile into independent (circuit info, curve id, params) tasks,
+    with one set of params per task.
+    """
+    tasks = []
+    for circuit_info in CIRCUITS_TO_COMPILE.values():
+        for curve_id in circuit_info.get(
+            "curve_ids", [CurveID.BN254, CurveID.BLS12_381]
+        ):
+            if circuit_info["params"] is None:
+                tasks.append((circuit_info, curve_id, None))
+            else:
+                tasks.extend(
+                    (circuit_info, curve_id, [param])
+                    for param in circuit_info["params"]
+                )
+    return tasks
+
+
+def compile_task(
+    task: tuple[dict, CurveID, list], compilation_mode: int
+) -> CompilationResult:
+    circuit_info, curve_id, params = task
+    filename_key = circuit_info["filename"]
+    compiled_circuits, full_function_names, circuit_instances = compile_circuit(
+        curve_id,
+        circuit_info["class"],
+        params,
+        compilation_mode,
+        filename_key,
+    )
+    tests = {filename_key: set()}
+    if compilation_mode == 1:
+        generate_cairo1_tests(
+            circuit_instances, full_function_names, curve_id, tests, filename_key
+        )
+    return CompilationResult(
+        filename_key=filename_key,
+        codes=compiled_circuits,
+        full_function_names=full_function_names,
+        tests=tests[filename_key],
+        output_lengths=[
+            len(circuit_instance.circuit.output)
+            for circuit_instance in circuit_instances
+            if circuit_instance.circuit.exact_output_refs_needed is None
+        ],
+        digests={
+            f"{curve_id.name}/{circuit_instance.circuit.name}": circuit_digest(
+                circuit_instance.circuit
+            )
+            for circuit_instance in circuit_instances
+        },
+        shared=[
+            shared_circuit(circuit_instance) for circuit_instance in circuit_instances
+        ],
+    )
+
+
+def share_identical_circuits(
+    tasks: list[tuple[dict, CurveID, list]],
+    results: list[CompilationResult],
+    compilation_mode: int,
+) -> None:
+    """
+    Replaces, in each file, the curve-specific circuits with identical instruction graphs (see
+    shared_circuit_key) on several curves by a single generic function taking the curve index,
+    and per-curve functions with the same names calling it.
+    Only the circuits that are actually shared are compiled to generic code.
+    """
+    groups: dict[tuple[str, str], list[tuple[int, int]]] = {}
+    for j, result in enumerate(results):
+        for i, shared in enumerate(result.shared):
+            if shared is not None:
+                key = (result.filename_key, shared[0])
+                groups.setdefault(key, []).append((j, i))
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        first, first_index = members[0]
+        shared_function_name, shared_code = generic_circuit_code(
+            tasks[first], first_index, compilation_mode
+        )
+        results[first].codes.append(shared_code)
+        results[first].full_function_names.append(shared_function_name)
+        for j, i in members:
+            results[j].codes[i] = results[j].shared[i][1]
+
+
 def compile_circuits(
     CIRCUITS_TO_COMPILE: dict,
     compilation_mode: int,
@@ -540,40 +811,41 @@ def compile_circuits(
     cairo1_tests_functions: dict[str, set[str]],
     output_sizes_exceeding_limit: dict[str, set[int]],
     limit: int,
+    n_workers: int | None = 1,
+    digests: dict[str, dict[str, str]] | None = None,
 ) -> None:
     """
     Compile the circuits and write them to the files.
+    Each circuit class, curve and params is compiled independently, in n_workers processes
+    (None for one per CPU). The results are merged in task order, and the files are written from
+    sorted sets, so the output doesn't depend on n_workers.
+    If digests is given, the digest of each compiled circuit (see circuit_digest) is stored in it,
+    by filename.
     """
-    for circuit_id, circuit_info in CIRCUITS_TO_COMPILE.items():
-        for curve_id in circuit_info.get(
-            "curve_ids", [CurveID.BN254, CurveID.BLS12_381]
-        ):
-            filename_key = circuit_info["filename"]
-            compiled_circuits, full_function_names, circuit_instances = compile_circuit(
-                curve_id,
-                circuit_info["class"],
-                circuit_info["params"],
-                compilation_mode,
-                filename_key,
-            )
-            codes[filename_key].update(compiled_circuits)
-            for circuit_instance in circuit_instances:
-                output_length = len(circuit_instance.circuit.output)
-                if (
-                    output_length > limit
-                    and circuit_instance.circuit.exact_output_refs_needed is None
-                ):
-                    output_sizes_exceeding_limit[filename_key].add(output_length)
-
-            if compilation_mode == 1:
-                cairo1_full_function_names[filename_key].update(full_function_names)
-                generate_cairo1_tests(
-                    circuit_instances,
-                    full_function_names,
-                    curve_id,
-                    cairo1_tests_functions,
-                    filename_key,
+    tasks = compilation_tasks(CIRCUITS_TO_COMPILE)
+    if n_workers == 1:
+        results = [compile_task(task, compilation_mode) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(
+                executor.map(
+                    compile_task, tasks, [compilation_mode] * len(tasks), chunksize=1
                 )
+            )
+    if compilation_mode == 1:
+        share_identical_circuits(tasks, results, compilation_mode)
+
+    for result in results:
+        filename_key = result.filename_key
+        codes[filename_key].update(result.codes)
+        output_sizes_exceeding_limit[filename_key].update(
+            length for length in result.output_lengths if length > limit
+        )
+        if digests is not None:
+            digests[filename_key].update(result.digests)
+        if compilation_mode == 1:
+            cairo1_full_function_names[filename_key].update(result.full_function_names)
+            cairo1_tests_functions[filename_key].update(result.tests)
 
 
 def generate_cairo1_tests(
@@ -644,9 +916,15 @@ def main(
     PRECOMPILED_CIRCUITS_DIR: str,
     CIRCUITS_TO_COMPILE: dict[CircuitID, dict],
     compilation_mode: int = 1,
+    n_workers: int | None = None,
+    manifest_file: str | None = MANIFEST_FILE,
 ):
-    """Compiles and writes all circuits to .cairo files"""
-    filenames_used, codes, cairo1_tests_functions, cairo1_full_function_names, files = (
+    """
+    Compiles and writes all circuits to .cairo files, in n_workers processes (None for one per CPU).
+    If manifest_file is given, the files whose circuits and compiler didn't change since the last
+    run (see file_digest) are left untouched, and only the others are written and formatted.
+    """
+    filenames_used, codes, cairo1_tests_functions, cairo1_full_function_names = (
         initialize_compilation(PRECOMPILED_CIRCUITS_DIR, CIRCUITS_TO_COMPILE)
     )
     file_curve_ids = {filename: set() for filename in filenames_used}
@@ -659,6 +937,7 @@ def main(
 
     output_sizes_exceeding_limit = {filename: set() for filename in filenames_used}
     limit = 16
+    circuit_digests = {filename: {} for filename in filenames_used}
     compile_circuits(
         CIRCUITS_TO_COMPILE,
         compilation_mode,
@@ -667,8 +946,41 @@ def main(
         cairo1_tests_functions,
         output_sizes_exceeding_limit,
         limit,
+        n_workers,
+        circuit_digests,
+    )
+    digests = {
+        filename: file_digest(
+            circuit_digests[filename],
+            codes[filename],
+            cairo1_full_function_names[filename],
+            cairo1_tests_functions[filename],
+            file_curve_ids[filename],
+            output_sizes_exceeding_limit[filename],
+            compilation_mode,
+        )
+        for filename in filenames_used
+    }
+    manifest = {}
+    filenames_to_write = set(filenames_used)
+    if manifest_file is not None:
+        manifest = load_manifest(manifest_file)
+        unchanged = unchanged_files(manifest, digests, PRECOMPILED_CIRCUITS_DIR)
+        if unchanged:
+            print(f"Unchanged, not rewritten: {', '.join(sorted(unchanged))}")
+        filenames_to_write -= unchanged
+    if not filenames_to_write:
+        return None
+
+    files = {
+        f: open(f"{PRECOMPILED_CIRCUITS_DIR}{f}.cairo", "w") for f in filenames_to_write
+    }
+    write_headers(
+        files,
+        compilation_mode,
+        output_sizes_exceeding_limit,
+        {f: file_curve_ids[f] for f in filenames_to_write},
     )
-    write_headers(files, compilation_mode, output_sizes_exceeding_limit, file_curve_ids)
     write_compiled_circuits(
         files,
         codes,
@@ -681,8 +993,15 @@ def main(
         file.close()
 
     format_cairo_files_in_parallel(
-        filenames_used, compilation_mode, PRECOMPILED_CIRCUITS_DIR
+        filenames_to_write, compilation_mode, PRECOMPILED_CIRCUITS_DIR
     )
+    if manifest_file is not None:
+        write_manifest(
+            manifest_file,
+            manifest,
+            {f: digests[f] for f in filenames_to_write},
+            PRECOMPILED_CIRCUITS_DIR,
+        )
     return None
 
 
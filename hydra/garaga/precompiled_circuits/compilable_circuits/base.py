@@ -1,3 +1,4 @@
+import os
 import re
 import subprocess
 from abc import ABC, abstractmethod
@@ -285,4 +286,20 @@ def format_cairo_files_in_parallel(
                 future.result()  # Wait for all formatting tasks to complete
         print("Done!")
     elif compilation_mode == 1:
-        subprocess.run(["scarb", "fmt"], check=True, cwd=precompiled_circuits_dir)
+        # `scarb fmt <path>` formats only that file, not the whole package.
+        cairo_files = [
+            os.path.abspath(f"{precompiled_circuits_dir}{f}.cairo")
+            for f in sorted(filenames)
+        ]
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    subprocess.run,
+                    ["scarb", "fmt", file],
+                    check=True,
+                    cwd=precompiled_circuits_dir,
+                )
+                for file in cairo_files
+            ]
+            for future in futures:
+                future.result()
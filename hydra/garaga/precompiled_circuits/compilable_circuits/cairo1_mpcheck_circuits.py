@@ -3,7 +3,11 @@ from typing import Dict, List, Optional, Tuple, Type, Union
 
 import garaga.modulo_circuit_structs as structs
 from garaga.definitions import BLS12_381_ID, BN254_ID, get_irreducible_poly
-from garaga.extension_field_modulo_circuit import ExtensionFieldModuloCircuit, PyFelt
+from garaga.extension_field_modulo_circuit import (
+    LINES_Z_POWERS_DEGREES,
+    ExtensionFieldModuloCircuit,
+    PyFelt,
+)
 from garaga.modulo_circuit import ModuloCircuit
 from garaga.modulo_circuit_structs import (
     E12D,
@@ -63,6 +67,7 @@ class BaseFixedG2PointsMPCheck(BaseEXTFCircuit, ABC):
         n_fixed_g2: int,
         auto_run=True,
         compilation_mode=1,
+        import_z_powers: bool = False,
     ):
         assert compilation_mode == 1, "Compilation mode 1 is required for this circuit"
         if n_pairs and "mp_check_prepare_pairs" not in name:
@@ -77,8 +82,9 @@ class BaseFixedG2PointsMPCheck(BaseEXTFCircuit, ABC):
 
         self.n_pairs = n_pairs
         self.n_fixed_g2 = n_fixed_g2
+        self.import_z_powers = import_z_powers
         super().__init__(
-            name=name,
+            name=f"{name}_zp" if import_z_powers else name,
             curve_id=curve_id,
             auto_run=auto_run,
             compilation_mode=compilation_mode,
@@ -115,6 +121,24 @@ class BaseFixedG2PointsMPCheck(BaseEXTFCircuit, ABC):
         array-like structs we need to specify the size in advance.
         """
 
+    @property
+    def z_powers_degrees(self) -> tuple[int, ...]:
+        """
+        Degrees of the powers of z used by the circuit, passed as input with import_z_powers.
+        """
+        return LINES_Z_POWERS_DEGREES[self.curve_id]
+
+    def _z_input_map(self) -> dict:
+        """
+        Input of the evaluation point z. With import_z_powers, the powers of z of degrees
+        z_powers_degrees, computed once for all the circuits of the verification, are passed instead
+        of being computed again. Off by default: the compiled circuits and their Cairo callers
+        still take z.
+        """
+        if self.import_z_powers:
+            return {"z_powers": (u384Array, len(self.z_powers_degrees))}
+        return {"z": u384}
+
     def _base_input_map(self, bit_type: str) -> dict:
         """
         Base input map for the bit 0, 1, 00, 01, and 10 cases.
@@ -153,7 +177,7 @@ class BaseFixedG2PointsMPCheck(BaseEXTFCircuit, ABC):
         if bit_type in ("1", "01", "10"):
             input_map["c_or_cinv_of_z"] = u384
 
-        input_map["z"] = u384
+        input_map.update(self._z_input_map())
         input_map["ci"] = u384
 
         return input_map
@@ -203,6 +227,11 @@ class BaseFixedG2PointsMPCheck(BaseEXTFCircuit, ABC):
                         )
                     )
         assert len(input) == 0, f"Expected input of length 0, got {len(input)}"
+        if "z_powers" in vars:
+            powers = [None] * self.z_powers_degrees[-1]
+            for degree, power in zip(self.z_powers_degrees, vars["z_powers"]):
+                powers[degree - 1] = power
+            vars["z"] = circuit.import_z_powers(powers)[0]
         # Create the precomputed lines generator
         circuit._precomputed_lines_generator = (
             circuit._create_precomputed_lines_generator()
@@ -440,6 +469,7 @@ class FixedG2MPCheckBitBase(BaseFixedG2PointsMPCheck):
         n_fixed_g2: int = None,
         auto_run: bool = True,
         compilation_mode: int = 1,
+        import_z_powers: bool = False,
     ):
         assert compilation_mode == 1, "Compilation mode 1 is required for this circuit"
         n_pairs = n_pairs if n_pairs is not None else self.DEFAULT_PAIRS
@@ -452,6 +482,7 @@ class FixedG2MPCheckBitBase(BaseFixedG2PointsMPCheck):
             n_fixed_g2=n_fixed_g2,
             auto_run=auto_run,
             compilation_mode=compilation_mode,
+            import_z_powers=import_z_powers,
         )
 
     @property
@@ -490,6 +521,7 @@ class FixedG2MPCheckInitBit(BaseFixedG2PointsMPCheck):
         compilation_mode: int = 1,
         n_pairs: int = 3,
         n_fixed_g2: int = 2,
+        import_z_powers: bool = False,
     ):
         super().__init__(
             name=f"mp_check_init_bit_{n_pairs}P_{n_fixed_g2}F",
@@ -498,6 +530,7 @@ class FixedG2MPCheckInitBit(BaseFixedG2PointsMPCheck):
             n_fixed_g2=n_fixed_g2,
             auto_run=auto_run,
             compilation_mode=compilation_mode,
+            import_z_powers=import_z_powers,
         )
 
     @property
@@ -519,7 +552,7 @@ class FixedG2MPCheckInitBit(BaseFixedG2PointsMPCheck):
             {
                 "R_i_of_z": u384,
                 "c0": u384,
-                "z": u384,
+                **self._z_input_map(),
                 "c_inv_of_z": u384,
             }
         )
@@ -622,6 +655,7 @@ class FixedG2MPCheckFinalizeBN(BaseFixedG2PointsMPCheck):
         n_pairs: int = 3,
         n_fixed_g2: int = 2,
         compilation_mode: int = 1,
+        import_z_powers: bool = False,
     ):
         self.max_q_degree = multi_pairing_check.get_max_Q_degree(curve_id, n_pairs)
 
@@ -632,8 +666,13 @@ class FixedG2MPCheckFinalizeBN(BaseFixedG2PointsMPCheck):
             n_fixed_g2=n_fixed_g2,
             auto_run=auto_run,
             compilation_mode=compilation_mode,
+            import_z_powers=import_z_powers,
         )
 
+    @property
+    def z_powers_degrees(self) -> tuple[int, ...]:
+        return tuple(range(1, 13))
+
     @property
     def input_map(self):
         if self.curve_id == BLS12_381_ID:
@@ -657,7 +696,7 @@ class FixedG2MPCheckFinalizeBN(BaseFixedG2PointsMPCheck):
                 "R_n_minus_1": E12D,
                 "c_n_minus_3": u384,
                 "w_of_z": u384,
-                "z": u384,
+                **self._z_input_map(),
                 "c_inv_frob_1_of_z": u384,
                 "c_frob_2_of_z": u384,
                 "c_inv_frob_3_of_z": u384,
@@ -759,6 +798,7 @@ class MPCheckFinalizeBLS(BaseFixedG2PointsMPCheck):
         auto_run: bool = True,
         compilation_mode: int = 1,
         n_pairs: int = 3,
+        import_z_powers: bool = False,
     ):
         self.max_q_degree = multi_pairing_check.get_max_Q_degree(curve_id, n_pairs)
         super().__init__(
@@ -768,15 +808,20 @@ class MPCheckFinalizeBLS(BaseFixedG2PointsMPCheck):
             n_fixed_g2=None,
             auto_run=auto_run,
             compilation_mode=compilation_mode,
+            import_z_powers=import_z_powers,
         )
 
+    @property
+    def z_powers_degrees(self) -> tuple[int, ...]:
+        return tuple(range(1, 13))
+
     @property
     def input_map(self):
         return {
             "R_n_minus_1": E12D,
             "c_n_minus_2": u384,
             "w_of_z": u384,
-            "z": u384,
+            **self._z_input_map(),
             "c_inv_frob_1_of_z": u384,
             "previous_lhs": u384,
             "R_n_minus_2_of_z": u384,
@@ -898,10 +943,25 @@ class MPCheckPreparePairs(BaseFixedG2PointsMPCheck):
 
 
 class MPCheckPrepareLambdaRootEvaluations(BaseFixedG2PointsMPCheck):
-    def __init__(self, curve_id: int, auto_run: bool = True, compilation_mode: int = 1):
+    def __init__(
+        self,
+        curve_id: int,
+        auto_run: bool = True,
+        compilation_mode: int = 1,
+        export_z_powers: bool = False,
+    ):
+        """
+        With export_z_powers, also outputs the powers z, ..., z^12 of z, for the circuits of the
+        verification created with import_z_powers.
+        """
         assert compilation_mode == 1, "Compilation mode 1 is required for this circuit"
+        self.export_z_powers = export_z_powers
         super().__init__(
-            name="mp_check_prepare_lambda_root",
+            name=(
+                "mp_check_prepare_lambda_root_zp"
+                if export_z_powers
+                else "mp_check_prepare_lambda_root"
+            ),
             curve_id=curve_id,
             n_pairs=2,  # Mocked value, not used in practice.
             n_fixed_g2=None,
@@ -928,7 +988,9 @@ class MPCheckPrepareLambdaRootEvaluations(BaseFixedG2PointsMPCheck):
     def _execute_circuit_logic(
         self, circuit: multi_pairing_check.MultiPairingCheckCircuit, vars
     ):
-        circuit.create_powers_of_Z(Z=vars["z"], max_degree=11)
+        circuit.create_powers_of_Z(
+            Z=vars["z"], max_degree=12 if self.export_z_powers else 11
+        )
 
         c_or_c_inv = vars[
             "lambda_root" if self.curve_id == BN254_ID else "lambda_root_inverse"
@@ -1020,6 +1082,9 @@ class MPCheckPrepareLambdaRootEvaluations(BaseFixedG2PointsMPCheck):
                 u384("c_inv_frob_3_of_z", elmts=[c_inv_frob_3_of_z])
             )
 
+        if self.export_z_powers:
+            circuit.extend_struct_output(u384Array("z_powers", circuit.z_powers[:12]))
+
         return circuit
 
 
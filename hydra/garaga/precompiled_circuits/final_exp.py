@@ -6,7 +6,14 @@ Kept for reference/in case we need it in the future.
 import copy
 from random import randint
 
-from garaga.definitions import BLS12_381_ID, BN254_ID, CURVES, CurveID, get_sparsity
+from garaga.definitions import (
+    BLS12_381_ID,
+    BN254_ID,
+    CURVES,
+    CurveID,
+    get_curve_context,
+    get_sparsity,
+)
 from garaga.extension_field_modulo_circuit import (
     AccPolyInstructionType,
     ExtensionFieldModuloCircuit,
@@ -18,7 +25,7 @@ from garaga.hints.extf_mul import (
     nondeterministic_extension_field_mul_divmod,
     nondeterministic_square_torus,
 )
-from garaga.hints.frobenius import generate_frobenius_maps, get_V_torus_powers
+from garaga.hints.frobenius import get_V_torus_powers
 from garaga.modulo_circuit import WriteOps
 from garaga.poseidon_transcript import CairoPoseidonTranscript
 
@@ -36,8 +43,8 @@ class FinalExpTorusCircuit(ExtensionFieldModuloCircuit):
         self.frobenius_maps = {}
         self.v_torus_powers_inv = {}
         for i in [1, 2, 3]:
-            _, self.frobenius_maps[i] = generate_frobenius_maps(
-                curve_id=curve_id, extension_degree=extension_degree, frob_power=i
+            self.frobenius_maps[i] = get_curve_context(curve_id).frobenius_maps(
+                extension_degree=extension_degree, frob_power=i
             )
             self.v_torus_powers_inv[i] = get_V_torus_powers(
                 curve_id, extension_degree, i
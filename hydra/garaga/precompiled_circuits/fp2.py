@@ -52,18 +52,30 @@ class Fp2Circuits(ModuloCircuit):
             for x, y in zip(X, Y)
         )
         # xy = (x0 + i*x1) * (y0 + i*y1) = (x0*y0 - x1*y1) + i * (x0*y1 + x1*y0)
-        return [
-            self.sub(
-                self.mul(X[0], Y[0], comment="Fp2 mul start"),
-                self.mul(X[1], Y[1]),
-                comment="Fp2 mul real part end",
-            ),
-            self.add(
-                self.mul(X[0], Y[1]),
-                self.mul(X[1], Y[0]),
-                comment="Fp2 mul imag part end",
-            ),
-        ]
+        # Products with a constant zero are skipped.
+        skip = {
+            (i, j)
+            for i in range(2)
+            for j in range(2)
+            if self._constant_value(X[i]) == 0 or self._constant_value(Y[j]) == 0
+        }
+        x0y0 = None if (0, 0) in skip else self.mul(X[0], Y[0], "Fp2 mul start")
+        x1y1 = None if (1, 1) in skip else self.mul(X[1], Y[1])
+        if x1y1 is None:
+            real = x0y0 if x0y0 is not None else self.set_or_get_constant(0)
+        elif x0y0 is None:
+            real = self.neg(x1y1, comment="Fp2 mul real part end")
+        else:
+            real = self.sub(x0y0, x1y1, comment="Fp2 mul real part end")
+        x0y1 = None if (0, 1) in skip else self.mul(X[0], Y[1])
+        x1y0 = None if (1, 0) in skip else self.mul(X[1], Y[0])
+        if x0y1 is None:
+            imag = x1y0 if x1y0 is not None else self.set_or_get_constant(0)
+        elif x1y0 is None:
+            imag = x0y1
+        else:
+            imag = self.add(x0y1, x1y0, comment="Fp2 mul imag part end")
+        return [real, imag]
 
     def fp2_mul_by_non_residue(self, X: list[ModuloCircuitElement]):
         assert len(X) == 2 and all(isinstance(x, ModuloCircuitElement) for x in X)
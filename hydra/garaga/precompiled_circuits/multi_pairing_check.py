@@ -5,9 +5,9 @@ from garaga.definitions import (
     G1Point,
     G2Point,
     get_base_field,
+    get_curve_context,
     get_sparsity,
 )
-from garaga.hints.frobenius import generate_frobenius_maps
 from garaga.hints.multi_miller_witness import get_final_exp_witness
 from garaga.hints.tower_backup import E6, E12
 from garaga.modulo_circuit import ModuloCircuitElement, PyFelt, WriteOps
@@ -133,8 +133,8 @@ class MultiPairingCheckCircuit(MultiMillerLoopCircuit):
         )
         self.frobenius_maps = {}
         for i in [1, 2, 3]:
-            _, self.frobenius_maps[i] = generate_frobenius_maps(
-                curve_id=curve_id, extension_degree=self.extension_degree, frob_power=i
+            self.frobenius_maps[i] = get_curve_context(curve_id).frobenius_maps(
+                extension_degree=self.extension_degree, frob_power=i
             )
 
     def frobenius(
@@ -8,7 +8,13 @@ import hashlib
 from typing import Protocol, TypeVar
 
 from garaga.algebra import Polynomial, PyFelt, RationalFunction
-from garaga.definitions import CURVES, CurveID, G1Point, get_base_field
+from garaga.definitions import (
+    CURVES,
+    CurveID,
+    G1Point,
+    get_base_field,
+    get_curve_context,
+)
 
 T = TypeVar("T", bound="HashProtocol")
 
@@ -193,9 +199,7 @@ def hash_to_curve(
 
 def map_to_curve(field_element: PyFelt, curve_id: CurveID) -> G1Point:
     field = get_base_field(curve_id)
-    a = field(CURVES[curve_id.value].swu_params.A)
-    b = field(CURVES[curve_id.value].swu_params.B)
-    z = field(CURVES[curve_id.value].swu_params.Z)
+    a, b, z = get_curve_context(curve_id).swu_params
 
     u = field_element
     zeta_u2 = z * u**2
@@ -412,7 +416,7 @@ def get_isogeny_to_g2_map(
 def apply_isogeny(pt: G1Point) -> G1Point:
     assert pt.iso_point == True, f"Point {pt} is not an iso point"
     field = get_base_field(pt.curve_id)
-    x_rational, y_rational = get_isogeny_to_g1_map(pt.curve_id)
+    x_rational, y_rational = get_curve_context(pt.curve_id).isogeny_to_g1_map
     x_affine = x_rational.evaluate(field(pt.x))
     y_affine = y_rational.evaluate(field(pt.x)) * field(pt.y)
 
@@ -1,5 +1,5 @@
 from garaga import garaga_rs
-from garaga.definitions import G1G2Pair, G1Point
+from garaga.definitions import G1G2Pair, G1Point, pack_ints_le
 from garaga.starknet.groth16_contract_generator.parsing_utils import (
     Groth16Proof,
     Groth16VerifyingKey,
@@ -80,7 +80,8 @@ def _groth16_calldata_from_vk_and_proof_rust(
 
     return garaga_rs.get_groth16_calldata(
         proof.flatten(),
-        vk.flatten(),
+        # The verifying key (IC points included) is handed over as a packed buffer.
+        pack_ints_le(vk.flatten()),
         proof.curve_id.value,
         proof.image_id,
         proof.journal,
@@ -6,7 +6,13 @@ import os
 from pathlib import Path
 from typing import Any, List
 
-from garaga.definitions import CurveID, G1Point, G2Point
+from garaga.definitions import (
+    DEFAULT_BATCH_SUBGROUP_CHECK_SOUNDNESS_BITS,
+    CurveID,
+    G1Point,
+    G2Point,
+    batch_is_in_prime_order_subgroup,
+)
 from garaga.hints import io
 from garaga.hints.io import split_128
 from garaga.modulo_circuit_structs import (
@@ -489,6 +495,35 @@ class Groth16Proof:
             lst.extend(self.public_inputs)
         return lst
 
+    @staticmethod
+    def check_points_in_subgroups(
+        proofs: list["Groth16Proof"],
+        soundness_bits: int = DEFAULT_BATCH_SUBGROUP_CHECK_SOUNDNESS_BITS,
+    ) -> list[bool]:
+        """
+        Checks that the A, C points of each proof are in G1 and its B point is in G2.
+        The points of all proofs on the same curve are checked together, with one randomised
+        batch check per group (see batch_is_in_prime_order_subgroup).
+
+        Returns:
+            list[bool]: For each proof, True if all its points are in their subgroup.
+        """
+        valid = [True] * len(proofs)
+        for curve_id in {proof.curve_id for proof in proofs}:
+            indexes = [
+                i for i, proof in enumerate(proofs) if proof.curve_id == curve_id
+            ]
+            g1_valid = batch_is_in_prime_order_subgroup(
+                [p for i in indexes for p in (proofs[i].a, proofs[i].c)],
+                soundness_bits,
+            )
+            g2_valid = batch_is_in_prime_order_subgroup(
+                [proofs[i].b for i in indexes], soundness_bits
+            )
+            for j, i in enumerate(indexes):
+                valid[i] = g1_valid[2 * j] and g1_valid[2 * j + 1] and g2_valid[j]
+        return valid
+
 
 class ExitCode:
     def __init__(self, system, user):
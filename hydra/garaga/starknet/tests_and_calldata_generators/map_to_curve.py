@@ -2,7 +2,13 @@ from dataclasses import dataclass
 
 import garaga.modulo_circuit_structs as structs
 from garaga.algebra import PyFelt
-from garaga.definitions import CURVES, CurveID, G1Point, get_base_field
+from garaga.definitions import (
+    CURVES,
+    CurveID,
+    G1Point,
+    get_base_field,
+    get_curve_context,
+)
 from garaga.hints.io import bigint_split, int_to_u384
 from garaga.signature import apply_isogeny, hash_to_field
 from garaga.starknet.tests_and_calldata_generators.msm import MSMCalldataBuilder
@@ -46,9 +52,7 @@ class HashToCurveHint:
 
 def build_map_to_curve_hint(u: PyFelt) -> tuple[G1Point, MapToCurveHint]:
     field = get_base_field(CurveID.BLS12_381)
-    a = field(CURVES[CurveID.BLS12_381.value].swu_params.A)
-    b = field(CURVES[CurveID.BLS12_381.value].swu_params.B)
-    z = field(CURVES[CurveID.BLS12_381.value].swu_params.Z)
+    a, b, z = get_curve_context(CurveID.BLS12_381).swu_params
 
     zeta_u2 = z * u**2
     ta = zeta_u2**2 + zeta_u2
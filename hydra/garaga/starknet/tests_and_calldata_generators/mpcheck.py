@@ -6,6 +6,7 @@ from garaga import garaga_rs
 from garaga import modulo_circuit_structs as structs
 from garaga.algebra import Polynomial, PyFelt
 from garaga.definitions import CurveID, G1G2Pair, get_base_field, get_irreducible_poly
+from garaga.hints.verification import VerificationLevel, resolve_verification_level
 from garaga.poseidon_transcript import CairoPoseidonTranscript
 from garaga.precompiled_circuits.multi_miller_loop import precompute_lines
 from garaga.precompiled_circuits.multi_pairing_check import (
@@ -96,14 +97,11 @@ class MPCheckCalldataBuilder:
         mpcheck_circuit.write_p_and_q_raw(p_q_input)
         return mpcheck_circuit
 
-    def _retrieve_Pis_Qis_and_Ris_from_circuit(
+    def _retrieve_Pis_and_Ris_from_circuit(
         self, mpcheck_circuit: MultiPairingCheckCircuit
-    ) -> tuple[list[list[PyFelt]], list[list[PyFelt]], list[list[PyFelt]]]:
+    ) -> tuple[list[list[list[PyFelt]]], list[list[PyFelt]]]:
         relations = mpcheck_circuit.accumulate_poly_instructions[0]
-        Qis = relations.Qis
-        Pis = relations.Pis
-        Ris = relations.Ris
-        return Pis, Qis, Ris
+        return relations.Pis, relations.Ris
 
     def _get_passed_Ris_from_Ris(self, Ris: list[list[PyFelt]]) -> list[list[PyFelt]]:
         passed_Ris = (
@@ -180,14 +178,32 @@ class MPCheckCalldataBuilder:
         # print(f"P_of_z : {io.int_to_u384(P_of_z)}")
         assert lhs == big_Q_of_z * P_of_z, "Check failed."
 
-    @lru_cache(maxsize=1)
     def build_mpcheck_hint(
-        self,
+        self, verification_level: VerificationLevel | str | None = None
     ) -> tuple[
         structs.Cairo1SerializableStruct, structs.Cairo1SerializableStruct | None
     ]:
         """
         Return MPCheckHint struct and small_Q struct if extra_miller_loop_result is True
+        The RLC equation is sanity checked according to verification_level, or to the global
+        verification level if None (see garaga.hints.verification).
+        """
+        mpcheck_hint, small_Q_struct, rlc_equation = self._compute_mpcheck_hint()
+        if resolve_verification_level(verification_level) != VerificationLevel.OFF:
+            self._sanity_check_verify_rlc_equation(*rlc_equation)
+        return mpcheck_hint, small_Q_struct
+
+    @lru_cache(maxsize=1)
+    def _compute_mpcheck_hint(
+        self,
+    ) -> tuple[
+        structs.Cairo1SerializableStruct,
+        structs.Cairo1SerializableStruct | None,
+        tuple,
+    ]:
+        """
+        Return MPCheckHint struct, small_Q struct and the terms of the RLC equation checked by
+        build_mpcheck_hint. Doesn't depend on the verification level, so that it can be cached.
         """
         mpcheck_circuit = self._init_circuit()
         transcript = self._init_transcript()
@@ -197,7 +213,7 @@ class MPCheckCalldataBuilder:
                 len(self.pairs), self.extra_miller_loop_result()
             )
         )
-        Pis, Qis, Ris = self._retrieve_Pis_Qis_and_Ris_from_circuit(mpcheck_circuit)
+        Pis, Ris = self._retrieve_Pis_and_Ris_from_circuit(mpcheck_circuit)
         passed_Ris = self._get_passed_Ris_from_Ris(Ris)
 
         c0 = self._hash_hints_and_get_base_random_rlc_coeff(
@@ -213,20 +229,21 @@ class MPCheckCalldataBuilder:
             1 if self.curve_id == CurveID.BN254 else 0
         )
 
-        ci, cis, big_Q = c0, [], Polynomial.zero(self.field.p)
-        for i in range(n_relations_with_ci):
-            # print(f"c_{i} : {io.int_to_u384(ci)}")
-            cis.append(ci)
-            big_Q += Qis[i] * ci
-            ci *= ci
+        cis = [c0]
+        for _ in range(1, n_relations_with_ci):
+            cis.append(cis[-1] * cis[-1])
 
-        big_Q_coeffs = big_Q.get_coeffs()
+        # The quotients Qi and big_Q = Σ(ci * Qi) are computed in a single batched call.
+        big_Q_coeffs = [
+            self.field(c)
+            for c in mpcheck_circuit.compute_pending_quotients(rlc_coeffs=cis)
+        ] or [self.field.zero()]
+        big_Q = Polynomial(big_Q_coeffs[:])
         big_Q_coeffs.extend(
             [self.field.zero()] * (self.big_Q_expected_len - len(big_Q_coeffs))
         )
 
         z = self._hash_big_Q_and_get_z(transcript, big_Q_coeffs)
-        self._sanity_check_verify_rlc_equation(z, cis, Pis, big_Q, Ris)
 
         if self.curve_id == CurveID.BN254:
             hint_struct_list_init = [
@@ -236,7 +253,9 @@ class MPCheckCalldataBuilder:
             hint_struct_list_init = []
 
         if self.include_miller_loop_result:
-            small_Q = Qis[-1].get_coeffs()
+            small_Q = (
+                mpcheck_circuit.accumulate_poly_instructions[0].Qis[-1].get_coeffs()
+            )
             small_Q = small_Q + [self.field.zero()] * (11 - len(small_Q))
             small_Q_struct = structs.E12DMulQuotient(name="small_Q", elmts=small_Q)
         else:
@@ -268,6 +287,7 @@ class MPCheckCalldataBuilder:
                 ],
             ),
             small_Q_struct,
+            (z, cis, Pis, big_Q, Ris),
         )
 
     def _get_input_structs(self) -> list[structs.Cairo1SerializableStruct]:
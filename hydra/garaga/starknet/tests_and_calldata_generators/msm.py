@@ -1,12 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
 
 from garaga import garaga_rs
 from garaga import modulo_circuit_structs as structs
 from garaga.algebra import FunctionFelt, PyFelt
-from garaga.definitions import CURVES, STARK, CurveID, G1Point, get_base_field
+from garaga.definitions import (
+    CURVES,
+    STARK,
+    CurveID,
+    G1Point,
+    G1PointBatch,
+    TwistedEdwardsCurve,
+    get_base_field,
+)
 from garaga.hints import ecip, io
 from garaga.hints.neg_3 import neg_3_base_le
+from garaga.hints.verification import VerificationLevel, resolve_verification_level
 from garaga.poseidon_transcript import CairoPoseidonTranscript
 
 
@@ -42,6 +52,27 @@ class MSMCalldataBuilder:
     def __hash__(self) -> int:
         return hash((self.curve_id, tuple(self.points), tuple(self.scalars)))
 
+    @staticmethod
+    def from_twistededwards(
+        curve_id: CurveID,
+        points_twisted: list[tuple[int, int]],
+        scalars: list[int],
+        risc0_mode: bool = False,
+    ) -> "MSMCalldataBuilder":
+        """
+        Builds the MSM calldata builder from points in twisted Edwards form (e.g. ED25519 points),
+        converted to the Weierstrass model with a single modular inversion.
+        """
+        curve = CURVES[curve_id.value]
+        assert isinstance(
+            curve, TwistedEdwardsCurve
+        ), f"{curve_id} is not a twisted Edwards curve"
+        points = [
+            G1Point(x, y, curve_id)
+            for x, y in curve.to_weierstrass_batch(points_twisted)
+        ]
+        return MSMCalldataBuilder(curve_id, points, scalars, risc0_mode)
+
     @property
     def field(self):
         return get_base_field(self.curve_id)
@@ -50,6 +81,13 @@ class MSMCalldataBuilder:
     def msm_size(self):
         return len(self.scalars)
 
+    @lru_cache(maxsize=2)
+    def points_batch(self) -> G1PointBatch:
+        """
+        The points packed once, for the garaga_rs calls.
+        """
+        return G1PointBatch.from_points(self.points, self.curve_id)
+
     @lru_cache(maxsize=2)
     def scalars_split(self) -> tuple[list[int], list[int]]:
         """
@@ -127,24 +165,64 @@ class MSMCalldataBuilder:
             ],
         )
 
-    @lru_cache(maxsize=2)
-    def build_msm_hints(self) -> tuple[structs.Struct, structs.Struct]:
+    def build_msm_hints(
+        self, verification_level: VerificationLevel | str | None = None
+    ) -> tuple[structs.Struct, structs.Struct]:
         """
         Returns the MSMHint and the DerivePointFromXHint
+        The hints are checked with verify_ecip according to verification_level, or to the global
+        verification level if None (see garaga.hints.verification).
+        """
+        msm_hint, derive_point_from_x_hint, (x_coordinate, ecip_checks) = (
+            self._compute_msm_hints()
+        )
+
+        #############################
+        ######## Sanity check #######
+        verification_level = resolve_verification_level(verification_level)
+        if verification_level != VerificationLevel.OFF:
+            _x, _y, _ = ecip.derive_ec_point_from_X(x_coordinate, self.curve_id)
+            _A0 = G1Point(curve_id=self.curve_id, x=_x.value, y=_y.value)
+            for points, scalars, Q, sum_dlog in ecip_checks:
+                ecip.verify_ecip(
+                    points,
+                    scalars,
+                    Q=Q,
+                    sum_dlog=sum_dlog,
+                    A0=_A0,
+                    verification_level=verification_level,
+                )
+        #############################
+
+        return msm_hint, derive_point_from_x_hint
+
+    @lru_cache(maxsize=2)
+    def _compute_msm_hints(
+        self,
+    ) -> tuple[structs.Struct, structs.Struct, tuple[int, list[tuple]]]:
+        """
+        Returns the MSMHint, the DerivePointFromXHint and the values checked by build_msm_hints.
+        Doesn't depend on the verification level, so that it can be cached.
         """
         scalars_low, scalars_high = self.scalars_split()
+        points_batch = self.points_batch()
+
+        # The low hint is independent of the high and shifted ones, which are chained.
+        # garaga_rs releases the GIL in zk_ecip_hint, so both run concurrently.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            low_hint = executor.submit(ecip.zk_ecip_hint, points_batch, scalars_low)
+            _Q_high, _SumDlogDivHigh = ecip.zk_ecip_hint(points_batch, scalars_high)
+            _Q_high_shifted, _SumDlogDivHighShifted = ecip.zk_ecip_hint(
+                [_Q_high], [2**128]
+            )
+            _Q_low, _SumDlogDivLow = low_hint.result()
 
-        _Q_low, _SumDlogDivLow = ecip.zk_ecip_hint(self.points, scalars_low)
         _SumDlogDivLow.validate_degrees(
             msm_size=self.msm_size, batched=not self.risc0_mode
         )
-
-        _Q_high, _SumDlogDivHigh = ecip.zk_ecip_hint(self.points, scalars_high)
         _SumDlogDivHigh.validate_degrees(
             msm_size=self.msm_size, batched=not self.risc0_mode
         )
-
-        _Q_high_shifted, _SumDlogDivHighShifted = ecip.zk_ecip_hint([_Q_high], [2**128])
         _SumDlogDivHighShifted.validate_degrees(msm_size=1, batched=not self.risc0_mode)
 
         self._hash_inputs_points_scalars_and_result_points(
@@ -166,32 +244,11 @@ class MSMCalldataBuilder:
         _x_coordinate = self._retrieve_random_x_coordinate(sum_dlog_div_maybe_batched)
         derive_point_from_x_hint = self.build_derive_point_from_x_hint(_x_coordinate)
 
-        #############################
-        ######## Sanity check #######
-        _x, _y, _ = ecip.derive_ec_point_from_X(_x_coordinate, self.curve_id)
-        _A0 = G1Point(curve_id=self.curve_id, x=_x.value, y=_y.value)
-        ecip.verify_ecip(
-            self.points,
-            self.scalars_split()[0],
-            Q=_Q_low,
-            sum_dlog=_SumDlogDivLow,
-            A0=_A0,
-        )
-        ecip.verify_ecip(
-            self.points,
-            self.scalars_split()[1],
-            Q=_Q_high,
-            sum_dlog=_SumDlogDivHigh,
-            A0=_A0,
-        )
-        ecip.verify_ecip(
-            [_Q_high],
-            [2**128],
-            Q=_Q_high_shifted,
-            sum_dlog=_SumDlogDivHighShifted,
-            A0=_A0,
-        )
-        #############################
+        ecip_checks = [
+            (self.points, scalars_low, _Q_low, _SumDlogDivLow),
+            (self.points, scalars_high, _Q_high, _SumDlogDivHigh),
+            ([_Q_high], [2**128], _Q_high_shifted, _SumDlogDivHighShifted),
+        ]
 
         if not self.risc0_mode:
             return (
@@ -213,6 +270,7 @@ class MSMCalldataBuilder:
                     ],
                 ),
                 derive_point_from_x_hint,
+                (_x_coordinate, ecip_checks),
             )
         else:
             return (
@@ -230,6 +288,7 @@ class MSMCalldataBuilder:
                     ],
                 ),
                 derive_point_from_x_hint,
+                (_x_coordinate, ecip_checks),
             )
 
     def _get_input_structs(
@@ -304,8 +363,9 @@ class MSMCalldataBuilder:
                     ],
                 )
             )
-        inputs.append(self.build_msm_hints()[0])  # msm_hint
-        inputs.append(self.build_msm_hints()[1])  # derive_point_from_x_hint
+        msm_hint, derive_point_from_x_hint = self.build_msm_hints()
+        inputs.append(msm_hint)
+        inputs.append(derive_point_from_x_hint)
         inputs.append(
             structs.StructSpan(
                 name="points",
@@ -377,7 +437,7 @@ class MSMCalldataBuilder:
         serialize_as_pure_felt252_array=False,
     ) -> list[int]:
         return garaga_rs.msm_calldata_builder(
-            [value for point in self.points for value in [point.x, point.y]],
+            self.points_batch().buffer,
             self.scalars,
             self.curve_id.value,
             include_digits_decomposition,
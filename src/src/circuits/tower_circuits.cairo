@@ -528,36 +528,33 @@ pub fn run_BLS12_381_E12T_FROBENIUS_CUBE_circuit(M: E12T) -> (E12T,) {
     let t4 = circuit_sub(in0, in12);
     let t5 = circuit_sub(in0, in14);
     let t6 = circuit_sub(in0, in16);
-    let t7 = circuit_mul(in0, in7); // Fp2 mul start
-    let t8 = circuit_mul(in1, t2);
-    let t9 = circuit_sub(t7, t8); // Fp2 mul real part end
-    let t10 = circuit_mul(in0, t2);
-    let t11 = circuit_mul(in1, in7);
-    let t12 = circuit_add(t10, t11); // Fp2 mul imag part end
-    let t13 = circuit_mul(in2, in9);
-    let t14 = circuit_mul(in2, t3);
-    let t15 = circuit_mul(in3, in11); // Fp2 mul start
-    let t16 = circuit_mul(in4, t4);
-    let t17 = circuit_sub(t15, t16); // Fp2 mul real part end
-    let t18 = circuit_mul(in3, t4);
-    let t19 = circuit_mul(in4, in11);
-    let t20 = circuit_add(t18, t19); // Fp2 mul imag part end
-    let t21 = circuit_mul(in3, in13); // Fp2 mul start
-    let t22 = circuit_mul(in3, t5);
-    let t23 = circuit_sub(t21, t22); // Fp2 mul real part end
-    let t24 = circuit_mul(in3, t5);
-    let t25 = circuit_mul(in3, in13);
-    let t26 = circuit_add(t24, t25); // Fp2 mul imag part end
-    let t27 = circuit_mul(in4, in15); // Fp2 mul start
-    let t28 = circuit_mul(in3, t6);
-    let t29 = circuit_sub(t27, t28); // Fp2 mul real part end
-    let t30 = circuit_mul(in4, t6);
-    let t31 = circuit_mul(in3, in15);
-    let t32 = circuit_add(t30, t31); // Fp2 mul imag part end
+    let t7 = circuit_mul(in1, t2);
+    let t8 = circuit_sub(in0, t7); // Fp2 mul real part end
+    let t9 = circuit_mul(in1, in7);
+    let t10 = circuit_mul(in2, in9);
+    let t11 = circuit_mul(in2, t3);
+    let t12 = circuit_mul(in3, in11); // Fp2 mul start
+    let t13 = circuit_mul(in4, t4);
+    let t14 = circuit_sub(t12, t13); // Fp2 mul real part end
+    let t15 = circuit_mul(in3, t4);
+    let t16 = circuit_mul(in4, in11);
+    let t17 = circuit_add(t15, t16); // Fp2 mul imag part end
+    let t18 = circuit_mul(in3, in13); // Fp2 mul start
+    let t19 = circuit_mul(in3, t5);
+    let t20 = circuit_sub(t18, t19); // Fp2 mul real part end
+    let t21 = circuit_mul(in3, t5);
+    let t22 = circuit_mul(in3, in13);
+    let t23 = circuit_add(t21, t22); // Fp2 mul imag part end
+    let t24 = circuit_mul(in4, in15); // Fp2 mul start
+    let t25 = circuit_mul(in3, t6);
+    let t26 = circuit_sub(t24, t25); // Fp2 mul real part end
+    let t27 = circuit_mul(in4, t6);
+    let t28 = circuit_mul(in3, in15);
+    let t29 = circuit_add(t27, t28); // Fp2 mul imag part end
 
     let modulus = get_BLS12_381_modulus(); // BLS12_381 prime field modulus
 
-    let mut circuit_inputs = (t1, t0, t9, t12, t13, t14, t17, t20, t23, t26, t29, t32).new_inputs();
+    let mut circuit_inputs = (t1, t0, t8, t9, t10, t11, t14, t17, t20, t23, t26, t29).new_inputs();
     // Prefill constants:
     circuit_inputs = circuit_inputs.next_2([0x0, 0x0, 0x0, 0x0]); // in0
     circuit_inputs = circuit_inputs.next_2([0x1, 0x0, 0x0, 0x0]); // in1
@@ -600,16 +597,16 @@ pub fn run_BLS12_381_E12T_FROBENIUS_CUBE_circuit(M: E12T) -> (E12T,) {
     let res: E12T = E12T {
         c0b0a0: outputs.get_output(t1),
         c0b0a1: outputs.get_output(t0),
-        c0b1a0: outputs.get_output(t9),
-        c0b1a1: outputs.get_output(t12),
-        c0b2a0: outputs.get_output(t13),
-        c0b2a1: outputs.get_output(t14),
-        c1b0a0: outputs.get_output(t17),
-        c1b0a1: outputs.get_output(t20),
-        c1b1a0: outputs.get_output(t23),
-        c1b1a1: outputs.get_output(t26),
-        c1b2a0: outputs.get_output(t29),
-        c1b2a1: outputs.get_output(t32),
+        c0b1a0: outputs.get_output(t8),
+        c0b1a1: outputs.get_output(t9),
+        c0b2a0: outputs.get_output(t10),
+        c0b2a1: outputs.get_output(t11),
+        c1b0a0: outputs.get_output(t14),
+        c1b0a1: outputs.get_output(t17),
+        c1b1a0: outputs.get_output(t20),
+        c1b1a1: outputs.get_output(t23),
+        c1b2a0: outputs.get_output(t26),
+        c1b2a1: outputs.get_output(t29),
     };
     return (res,);
 }
@@ -758,36 +755,33 @@ pub fn run_BLS12_381_E12T_FROBENIUS_circuit(M: E12T) -> (E12T,) {
     let t4 = circuit_sub(in0, in15);
     let t5 = circuit_sub(in0, in17);
     let t6 = circuit_sub(in0, in19);
-    let t7 = circuit_mul(in0, in10); // Fp2 mul start
-    let t8 = circuit_mul(in1, t2);
-    let t9 = circuit_sub(t7, t8); // Fp2 mul real part end
-    let t10 = circuit_mul(in0, t2);
-    let t11 = circuit_mul(in1, in10);
-    let t12 = circuit_add(t10, t11); // Fp2 mul imag part end
-    let t13 = circuit_mul(in2, in12);
-    let t14 = circuit_mul(in2, t3);
-    let t15 = circuit_mul(in3, in14); // Fp2 mul start
-    let t16 = circuit_mul(in4, t4);
-    let t17 = circuit_sub(t15, t16); // Fp2 mul real part end
-    let t18 = circuit_mul(in3, t4);
-    let t19 = circuit_mul(in4, in14);
-    let t20 = circuit_add(t18, t19); // Fp2 mul imag part end
-    let t21 = circuit_mul(in5, in16); // Fp2 mul start
-    let t22 = circuit_mul(in5, t5);
-    let t23 = circuit_sub(t21, t22); // Fp2 mul real part end
-    let t24 = circuit_mul(in5, t5);
-    let t25 = circuit_mul(in5, in16);
-    let t26 = circuit_add(t24, t25); // Fp2 mul imag part end
-    let t27 = circuit_mul(in6, in18); // Fp2 mul start
-    let t28 = circuit_mul(in7, t6);
-    let t29 = circuit_sub(t27, t28); // Fp2 mul real part end
-    let t30 = circuit_mul(in6, t6);
-    let t31 = circuit_mul(in7, in18);
-    let t32 = circuit_add(t30, t31); // Fp2 mul imag part end
+    let t7 = circuit_mul(in1, t2);
+    let t8 = circuit_sub(in0, t7); // Fp2 mul real part end
+    let t9 = circuit_mul(in1, in10);
+    let t10 = circuit_mul(in2, in12);
+    let t11 = circuit_mul(in2, t3);
+    let t12 = circuit_mul(in3, in14); // Fp2 mul start
+    let t13 = circuit_mul(in4, t4);
+    let t14 = circuit_sub(t12, t13); // Fp2 mul real part end
+    let t15 = circuit_mul(in3, t4);
+    let t16 = circuit_mul(in4, in14);
+    let t17 = circuit_add(t15, t16); // Fp2 mul imag part end
+    let t18 = circuit_mul(in5, in16); // Fp2 mul start
+    let t19 = circuit_mul(in5, t5);
+    let t20 = circuit_sub(t18, t19); // Fp2 mul real part end
+    let t21 = circuit_mul(in5, t5);
+    let t22 = circuit_mul(in5, in16);
+    let t23 = circuit_add(t21, t22); // Fp2 mul imag part end
+    let t24 = circuit_mul(in6, in18); // Fp2 mul start
+    let t25 = circuit_mul(in7, t6);
+    let t26 = circuit_sub(t24, t25); // Fp2 mul real part end
+    let t27 = circuit_mul(in6, t6);
+    let t28 = circuit_mul(in7, in18);
+    let t29 = circuit_add(t27, t28); // Fp2 mul imag part end
 
     let modulus = get_BLS12_381_modulus(); // BLS12_381 prime field modulus
 
-    let mut circuit_inputs = (t1, t0, t9, t12, t13, t14, t17, t20, t23, t26, t29, t32).new_inputs();
+    let mut circuit_inputs = (t1, t0, t8, t9, t10, t11, t14, t17, t20, t23, t26, t29).new_inputs();
     // Prefill constants:
 
     circuit_inputs = circuit_inputs
@@ -811,16 +805,16 @@ pub fn run_BLS12_381_E12T_FROBENIUS_circuit(M: E12T) -> (E12T,) {
     let res: E12T = E12T {
         c0b0a0: outputs.get_output(t1),
         c0b0a1: outputs.get_output(t0),
-        c0b1a0: outputs.get_output(t9),
-        c0b1a1: outputs.get_output(t12),
-        c0b2a0: outputs.get_output(t13),
-        c0b2a1: outputs.get_output(t14),
-        c1b0a0: outputs.get_output(t17),
-        c1b0a1: outputs.get_output(t20),
-        c1b1a0: outputs.get_output(t23),
-        c1b1a1: outputs.get_output(t26),
-        c1b2a0: outputs.get_output(t29),
-        c1b2a1: outputs.get_output(t32),
+        c0b1a0: outputs.get_output(t8),
+        c0b1a1: outputs.get_output(t9),
+        c0b2a0: outputs.get_output(t10),
+        c0b2a1: outputs.get_output(t11),
+        c1b0a0: outputs.get_output(t14),
+        c1b0a1: outputs.get_output(t17),
+        c1b1a0: outputs.get_output(t20),
+        c1b1a1: outputs.get_output(t23),
+        c1b2a0: outputs.get_output(t26),
+        c1b2a1: outputs.get_output(t29),
     };
     return (res,);
 }
@@ -5803,101 +5797,95 @@ pub fn run_BN254_TOWER_MILLER_FINALIZE_BN_1P_circuit(
     let t309 = circuit_mul(in27, t108);
     let t310 = circuit_mul(in28, t107);
     let t311 = circuit_add(t309, t310); // Fp2 mul imag part end
-    let t312 = circuit_mul(in29, in6); // Fp2 mul start
-    let t313 = circuit_mul(in30, in6);
-    let t314 = circuit_sub(t312, t313); // Fp2 mul real part end
-    let t315 = circuit_mul(in29, in6);
-    let t316 = circuit_mul(in30, in6);
-    let t317 = circuit_add(t315, t316); // Fp2 mul imag part end
-    let t318 = circuit_add(in27, in29); // Fp2 add coeff 0/1
-    let t319 = circuit_add(in28, in30); // Fp2 add coeff 1/1
-    let t320 = circuit_add(t107, in6); // Fp2 add coeff 0/1
-    let t321 = circuit_add(t108, in6); // Fp2 add coeff 1/1
-    let t322 = circuit_mul(t318, t320); // Fp2 mul start
-    let t323 = circuit_mul(t319, t321);
-    let t324 = circuit_sub(t322, t323); // Fp2 mul real part end
-    let t325 = circuit_mul(t318, t321);
-    let t326 = circuit_mul(t319, t320);
-    let t327 = circuit_add(t325, t326); // Fp2 mul imag part end
-    let t328 = circuit_sub(t324, t308); // Fp2 sub coeff 0/1
-    let t329 = circuit_sub(t327, t311); // Fp2 sub coeff 1/1
-    let t330 = circuit_sub(t328, t314); // Fp2 sub coeff 0/1
-    let t331 = circuit_sub(t329, t317); // Fp2 sub coeff 1/1
-    let t332 = circuit_add(t330, t331);
-    let t333 = circuit_mul(t332, in7);
-    let t334 = circuit_mul(t330, in8);
-    let t335 = circuit_sub(t334, t331);
-    let t336 = circuit_sub(t333, t334);
-    let t337 = circuit_sub(t336, t331);
-    let t338 = circuit_add(t335, t302); // Fp2 add coeff 0/1
-    let t339 = circuit_add(t337, t305); // Fp2 add coeff 1/1
-    let t340 = circuit_add(in25, in27); // Fp2 add coeff 0/1
-    let t341 = circuit_add(in26, in28); // Fp2 add coeff 1/1
-    let t342 = circuit_add(t109, t107); // Fp2 add coeff 0/1
-    let t343 = circuit_add(t110, t108); // Fp2 add coeff 1/1
-    let t344 = circuit_mul(t340, t342); // Fp2 mul start
-    let t345 = circuit_mul(t341, t343);
-    let t346 = circuit_sub(t344, t345); // Fp2 mul real part end
-    let t347 = circuit_mul(t340, t343);
-    let t348 = circuit_mul(t341, t342);
-    let t349 = circuit_add(t347, t348); // Fp2 mul imag part end
-    let t350 = circuit_sub(t346, t302); // Fp2 sub coeff 0/1
-    let t351 = circuit_sub(t349, t305); // Fp2 sub coeff 1/1
-    let t352 = circuit_sub(t350, t308); // Fp2 sub coeff 0/1
-    let t353 = circuit_sub(t351, t311); // Fp2 sub coeff 1/1
-    let t354 = circuit_add(t314, t317);
-    let t355 = circuit_mul(t354, in7);
-    let t356 = circuit_mul(t314, in8);
-    let t357 = circuit_sub(t356, t317);
-    let t358 = circuit_sub(t355, t356);
-    let t359 = circuit_sub(t358, t317);
-    let t360 = circuit_add(t352, t357); // Fp2 add coeff 0/1
-    let t361 = circuit_add(t353, t359); // Fp2 add coeff 1/1
-    let t362 = circuit_add(in25, in29); // Fp2 add coeff 0/1
-    let t363 = circuit_add(in26, in30); // Fp2 add coeff 1/1
-    let t364 = circuit_add(t109, in6); // Fp2 add coeff 0/1
-    let t365 = circuit_add(t110, in6); // Fp2 add coeff 1/1
-    let t366 = circuit_mul(t364, t362); // Fp2 mul start
-    let t367 = circuit_mul(t365, t363);
-    let t368 = circuit_sub(t366, t367); // Fp2 mul real part end
-    let t369 = circuit_mul(t364, t363);
-    let t370 = circuit_mul(t365, t362);
-    let t371 = circuit_add(t369, t370); // Fp2 mul imag part end
-    let t372 = circuit_sub(t368, t302); // Fp2 sub coeff 0/1
-    let t373 = circuit_sub(t371, t305); // Fp2 sub coeff 1/1
-    let t374 = circuit_sub(t372, t314); // Fp2 sub coeff 0/1
-    let t375 = circuit_sub(t373, t317); // Fp2 sub coeff 1/1
-    let t376 = circuit_add(t374, t308); // Fp2 add coeff 0/1
-    let t377 = circuit_add(t375, t311); // Fp2 add coeff 1/1
-    let t378 = circuit_sub(t182, t260); // Fp6 sub coeff 0/5
-    let t379 = circuit_sub(t183, t261); // Fp6 sub coeff 1/5
-    let t380 = circuit_sub(t204, t282); // Fp6 sub coeff 2/5
-    let t381 = circuit_sub(t205, t283); // Fp6 sub coeff 3/5
-    let t382 = circuit_sub(t220, t298); // Fp6 sub coeff 4/5
-    let t383 = circuit_sub(t221, t299); // Fp6 sub coeff 5/5
-    let t384 = circuit_sub(t378, t338); // Fp6 sub coeff 0/5
-    let t385 = circuit_sub(t379, t339); // Fp6 sub coeff 1/5
-    let t386 = circuit_sub(t380, t360); // Fp6 sub coeff 2/5
-    let t387 = circuit_sub(t381, t361); // Fp6 sub coeff 3/5
-    let t388 = circuit_sub(t382, t376); // Fp6 sub coeff 4/5
-    let t389 = circuit_sub(t383, t377); // Fp6 sub coeff 5/5
-    let t390 = circuit_add(t376, t377);
-    let t391 = circuit_mul(t390, in7);
-    let t392 = circuit_mul(t376, in8);
-    let t393 = circuit_sub(t392, t377);
-    let t394 = circuit_sub(t391, t392);
-    let t395 = circuit_sub(t394, t377);
-    let t396 = circuit_add(t393, t260); // Fp6 add coeff 0/5
-    let t397 = circuit_add(t395, t261); // Fp6 add coeff 1/5
-    let t398 = circuit_add(t338, t282); // Fp6 add coeff 2/5
-    let t399 = circuit_add(t339, t283); // Fp6 add coeff 3/5
-    let t400 = circuit_add(t360, t298); // Fp6 add coeff 4/5
-    let t401 = circuit_add(t361, t299); // Fp6 add coeff 5/5
+    let t312 = circuit_add(in27, in29); // Fp2 add coeff 0/1
+    let t313 = circuit_add(in28, in30); // Fp2 add coeff 1/1
+    let t314 = circuit_add(t107, in6); // Fp2 add coeff 0/1
+    let t315 = circuit_add(t108, in6); // Fp2 add coeff 1/1
+    let t316 = circuit_mul(t312, t314); // Fp2 mul start
+    let t317 = circuit_mul(t313, t315);
+    let t318 = circuit_sub(t316, t317); // Fp2 mul real part end
+    let t319 = circuit_mul(t312, t315);
+    let t320 = circuit_mul(t313, t314);
+    let t321 = circuit_add(t319, t320); // Fp2 mul imag part end
+    let t322 = circuit_sub(t318, t308); // Fp2 sub coeff 0/1
+    let t323 = circuit_sub(t321, t311); // Fp2 sub coeff 1/1
+    let t324 = circuit_sub(t322, in6); // Fp2 sub coeff 0/1
+    let t325 = circuit_sub(t323, in6); // Fp2 sub coeff 1/1
+    let t326 = circuit_add(t324, t325);
+    let t327 = circuit_mul(t326, in7);
+    let t328 = circuit_mul(t324, in8);
+    let t329 = circuit_sub(t328, t325);
+    let t330 = circuit_sub(t327, t328);
+    let t331 = circuit_sub(t330, t325);
+    let t332 = circuit_add(t329, t302); // Fp2 add coeff 0/1
+    let t333 = circuit_add(t331, t305); // Fp2 add coeff 1/1
+    let t334 = circuit_add(in25, in27); // Fp2 add coeff 0/1
+    let t335 = circuit_add(in26, in28); // Fp2 add coeff 1/1
+    let t336 = circuit_add(t109, t107); // Fp2 add coeff 0/1
+    let t337 = circuit_add(t110, t108); // Fp2 add coeff 1/1
+    let t338 = circuit_mul(t334, t336); // Fp2 mul start
+    let t339 = circuit_mul(t335, t337);
+    let t340 = circuit_sub(t338, t339); // Fp2 mul real part end
+    let t341 = circuit_mul(t334, t337);
+    let t342 = circuit_mul(t335, t336);
+    let t343 = circuit_add(t341, t342); // Fp2 mul imag part end
+    let t344 = circuit_sub(t340, t302); // Fp2 sub coeff 0/1
+    let t345 = circuit_sub(t343, t305); // Fp2 sub coeff 1/1
+    let t346 = circuit_sub(t344, t308); // Fp2 sub coeff 0/1
+    let t347 = circuit_sub(t345, t311); // Fp2 sub coeff 1/1
+    let t348 = circuit_add(in6, in6);
+    let t349 = circuit_mul(t348, in7);
+    let t350 = circuit_mul(in6, in8);
+    let t351 = circuit_sub(t350, in6);
+    let t352 = circuit_sub(t349, t350);
+    let t353 = circuit_sub(t352, in6);
+    let t354 = circuit_add(t346, t351); // Fp2 add coeff 0/1
+    let t355 = circuit_add(t347, t353); // Fp2 add coeff 1/1
+    let t356 = circuit_add(in25, in29); // Fp2 add coeff 0/1
+    let t357 = circuit_add(in26, in30); // Fp2 add coeff 1/1
+    let t358 = circuit_add(t109, in6); // Fp2 add coeff 0/1
+    let t359 = circuit_add(t110, in6); // Fp2 add coeff 1/1
+    let t360 = circuit_mul(t358, t356); // Fp2 mul start
+    let t361 = circuit_mul(t359, t357);
+    let t362 = circuit_sub(t360, t361); // Fp2 mul real part end
+    let t363 = circuit_mul(t358, t357);
+    let t364 = circuit_mul(t359, t356);
+    let t365 = circuit_add(t363, t364); // Fp2 mul imag part end
+    let t366 = circuit_sub(t362, t302); // Fp2 sub coeff 0/1
+    let t367 = circuit_sub(t365, t305); // Fp2 sub coeff 1/1
+    let t368 = circuit_sub(t366, in6); // Fp2 sub coeff 0/1
+    let t369 = circuit_sub(t367, in6); // Fp2 sub coeff 1/1
+    let t370 = circuit_add(t368, t308); // Fp2 add coeff 0/1
+    let t371 = circuit_add(t369, t311); // Fp2 add coeff 1/1
+    let t372 = circuit_sub(t182, t260); // Fp6 sub coeff 0/5
+    let t373 = circuit_sub(t183, t261); // Fp6 sub coeff 1/5
+    let t374 = circuit_sub(t204, t282); // Fp6 sub coeff 2/5
+    let t375 = circuit_sub(t205, t283); // Fp6 sub coeff 3/5
+    let t376 = circuit_sub(t220, t298); // Fp6 sub coeff 4/5
+    let t377 = circuit_sub(t221, t299); // Fp6 sub coeff 5/5
+    let t378 = circuit_sub(t372, t332); // Fp6 sub coeff 0/5
+    let t379 = circuit_sub(t373, t333); // Fp6 sub coeff 1/5
+    let t380 = circuit_sub(t374, t354); // Fp6 sub coeff 2/5
+    let t381 = circuit_sub(t375, t355); // Fp6 sub coeff 3/5
+    let t382 = circuit_sub(t376, t370); // Fp6 sub coeff 4/5
+    let t383 = circuit_sub(t377, t371); // Fp6 sub coeff 5/5
+    let t384 = circuit_add(t370, t371);
+    let t385 = circuit_mul(t384, in7);
+    let t386 = circuit_mul(t370, in8);
+    let t387 = circuit_sub(t386, t371);
+    let t388 = circuit_sub(t385, t386);
+    let t389 = circuit_sub(t388, t371);
+    let t390 = circuit_add(t387, t260); // Fp6 add coeff 0/5
+    let t391 = circuit_add(t389, t261); // Fp6 add coeff 1/5
+    let t392 = circuit_add(t332, t282); // Fp6 add coeff 2/5
+    let t393 = circuit_add(t333, t283); // Fp6 add coeff 3/5
+    let t394 = circuit_add(t354, t298); // Fp6 add coeff 4/5
+    let t395 = circuit_add(t355, t299); // Fp6 add coeff 5/5
 
     let modulus = get_BN254_modulus(); // BN254 prime field modulus
 
     let mut circuit_inputs = (
-        t396, t397, t398, t399, t400, t401, t384, t385, t386, t387, t388, t389,
+        t390, t391, t392, t393, t394, t395, t378, t379, t380, t381, t382, t383,
     )
         .new_inputs();
     // Prefill constants:
@@ -5931,18 +5919,18 @@ pub fn run_BN254_TOWER_MILLER_FINALIZE_BN_1P_circuit(
 
     let outputs = circuit_inputs.done_2().eval(modulus).unwrap();
     let Mi: E12T = E12T {
-        c0b0a0: outputs.get_output(t396),
-        c0b0a1: outputs.get_output(t397),
-        c0b1a0: outputs.get_output(t398),
-        c0b1a1: outputs.get_output(t399),
-        c0b2a0: outputs.get_output(t400),
-        c0b2a1: outputs.get_output(t401),
-        c1b0a0: outputs.get_output(t384),
-        c1b0a1: outputs.get_output(t385),
-        c1b1a0: outputs.get_output(t386),
-        c1b1a1: outputs.get_output(t387),
-        c1b2a0: outputs.get_output(t388),
-        c1b2a1: outputs.get_output(t389),
+        c0b0a0: outputs.get_output(t390),
+        c0b0a1: outputs.get_output(t391),
+        c0b1a0: outputs.get_output(t392),
+        c0b1a1: outputs.get_output(t393),
+        c0b2a0: outputs.get_output(t394),
+        c0b2a1: outputs.get_output(t395),
+        c1b0a0: outputs.get_output(t378),
+        c1b0a1: outputs.get_output(t379),
+        c1b1a0: outputs.get_output(t380),
+        c1b1a1: outputs.get_output(t381),
+        c1b2a0: outputs.get_output(t382),
+        c1b2a1: outputs.get_output(t383),
     };
     return (Mi,);
 }
@@ -0,0 +1,37 @@
+import pytest
+
+from garaga.modulo_circuit import ModBuiltinOps, ModuloCircuit, WriteOps
+
+
+def evaluate_circuit(circuit: ModuloCircuit, inputs: list[int]) -> list[int]:
+    """
+    Evaluates the instructions of a circuit on other inputs than the ones it was traced with.
+    """
+    p = circuit.field.p
+    segment = circuit.values_segment
+    input_offsets = [elmt.offset for elmt in circuit.input]
+    assert len(inputs) == len(input_offsets)
+    values = dict(zip(input_offsets, inputs))
+    for offset in segment.segment_stacks[WriteOps.CONSTANT]:
+        values[offset] = segment[offset].value
+    for offset, item in segment.segment_stacks[WriteOps.BUILTIN].items():
+        ins = item.instruction
+        if ins.operation == ModBuiltinOps.ADD:
+            if ins.right_offset == offset:
+                values[offset] = (
+                    values[ins.result_offset] - values[ins.left_offset]
+                ) % p
+            else:
+                values[offset] = (
+                    values[ins.left_offset] + values[ins.right_offset]
+                ) % p
+        elif ins.right_offset in (None, offset):
+            values[offset] = pow(values[ins.left_offset], -1, p)
+        else:
+            values[offset] = values[ins.left_offset] * values[ins.right_offset] % p
+    return [values[out.offset] for out in circuit.output]
+
+
+@pytest.fixture
+def evaluate():
+    return evaluate_circuit
@@ -2,8 +2,16 @@ import random
 
 import pytest
 
-from garaga.definitions import CURVES, CurveID, G1Point, G2Point, PairingCurve
-from garaga.hints.ecip import verify_ecip, zk_ecip_hint
+from garaga.definitions import (
+    CURVES,
+    STARK,
+    CurveID,
+    G1Point,
+    G1PointBatch,
+    G2Point,
+    PairingCurve,
+)
+from garaga.hints.ecip import derive_ec_point_from_X, verify_ecip, zk_ecip_hint
 
 # Define the curves to be tested
 curves = list(CurveID)
@@ -29,9 +37,15 @@ def test_verify_ecip(curve_id, msm_size):
     ), f"sum_dlog: {sum_dlog}, \nsum_dlog_rust: {sum_dlog_rust}"
 
     assert verify_ecip(Bs_G1, scalars, Q=Q_rust, sum_dlog=sum_dlog_rust)
+    assert zk_ecip_hint(G1PointBatch.from_points(Bs_G1), scalars) == (
+        Q_rust,
+        sum_dlog_rust,
+    )
     # Test for G2 points if the curve supports pairing
     if isinstance(CURVES[curve_id.value], PairingCurve):
         Bs_G2 = [G2Point.gen_random_point(curve_id) for _ in range(msm_size)]
+        Q_G2, sum_dlog_G2 = zk_ecip_hint(Bs_G2, scalars, use_rust=False)
+        assert zk_ecip_hint(Bs_G2, scalars, use_rust=True) == (Q_G2, sum_dlog_G2)
         assert verify_ecip(Bs_G2, scalars)
 
 
@@ -57,5 +71,24 @@ def test_verify_ecip_edge_cases(curve_id, msm_size):
         assert verify_ecip(Bs_G2, scalars)
 
 
+@pytest.mark.parametrize("curve_id", curves)
+def test_derive_ec_point_from_X(curve_id):
+    xs = [random.randint(0, STARK - 1) for _ in range(8)]
+    # Values of the derive_ec_point_from_X tests of ec_ops.cairo.
+    xs.append(
+        1007924606664371314454745651482312426967359991013948795084104590968267883012
+    )
+    for x in xs:
+        x_f, y, roots = derive_ec_point_from_X(x, curve_id)
+        assert (x_f, y, roots) == derive_ec_point_from_X(x, curve_id, use_rust=False)
+        assert G1Point(x_f.value, y.value, curve_id).is_on_curve()
+    if curve_id == CurveID.BN254:
+        assert (x_f.value, y.value, [r.value for r in roots]) == (
+            0x2763F5473B1953EED10C0CB48D824856B668918CA77736F57333EC7243F64DC,
+            0x15150916FC849DD870AA740AEE8C937CE5A652ED598CFC33BD761E9F469D5CF1,
+            [0x299198E451040CBF5002D67B9FA4C1219C100A470AF0825548810253BE61AC2],
+        )
+
+
 if __name__ == "__main__":
     pytest.main()
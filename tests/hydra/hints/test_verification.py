@@ -0,0 +1,107 @@
+import pytest
+
+from garaga.definitions import CurveID, G1Point
+from garaga.hints import ecip
+from garaga.hints.verification import (
+    VerificationLevel,
+    get_verification_level,
+    resolve_verification_level,
+    verification_level,
+)
+from garaga.precompiled_circuits.multi_pairing_check import get_pairing_check_input
+from garaga.starknet.tests_and_calldata_generators.mpcheck import MPCheckCalldataBuilder
+from garaga.starknet.tests_and_calldata_generators.msm import MSMCalldataBuilder
+
+
+def test_verification_levels():
+    assert get_verification_level() == VerificationLevel.FULL
+    with verification_level("sampled", sample_rate=4):
+        assert get_verification_level() == VerificationLevel.SAMPLED
+        levels = [resolve_verification_level() for _ in range(12)]
+        assert levels.count(VerificationLevel.SAMPLED) == 3
+        assert set(levels) == {VerificationLevel.SAMPLED, VerificationLevel.OFF}
+        # Levels of a request override the global one.
+        assert resolve_verification_level("full") == VerificationLevel.FULL
+        with verification_level(VerificationLevel.OFF):
+            assert resolve_verification_level() == VerificationLevel.OFF
+        assert get_verification_level() == VerificationLevel.SAMPLED
+    assert get_verification_level() == VerificationLevel.FULL
+    with pytest.raises(ValueError):
+        resolve_verification_level("everything")
+
+
+def test_verify_ecip_levels():
+    curve_id = CurveID.SECP256K1
+    Bs = [G1Point.gen_random_point(curve_id) for _ in range(3)]
+    scalars = [3, 5, 7]
+    Q, sum_dlog = ecip.zk_ecip_hint(Bs, scalars)
+    for level in VerificationLevel:
+        assert ecip.verify_ecip(
+            Bs, scalars, Q=Q, sum_dlog=sum_dlog, verification_level=level
+        )
+    # The random point check doesn't need the msm, skipped below FULL.
+    with pytest.raises(AssertionError):
+        ecip.verify_ecip(Bs, scalars, Q=-Q, sum_dlog=sum_dlog)
+    with pytest.raises(AssertionError):
+        ecip.verify_ecip(
+            Bs, scalars, Q=-Q, sum_dlog=sum_dlog, verification_level="sampled"
+        )
+    assert ecip.verify_ecip(
+        Bs, scalars, Q=-Q, sum_dlog=sum_dlog, verification_level="off"
+    )
+
+
+@pytest.mark.parametrize(
+    "level, n_checks",
+    [
+        (VerificationLevel.OFF, 0),
+        (VerificationLevel.SAMPLED, 3),
+        (VerificationLevel.FULL, 3),
+    ],
+)
+def test_build_msm_hints_verification_level(monkeypatch, level, n_checks):
+    checks = []
+    verify_ecip = ecip.verify_ecip
+    monkeypatch.setattr(
+        ecip,
+        "verify_ecip",
+        lambda *args, **kwargs: checks.append(kwargs["verification_level"])
+        or verify_ecip(*args, **kwargs),
+    )
+    curve_id = CurveID.BN254
+    builder = MSMCalldataBuilder(
+        curve_id,
+        [G1Point.gen_random_point(curve_id) for _ in range(2)],
+        [2**200 + 1, 2**130 + 3],
+    )
+    with verification_level(level, sample_rate=1):
+        builder.build_msm_hints()
+    assert checks == [level] * n_checks
+    # Levels of a request override the global one.
+    builder.build_msm_hints(verification_level="off")
+    assert len(checks) == n_checks
+    # The cached hints are checked again at the current level.
+    builder.build_msm_hints()
+    assert checks == [level] * n_checks + [VerificationLevel.FULL] * 3
+
+
+def test_build_mpcheck_hint_verification_level(monkeypatch):
+    checks = []
+    sanity_check = MPCheckCalldataBuilder._sanity_check_verify_rlc_equation
+    monkeypatch.setattr(
+        MPCheckCalldataBuilder,
+        "_sanity_check_verify_rlc_equation",
+        lambda self, *args: checks.append(args) or sanity_check(self, *args),
+    )
+    pairs, public_pair = get_pairing_check_input(
+        curve_id=CurveID.BN254, n_pairs=2, include_m=False, return_pairs=True
+    )
+    builder = MPCheckCalldataBuilder(
+        curve_id=CurveID.BN254, pairs=pairs, n_fixed_g2=2, public_pair=public_pair
+    )
+    with verification_level("off"):
+        calldata = builder.serialize_to_calldata()
+    assert checks == []
+    # The hint computed without checks is cached, but still checked at the global level.
+    assert builder.serialize_to_calldata() == calldata
+    assert len(checks) == 1
@@ -2,7 +2,9 @@ import random
 
 import pytest
 
+from garaga import modulo_circuit_structs as structs
 from garaga.definitions import CURVES, CurveID, G1Point
+from garaga.hints import ecip
 from garaga.precompiled_circuits.multi_pairing_check import get_pairing_check_input
 from garaga.starknet.tests_and_calldata_generators.mpcheck import MPCheckCalldataBuilder
 from garaga.starknet.tests_and_calldata_generators.msm import MSMCalldataBuilder
@@ -88,5 +90,53 @@ def test_msm_calldata_builder(
     assert calldata1 == calldata2
 
 
+def test_msm_calldata_builder_from_twistededwards():
+    curve_id = CurveID.ED25519
+    curve = CURVES[curve_id.value]
+    points = [G1Point.gen_random_point(curve_id) for _ in range(3)]
+    scalars = [random.randint(0, curve.n - 1) for _ in range(3)]
+    points_twisted = curve.to_twistededwards_batch([(p.x, p.y) for p in points])
+
+    msm = MSMCalldataBuilder.from_twistededwards(curve_id, points_twisted, scalars)
+    assert msm.points == points
+    assert msm.serialize_to_calldata() == MSMCalldataBuilder(
+        curve_id, points, scalars
+    ).serialize_to_calldata(use_rust=False)
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.SECP256K1])
+def test_msm_hints_match_sequential_ecip_hints(curve_id):
+    points = [G1Point.gen_random_point(curve_id) for _ in range(3)]
+    scalars = [random.randint(0, CURVES[curve_id.value].n - 1) for _ in range(3)]
+    msm = MSMCalldataBuilder(curve_id, points, scalars)
+    msm_hint, _ = msm.build_msm_hints()
+
+    # Same hints, computed one after another.
+    expected = MSMCalldataBuilder(curve_id, points, scalars)
+    scalars_low, scalars_high = expected.scalars_split()
+    Q_low, sum_dlog_low = ecip.zk_ecip_hint(points, scalars_low)
+    Q_high, sum_dlog_high = ecip.zk_ecip_hint(points, scalars_high)
+    Q_high_shifted, sum_dlog_shifted = ecip.zk_ecip_hint([Q_high], [2**128])
+    expected._hash_inputs_points_scalars_and_result_points(
+        Q_low, Q_high, Q_high_shifted
+    )
+    c = expected.transcript.s1
+    sum_dlog = sum_dlog_low * c + sum_dlog_high * (c * c) + sum_dlog_shifted * (c**3)
+
+    expected_hint = structs.Struct(
+        struct_name="MSMHint",
+        name="msm_hint",
+        elmts=[
+            structs.G1PointCircuit.from_G1Point("Q_low", Q_low),
+            structs.G1PointCircuit.from_G1Point("Q_high", Q_high),
+            structs.G1PointCircuit.from_G1Point("Q_high_shifted", Q_high_shifted),
+            structs.FunctionFeltCircuit.from_FunctionFelt(
+                name="RLCSumDlogDiv", f=sum_dlog, msm_size=3, batched=True
+            ),
+        ],
+    )
+    assert msm_hint.serialize_to_calldata() == expected_hint.serialize_to_calldata()
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,5 +1,8 @@
+import dataclasses
+
 import pytest
 
+from garaga.definitions import G1Point, G2Point
 from garaga.starknet.groth16_contract_generator.calldata import (
     groth16_calldata_from_vk_and_proof,
 )
@@ -86,3 +89,30 @@ def test_calldata_generation(
     end = time.time()
     print(f"Rust time: {end - start}")
     assert calldata == calldata_rust
+
+
+def test_proof_points_batch_subgroup_check():
+    proofs = [
+        Groth16Proof.from_json(f"{PATH}/proof_bn254.json"),
+        Groth16Proof.from_json(f"{PATH}/proof_bls.json"),
+        Groth16Proof.from_json(
+            f"{PATH}/snarkjs_proof_bls12381.json",
+            f"{PATH}/snarkjs_public_bls12381.json",
+        ),
+    ]
+    assert Groth16Proof.check_points_in_subgroups(proofs) == [True, True, True]
+
+    bad_b = dataclasses.replace(
+        proofs[0], b=G2Point.gen_random_point_not_in_subgroup(proofs[0].curve_id)
+    )
+    bad_c = dataclasses.replace(
+        proofs[1],
+        c=G1Point.gen_random_point_not_in_subgroup(proofs[1].curve_id, force_gen=True),
+    )
+    assert Groth16Proof.check_points_in_subgroups(proofs + [bad_b, bad_c]) == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
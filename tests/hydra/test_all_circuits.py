@@ -0,0 +1,221 @@
+import json
+import os
+from pathlib import Path
+
+from garaga.algebra import PyFelt
+from garaga.definitions import CurveID
+from garaga.modulo_circuit import ModuloCircuit
+from garaga.modulo_circuit_structs import u384
+from garaga.precompiled_circuits import all_circuits
+from garaga.precompiled_circuits.all_circuits import (
+    ALL_CAIRO_CIRCUITS,
+    CircuitID,
+    circuit_digest,
+    compilation_tasks,
+    compile_circuits,
+)
+from garaga.precompiled_circuits.compilable_circuits.base import (
+    BaseModuloCircuit,
+    format_cairo_files_in_parallel,
+)
+
+
+def _compile(circuits: dict, n_workers: int) -> tuple:
+    filenames = {v["filename"] for v in circuits.values()}
+    outputs = tuple({f: set() for f in filenames} for _ in range(4))
+    compile_circuits(circuits, 1, *outputs, 16, n_workers)
+    return outputs
+
+
+def test_compilation_tasks():
+    circuits = {
+        k: ALL_CAIRO_CIRCUITS[k]
+        for k in (CircuitID.ADD_EC_POINT, CircuitID.MP_CHECK_BIT0_LOOP)
+    }
+    tasks = compilation_tasks(circuits)
+    # ADD_EC_POINT on BN254 and BLS12_381, MP_CHECK_BIT0_LOOP on BLS12_381 with 2 params.
+    assert len(tasks) == 4
+    assert all(params is None or len(params) == 1 for _, _, params in tasks)
+
+
+def test_parallel_compilation_matches_serial():
+    circuits = {
+        k: ALL_CAIRO_CIRCUITS[k]
+        for k in (
+            CircuitID.ADD_EC_POINT,
+            CircuitID.DOUBLE_EC_POINT,
+            CircuitID.MP_CHECK_BIT0_LOOP,
+            CircuitID.EVAL_E12D,
+        )
+    }
+    serial = _compile(circuits, 1)
+    assert _compile(circuits, 2) == serial
+    assert all(serial[0].values())
+
+
+def test_manifest_skips_unchanged_files(tmp_path, monkeypatch):
+    formatted = []
+    monkeypatch.setattr(
+        all_circuits,
+        "format_cairo_files_in_parallel",
+        lambda filenames, *args: formatted.append(sorted(filenames)),
+    )
+    circuits = {
+        k: ALL_CAIRO_CIRCUITS[k] for k in (CircuitID.ADD_EC_POINT, CircuitID.EVAL_E12D)
+    }
+    out_dir = f"{tmp_path}/circuits/"
+    manifest_file = str(tmp_path / "manifest.json")
+
+    def run():
+        all_circuits.main(
+            out_dir, circuits, 1, n_workers=1, manifest_file=manifest_file
+        )
+
+    run()
+    assert formatted == [["ec", "extf_mul"]]
+    ec_file = tmp_path / "circuits" / "ec.cairo"
+    content = ec_file.read_bytes()
+    mtime = ec_file.stat().st_mtime_ns
+
+    run()
+    assert len(formatted) == 1
+    assert ec_file.stat().st_mtime_ns == mtime
+
+    # Files edited on disk are regenerated.
+    ec_file.write_text("")
+    run()
+    assert formatted[-1] == ["ec"]
+    assert ec_file.read_bytes() == content
+
+    # As well as files whose circuits changed.
+    manifest = json.loads(Path(manifest_file).read_text())
+    manifest["extf_mul"]["digest"] = "0"
+    Path(manifest_file).write_text(json.dumps(manifest))
+    run()
+    assert formatted[-1] == ["extf_mul"]
+
+
+def test_format_only_written_files(tmp_path, monkeypatch):
+    # A fake scarb logging its arguments.
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    scarb = bin_dir / "scarb"
+    scarb.write_text(f'#!/bin/sh\necho "$@" >> {tmp_path}/scarb.log\n')
+    scarb.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    out_dir = tmp_path / "circuits"
+    out_dir.mkdir()
+
+    format_cairo_files_in_parallel({"ec", "extf_mul"}, 1, f"{out_dir}/")
+    calls = sorted((tmp_path / "scarb.log").read_text().splitlines())
+    assert calls == [f"fmt {out_dir}/ec.cairo", f"fmt {out_dir}/extf_mul.cairo"]
+
+
+def test_manifest_rewrites_files_with_new_test_vectors(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        all_circuits, "format_cairo_files_in_parallel", lambda *args: None
+    )
+    # Generated Cairo tests are disabled in create_cairo1_test: emit their input values.
+    monkeypatch.setattr(
+        all_circuits,
+        "create_cairo1_test",
+        lambda function_name, input, output, curve_id: f"// {function_name} "
+        + " ".join(s.serialize() for s in input),
+    )
+    circuits = {
+        "MUL_ADD": {
+            "class": MulAddCircuit,
+            "params": None,
+            "filename": "ec",
+            "curve_ids": [CurveID.BN254],
+        }
+    }
+    out_dir = f"{tmp_path}/circuits/"
+    manifest_file = str(tmp_path / "manifest.json")
+    all_circuits.main(out_dir, circuits, 1, n_workers=1, manifest_file=manifest_file)
+    ec_file = tmp_path / "circuits" / "ec.cairo"
+    content = ec_file.read_text()
+
+    # Same instructions, other inputs: only the generated Cairo test changes.
+    monkeypatch.setattr(
+        MulAddCircuit,
+        "build_input",
+        lambda self: [self.field(11), self.field(13)],
+    )
+    all_circuits.main(out_dir, circuits, 1, n_workers=1, manifest_file=manifest_file)
+    assert ec_file.read_text() != content
+    assert "0xb" in ec_file.read_text()
+
+
+def test_circuit_digest():
+    def traced(**params):
+        info = ALL_CAIRO_CIRCUITS[CircuitID.MP_CHECK_BIT0_LOOP]
+        circuit = info["class"](
+            curve_id=CurveID.BLS12_381.value, compilation_mode=1, **params
+        ).circuit
+        circuit.compile_circuit()
+        return circuit
+
+    digest = circuit_digest(traced(n_pairs=2, n_fixed_g2=2))
+    assert digest == circuit_digest(traced(n_pairs=2, n_fixed_g2=2))
+    assert digest != circuit_digest(traced(n_pairs=3, n_fixed_g2=2))
+
+
+class MulAddCircuit(BaseModuloCircuit):
+    # x * y + 3, and one more multiplication on BLS12_381.
+    def __init__(self, curve_id: int, auto_run=True, compilation_mode=0) -> None:
+        super().__init__("mul_add", curve_id, auto_run, compilation_mode)
+
+    def build_input(self) -> list[PyFelt]:
+        return [self.field(5), self.field(7)]
+
+    def _run_circuit_inner(self, input: list[PyFelt]) -> ModuloCircuit:
+        circuit = ModuloCircuit(
+            self.name, self.curve_id, compilation_mode=self.compilation_mode
+        )
+        x = circuit.write_struct(u384("x", [input[0]]))
+        y = circuit.write_struct(u384("y", [input[1]]))
+        res = circuit.add(circuit.mul(x, y), circuit.set_or_get_constant(3))
+        if self.curve_id == CurveID.BLS12_381.value:
+            res = circuit.mul(res, x)
+        circuit.extend_struct_output(u384("res", [res]))
+        return circuit
+
+
+def test_identical_circuits_are_shared(monkeypatch):
+    generic_compilations = []
+    generic_circuit_code = all_circuits.generic_circuit_code
+    monkeypatch.setattr(
+        all_circuits,
+        "generic_circuit_code",
+        lambda *args: generic_compilations.append(args) or generic_circuit_code(*args),
+    )
+    _compile({k: ALL_CAIRO_CIRCUITS[k] for k in (CircuitID.ADD_EC_POINT,)}, 1)
+    assert generic_compilations == []
+
+    circuits = {
+        "MUL_ADD": {
+            "class": MulAddCircuit,
+            "params": None,
+            "filename": "ec",
+            "curve_ids": [CurveID.BN254, CurveID.SECP256K1, CurveID.BLS12_381],
+        }
+    }
+    codes, names, _, _ = _compile(circuits, 1)
+    # Only the BN254 and SECP256K1 circuits are shared, and compiled once to generic code.
+    assert len(generic_compilations) == 1
+    code = "\n".join(sorted(codes["ec"]))
+    assert code.count("fn run_MUL_ADD_circuit(") == 1
+    assert "get_modulus(curve_index)" in code
+    for curve_id in (CurveID.BN254, CurveID.SECP256K1):
+        assert f"fn run_{curve_id.name}_MUL_ADD_circuit(" in code
+        assert f"run_MUL_ADD_circuit(x, y, {curve_id.value})" in code
+    # The BLS12_381 circuit differs, and keeps its own implementation.
+    assert "fn run_BLS12_381_MUL_ADD_circuit(" in code
+    assert "run_MUL_ADD_circuit(x, y, 1)" not in code
+    assert names["ec"] == {
+        "run_MUL_ADD_circuit",
+        "run_BN254_MUL_ADD_circuit",
+        "run_SECP256K1_MUL_ADD_circuit",
+        "run_BLS12_381_MUL_ADD_circuit",
+    }
@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from garaga.algebra import PyFelt
+from garaga.circuit_liveness import (
+    ChainLink,
+    analyze_chain,
+    minimise_chain,
+    mpcheck_chain_links,
+    output_dependencies,
+    prune_circuit,
+)
+from garaga.definitions import CurveID
+from garaga.modulo_circuit import ModuloCircuit, WriteOps
+from garaga.modulo_circuit_structs import u384, u384Array
+from garaga.precompiled_circuits.compilable_circuits.cairo1_mpcheck_circuits import (
+    FixedG2MPCheckBit0,
+    FixedG2MPCheckBit1,
+    FixedG2MPCheckFinalizeBN,
+    FixedG2MPCheckInitBit,
+)
+
+
+def _producer() -> ModuloCircuit:
+    # out = [a + b, a * c], tmp = a * b, rest = [b * b, c + 1]
+    circuit = ModuloCircuit("producer", CurveID.BN254.value, compilation_mode=1)
+    felt = lambda x: PyFelt(x, circuit.field.p)
+    a, b, c = circuit.write_struct(u384Array("abc", [felt(3), felt(5), felt(7)]))
+    d = circuit.write_struct(u384("d", [felt(11)]))
+    circuit.extend_struct_output(
+        u384Array("out", [circuit.add(a, b), circuit.mul(a, c)])
+    )
+    circuit.extend_struct_output(u384("tmp", [circuit.mul(a, b)]))
+    circuit.extend_struct_output(
+        u384Array(
+            "rest",
+            [circuit.mul(b, b), circuit.add(c, circuit.set_or_get_constant(1))],
+        )
+    )
+    circuit.extend_struct_output(u384("dd", [circuit.mul(d, d)]))
+    return circuit
+
+
+def _consumer() -> ModuloCircuit:
+    # Only uses x[0] and y.
+    circuit = ModuloCircuit("consumer", CurveID.BN254.value, compilation_mode=1)
+    felt = lambda x: PyFelt(x, circuit.field.p)
+    x = circuit.write_struct(u384Array("x", [felt(8), felt(21)]))
+    y = circuit.write_struct(u384("y", [felt(15)]))
+    circuit.write_struct(u384("z", [felt(1)]))
+    circuit.extend_struct_output(u384("res", [circuit.mul(x[0], y)]))
+    return circuit
+
+
+def test_output_dependencies():
+    circuit = _producer()
+    assert output_dependencies(circuit) == [0b011, 0b101, 0b011, 0b010, 0b100, 0b1000]
+
+
+def test_analyze_chain():
+    circuits = [_producer(), _consumer()]
+    links = [
+        ChainLink(0, "out", 1, "x"),
+        ChainLink(0, "tmp", 1, "y"),
+        ChainLink(0, "rest", 1, "z"),
+    ]
+    liveness = analyze_chain(circuits, links)
+    # "dd" isn't passed to the consumer, so it's an output of the chain.
+    assert liveness.unused_outputs == [[("out", 1), ("rest", 0), ("rest", 1)], []]
+    assert liveness.unused_inputs == [[("abc", 2)], [("x", 1), ("z", 0)]]
+
+    with pytest.raises(AssertionError):
+        analyze_chain(circuits, [ChainLink(1, "res", 0, "abc")])
+
+
+def test_prune_circuit(evaluate):
+    circuit = _producer()
+    pruned = prune_circuit(circuit, [("out", 1), ("rest", 0), ("rest", 1), ("dd", 0)])
+    assert pruned.kept_outputs == [0, 2]
+    # The u384Array "abc" loses c, "d" and the constant 1 are removed.
+    assert pruned.kept_inputs == [0, 1]
+    assert [s.name for s in pruned.circuit.input_structs] == ["abc"]
+    assert [s.name for s in pruned.circuit.output_structs] == ["out", "tmp"]
+    assert pruned.circuit.summarize()["MULMOD"] == 1
+    assert not pruned.circuit.values_segment.segment_stacks[WriteOps.CONSTANT]
+
+    p = circuit.field.p
+    rng = random.Random(0)
+    inputs = [rng.randrange(1, p) for _ in circuit.input]
+    expected = evaluate(circuit, inputs)
+    assert evaluate(pruned.circuit, [inputs[i] for i in pruned.kept_inputs]) == [
+        expected[i] for i in pruned.kept_outputs
+    ]
+    code, _ = pruned.circuit.compile_circuit()
+    assert "circuit_inputs.done_2().eval(modulus)" in code
+
+    with pytest.raises(NotImplementedError):
+        prune_circuit(ModuloCircuit("cairo0", CurveID.BN254.value), [])
+
+
+def test_mpcheck_chain_is_minimal():
+    kwargs = {"curve_id": CurveID.BN254.value, "n_pairs": 3, "n_fixed_g2": 2}
+    circuits = [
+        FixedG2MPCheckInitBit(**kwargs).circuit,
+        FixedG2MPCheckBit0(**kwargs).circuit,
+        FixedG2MPCheckBit1(**kwargs).circuit,
+        FixedG2MPCheckFinalizeBN(**kwargs).circuit,
+    ]
+    links = mpcheck_chain_links(len(circuits), 3, 2)
+    names = lambda structs: {s.name for s in structs}
+    for link in links:
+        assert link.output in names(circuits[link.producer].output_structs)
+        assert link.input in names(circuits[link.consumer].input_structs)
+
+    pruned, liveness = minimise_chain(circuits, links)
+    assert liveness.unused_outputs == [[] for _ in circuits]
+    assert liveness.unused_inputs == [[] for _ in circuits]
+    for circuit, p in zip(circuits, pruned):
+        assert p.kept_inputs == list(range(len(circuit.input)))
+        assert p.kept_outputs == list(range(len(circuit.output)))
+        assert p.circuit.summarize() == circuit.summarize()
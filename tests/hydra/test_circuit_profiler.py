@@ -0,0 +1,70 @@
+import pytest
+
+from garaga.circuit_profiler import get_active_profiler, profile_circuits
+from garaga.definitions import CurveID, G1Point, G2Point, get_base_field
+from garaga.modulo_circuit import WriteOps
+from garaga.precompiled_circuits.fp2 import Fp2Circuits
+from garaga.precompiled_circuits.multi_miller_loop import MultiMillerLoopCircuit
+
+
+def _assert_totals_match_summary(profiler, circuit):
+    totals = profiler.totals()
+    summary = circuit.summarize()
+    assert totals["ADDMOD"] == summary["ADDMOD"]
+    # Inverses are MUL instructions of the modulo builtin.
+    assert totals["MULMOD"] + totals["INV"] == summary["MULMOD"]
+    assert totals["ASSERT_EQ"] == summary["ASSERT_EQ"]
+
+
+def test_profiler_is_opt_in():
+    circuit = Fp2Circuits("test", CurveID.BN254.value)
+    a = circuit.write_element(1)
+    circuit.mul(a, a)
+    assert circuit.profiler is None
+    assert get_active_profiler() is None
+
+
+def test_profiler_fp2_circuit():
+    field = get_base_field(CurveID.BN254.value)
+    circuit = Fp2Circuits("fp2_test", CurveID.BN254.value)
+    profiler = circuit.enable_profiling()
+    X = circuit.write_elements([field(2), field(3)], WriteOps.INPUT)
+    Y = circuit.write_elements([field(5), field(7)], WriteOps.INPUT)
+    circuit.fp2_mul(X, Y)
+    circuit.inv(X[0])
+    circuit.add_and_assert(X[0], Y[0], Y[1])
+
+    _assert_totals_match_summary(profiler, circuit)
+    flat = profiler.flat()
+    assert flat["fp2.fp2_mul"]["self"]["MULMOD"] == 4
+    assert flat["fp2.fp2_mul"]["self"]["ADDMOD"] == 2
+    assert flat["fp2_test"]["total"]["INV"] == 1
+    assert flat["fp2_test"]["total"]["ASSERT_EQ"] == 1
+    assert "fp2_test;fp2.fp2_mul 6" in profiler.folded_stacks().splitlines()
+    assert "fp2_test;fp2.fp2_mul 4" in profiler.folded_stacks(("MULMOD",))
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_profiler_miller_loop(curve_id):
+    with profile_circuits() as profiler:
+        circuit = MultiMillerLoopCircuit(
+            name="mml", curve_id=curve_id.value, n_pairs=1, hash_input=False
+        )
+        circuit.write_p_and_q(
+            [G1Point.gen_random_point(curve_id)], [G2Point.gen_random_point(curve_id)]
+        )
+        circuit.miller_loop(1)
+    assert get_active_profiler() is None
+    assert circuit.profiler is profiler
+
+    _assert_totals_match_summary(profiler, circuit)
+    flat = profiler.flat()
+    assert flat["mml"]["total"] == profiler.totals()
+    assert flat["multi_miller_loop.write_p_and_q"]["total"]["INV"] > 0
+    assert flat["multi_miller_loop.double_step"]["total"]["MULMOD"] > 0
+    for line in profiler.folded_stacks().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.split(";")[0] == "mml"
+        assert int(count) > 0
+    table = profiler.flat_table().splitlines()
+    assert table[2].startswith("mml")
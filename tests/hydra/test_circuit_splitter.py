@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from garaga.circuit_splitter import split_circuit
+from garaga.definitions import CurveID
+from garaga.modulo_circuit import OP_STEPS, ModuloCircuit
+from garaga.precompiled_circuits.all_circuits import ALL_CAIRO_CIRCUITS, CircuitID
+
+
+def _trace(circuit_id: CircuitID, curve_id: CurveID, params: dict | None):
+    info = ALL_CAIRO_CIRCUITS[circuit_id]
+    return info["class"](
+        curve_id=curve_id.value, compilation_mode=1, **(params or {})
+    ).circuit
+
+
+@pytest.mark.parametrize(
+    "circuit_id, curve_id, params",
+    [
+        (
+            CircuitID.MP_CHECK_FINALIZE_BN,
+            CurveID.BN254,
+            {"n_pairs": 2, "n_fixed_g2": 2},
+        ),
+        (CircuitID.MP_CHECK_FINALIZE_BLS, CurveID.BLS12_381, {"n_pairs": 3}),
+        (
+            CircuitID.MP_CHECK_BIT0_LOOP,
+            CurveID.BN254,
+            {"n_pairs": 3, "n_fixed_g2": 2},
+        ),
+    ],
+)
+@pytest.mark.parametrize("n_parts", [1, 2, 3])
+def test_split_circuit(circuit_id, curve_id, params, n_parts, evaluate):
+    circuit = _trace(circuit_id, curve_id, params)
+    split = split_circuit(circuit, n_parts)
+    assert len(split.parts) == n_parts
+
+    # Chain the parts on fresh inputs, and compare with the original circuit.
+    p = circuit.field.p
+    rng = random.Random(0)
+    inputs = [rng.randrange(1, p) for _ in circuit.input]
+    expected = evaluate(circuit, inputs)
+    live = []
+    for part, part_inputs in zip(split.parts, split.inputs):
+        live = evaluate(part, live + [inputs[i] for i in part_inputs])
+    assert live == expected
+
+    # The last part exposes the same output structs as the original circuit.
+    if circuit.output_structs:
+        assert [s.struct_name for s in split.parts[-1].output_structs] == [
+            s.struct_name for s in circuit.output_structs
+        ]
+    for part in split.parts:
+        assert sum(len(s) for s in part.input_structs) == len(part.input)
+        code, _ = part.compile_circuit()
+        assert "circuit_inputs.done_2().eval(modulus)" in code
+
+    max_op_weight = max(OP_STEPS[op] for op in ("ADDMOD", "MULMOD"))
+    total = sum(split.weights)
+    for w in split.weights:
+        # Each cut is within 0.1 * total / n_parts of its target, up to one instruction, so each
+        # part, between two cuts, is within 0.2 * total / n_parts of a balanced part.
+        assert abs(w - total / n_parts) <= 0.2 * total / n_parts + 2 * max_op_weight
+    assert len(split.live_counts) == n_parts - 1
+
+
+def test_split_circuit_minimises_live_values():
+    circuit = _trace(
+        CircuitID.MP_CHECK_FINALIZE_BN, CurveID.BN254, {"n_pairs": 2, "n_fixed_g2": 2}
+    )
+    split = split_circuit(circuit, 2, tolerance=0.0)
+    balanced = split_circuit(circuit, 2, tolerance=0.5)
+    assert balanced.live_counts[0] <= split.live_counts[0]
+    assert balanced.parts[0].output_structs[0].name == "live"
+    assert len(balanced.parts[0].output) == balanced.live_counts[0]
+
+
+def test_split_circuit_errors():
+    circuit = _trace(
+        CircuitID.MP_CHECK_FINALIZE_BN, CurveID.BN254, {"n_pairs": 2, "n_fixed_g2": 2}
+    )
+    with pytest.raises(ValueError):
+        split_circuit(circuit, 0)
+    with pytest.raises(NotImplementedError):
+        split_circuit(ModuloCircuit("cairo0", CurveID.BN254.value), 1)
@@ -0,0 +1,57 @@
+import pytest
+
+from garaga.algebra import Fp2, Polynomial, PyFelt
+from garaga.definitions import (
+    CURVES,
+    CurveID,
+    get_base_field,
+    get_curve_context,
+    get_irreducible_poly,
+    get_sparsity,
+)
+
+curve_ids = list(CurveID)
+pairing_curve_ids = [CurveID.BN254, CurveID.BLS12_381]
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_curve_context_is_memoised(curve_id):
+    context = get_curve_context(curve_id)
+    assert context is get_curve_context(curve_id.value)
+    assert get_base_field(curve_id) is context.base_field
+    assert context.base_field.p == CURVES[curve_id.value].p
+
+
+@pytest.mark.parametrize("curve_id", pairing_curve_ids)
+def test_curve_context_pairing_constants(curve_id):
+    context = get_curve_context(curve_id)
+    curve = CURVES[curve_id.value]
+    assert get_base_field(curve_id, Fp2) is context.base_fp2_field
+    assert (context.non_residue.a0, context.non_residue.a1) == (
+        curve.nr_a0,
+        curve.nr_a1,
+    )
+    for extension_degree in (6, 12):
+        poly = get_irreducible_poly(curve_id, extension_degree)
+        assert poly is context.irreducible_poly(extension_degree)
+        assert poly.get_value_coeffs() == [
+            x % curve.p for x in curve.irreducible_polys[extension_degree]
+        ]
+
+    field = context.base_field
+    line = Polynomial([field(x) for x in curve.line_function_sparsity])
+    ll = line * line % get_irreducible_poly(curve_id, 12)
+    assert list(context.line_line_sparsity) == get_sparsity(ll.coefficients)[0:12]
+
+
+def test_curve_context_swu_params():
+    context = get_curve_context(CurveID.BLS12_381)
+    swu_params = CURVES[CurveID.BLS12_381.value].swu_params
+    a, b, z = context.swu_params
+    assert all(isinstance(x, PyFelt) for x in (a, b, z))
+    assert (a.value, b.value, z.value) == (
+        swu_params.A,
+        swu_params.B,
+        swu_params.Z % context.base_field.p,
+    )
+    assert context.isogeny_to_g1_map is context.isogeny_to_g1_map
@@ -2,10 +2,28 @@ import random
 
 import pytest
 
-from garaga.algebra import PyFelt
-from garaga.definitions import CurveID
-from garaga.extension_field_modulo_circuit import ExtensionFieldModuloCircuit
+from garaga import garaga_rs
+from garaga.algebra import Polynomial, PyFelt
+from garaga.circuit_liveness import input_fields
+from garaga.definitions import CurveID, get_base_field
+from garaga.extension_field_modulo_circuit import (
+    LINES_Z_POWERS_DEGREES,
+    ExtensionFieldModuloCircuit,
+    rlc_accumulate_quotients,
+    z_powers_values,
+)
+from garaga.hints.extf_mul import (
+    nondeterministic_extension_field_mul_divmod,
+    nondeterministic_extension_field_mul_divmod_batch,
+    nondeterministic_extension_field_mul_rem,
+)
 from garaga.modulo_circuit import ModuloCircuitElement, WriteOps
+from garaga.precompiled_circuits.compilable_circuits.cairo1_mpcheck_circuits import (
+    FixedG2MPCheckBit0,
+    FixedG2MPCheckBit00,
+    FixedG2MPCheckInitBit,
+    MPCheckPrepareLambdaRootEvaluations,
+)
 
 
 @pytest.fixture(
@@ -78,5 +96,166 @@ def test_eval_sparse(
         )
 
 
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_create_powers_of_Z_reuses_line_powers(curve_id: CurveID):
+    c = ExtensionFieldModuloCircuit(
+        name="test", curve_id=curve_id.value, extension_degree=12
+    )
+    z = c.write_element(c.field(3))
+    c.create_lines_z_powers(z)
+    n_line_powers = sum(1 for x in c.z_powers[1:] if x is not None)
+    powers = c.create_powers_of_Z(z, max_degree=12)
+    assert [x.value for x in powers] == [pow(3, i, c.field.p) for i in range(1, 13)]
+    assert c.summarize()["MULMOD"] == 11
+    assert n_line_powers < 11
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_batched_mul_divmod(curve_id: CurveID):
+    field = get_base_field(curve_id.value)
+    products = [
+        [[field.random() for _ in range(12)] for _ in range(n)] for n in (1, 2, 3, 2)
+    ]
+    rlc_coeffs = [field.random() for _ in range(3)]
+    Qs, Rs, big_Q = nondeterministic_extension_field_mul_divmod_batch(
+        products, curve_id.value, 12, rlc_coeffs
+    )
+    expected_big_Q = Polynomial.zero(field.p)
+    for i, Ps in enumerate(products):
+        Q, R = nondeterministic_extension_field_mul_divmod(Ps, curve_id.value, 12)
+        assert (Qs[i], Rs[i]) == (Q, R)
+        if i < len(rlc_coeffs):
+            expected_big_Q += Polynomial(Q) * rlc_coeffs[i]
+    assert big_Q == expected_big_Q.get_coeffs()
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+@pytest.mark.parametrize("extension_degree", [6, 12])
+def test_mul_rem(curve_id: CurveID, extension_degree: int):
+    field = get_base_field(curve_id.value)
+    for n in (1, 2, 5):
+        Ps = [[field.random() for _ in range(extension_degree)] for _ in range(n)]
+        _, R = nondeterministic_extension_field_mul_divmod(
+            Ps, curve_id.value, extension_degree
+        )
+        assert nondeterministic_extension_field_mul_rem(
+            Ps, curve_id.value, extension_degree
+        ) == R + [field.zero()] * (extension_degree - len(R))
+
+
+def test_quotients_are_batched(monkeypatch):
+    c = ExtensionFieldModuloCircuit(
+        name="test", curve_id=CurveID.BN254.value, extension_degree=12
+    )
+    X = c.write_elements([c.field.random() for _ in range(12)], WriteOps.INPUT)
+    Y = c.write_elements([c.field.random() for _ in range(12)], WriteOps.INPUT)
+    x_over_y = c.extf_div(X, Y, 12)
+    y_inv = c.extf_inv(Y, 12)
+    # No quotient is computed until compute_pending_quotients.
+    monkeypatch.setattr(garaga_rs, "nondeterministic_extension_field_mul_divmod", None)
+    xy = c.extf_mul([X, Y], 12)
+    instructions = c.accumulate_poly_instructions[0]
+    assert instructions.Qis == [None, None, None]
+    monkeypatch.undo()
+
+    rlc_coeffs = [c.field.random() for _ in range(2)]
+    big_Q = c.compute_pending_quotients(rlc_coeffs=rlc_coeffs)
+    for Ps, R, Q in zip(
+        [[x_over_y, Y], [y_inv, Y], [X, Y]], [X, None, xy], instructions.Qis
+    ):
+        expected_Q, expected_R = nondeterministic_extension_field_mul_divmod(
+            Ps, CurveID.BN254.value, 12
+        )
+        assert Q.get_coeffs() == Polynomial(expected_Q).get_coeffs()
+        if R is not None:
+            assert [r.value for r in R] == [r.value for r in expected_R]
+    assert big_Q == rlc_accumulate_quotients(
+        instructions.Qis[:2], rlc_coeffs, c.field.p
+    )
+
+
+def test_rlc_accumulate_quotients():
+    field = get_base_field(CurveID.BLS12_381.value)
+    rng = random.Random(0)
+    # Dense, sparse and zero quotients of different degrees.
+    Qis = [
+        Polynomial([field(rng.randrange(field.p)) for _ in range(11)]),
+        Polynomial(
+            [field(rng.randrange(field.p)) if j % 3 else field.zero() for j in range(7)]
+        ),
+        Polynomial([field.zero()]),
+        Polynomial([field(rng.randrange(field.p)) for _ in range(3)]),
+    ]
+    rlc_coeffs = [
+        ModuloCircuitElement(field(rng.randrange(field.p)), i) for i in range(4)
+    ]
+    expected = Polynomial.zero(field.p)
+    for Q, c in zip(Qis, rlc_coeffs):
+        expected += Q * c
+    assert rlc_accumulate_quotients(Qis, rlc_coeffs, field.p) == [
+        x.value for x in expected.get_coeffs()
+    ]
+    # Opposite quotients cancel out.
+    one = ModuloCircuitElement(field.one(), 0)
+    assert rlc_accumulate_quotients([Qis[0], -Qis[0]], [one, one], field.p) == []
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_import_z_powers(curve_id: CurveID):
+    c = ExtensionFieldModuloCircuit(
+        name="test", curve_id=curve_id.value, extension_degree=12
+    )
+    z = c.field(5)
+    values = [c.field(x) for x in z_powers_values(z.value, c.field.p, 12)]
+    assert [x.value for x in values] == [pow(5, i, c.field.p) for i in range(1, 13)]
+    powers = c.import_z_powers(values)
+    c.create_lines_z_powers(powers[0])
+    degrees = LINES_Z_POWERS_DEGREES[curve_id.value]
+    assert [x.value if x else None for x in c.z_powers] == [
+        values[i].value if i + 1 in degrees else None for i in range(degrees[-1])
+    ]
+    assert c.create_powers_of_Z(powers[0], max_degree=12) == powers
+    assert c.summarize()["MULMOD"] == 0
+    assert len(c.input) == 12
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_mpcheck_circuits_import_z_powers(curve_id: CurveID, evaluate):
+    rng = random.Random(0)
+    p = get_base_field(curve_id.value).p
+    z = rng.randrange(p)
+    powers = z_powers_values(z, p, 12)
+
+    producer = MPCheckPrepareLambdaRootEvaluations(curve_id.value).circuit
+    exporter = MPCheckPrepareLambdaRootEvaluations(
+        curve_id.value, export_z_powers=True
+    ).circuit
+    inputs = [rng.randrange(p) for _ in producer.input]
+    z_index = input_fields(producer).index(("z", 0))
+    inputs[z_index] = z
+    assert evaluate(exporter, inputs) == evaluate(producer, inputs) + list(powers)
+
+    bit0 = FixedG2MPCheckBit0 if curve_id == CurveID.BLS12_381 else FixedG2MPCheckBit00
+    for circuit_type in (bit0, FixedG2MPCheckInitBit):
+        circuit = circuit_type(curve_id=curve_id.value).circuit
+        importer_circuit = circuit_type(curve_id=curve_id.value, import_z_powers=True)
+        importer = importer_circuit.circuit
+        degrees = importer_circuit.z_powers_degrees
+        assert degrees == LINES_Z_POWERS_DEGREES[curve_id.value]
+        assert importer.name == circuit.name + "_zp"
+
+        inputs = [rng.randrange(p) for _ in circuit.input]
+        z_index = input_fields(circuit).index(("z", 0))
+        inputs[z_index] = z
+        imported_inputs = (
+            inputs[:z_index] + [powers[d - 1] for d in degrees] + inputs[z_index + 1 :]
+        )
+        assert evaluate(importer, imported_inputs) == evaluate(circuit, inputs)
+        assert (
+            importer.summarize()["MULMOD"]
+            == circuit.summarize()["MULMOD"] - len(degrees) + 1
+        )
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+import garaga.fixed_base as fixed_base
+from garaga.definitions import CURVES, CurveID, G1Point
+
+curve_ids = list(CurveID)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_get_nG_matches_scalar_mul(curve_id):
+    curve = CURVES[curve_id.value]
+    gen = G1Point(curve.Gx, curve.Gy, curve_id)
+    # Edge cases: empty / full windows and the last scalar before the order.
+    scalars = [0, 1, 2, 255, 256, 2**64 - 1, curve.n - 1, curve.n - 2]
+    scalars += [random.randint(1, curve.n - 1) for _ in range(10)]
+    for s in scalars:
+        assert G1Point.get_nG(curve_id, s) == gen.scalar_mul(s)
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.ED25519])
+def test_fixed_base_table_small_window(curve_id):
+    curve = CURVES[curve_id.value]
+    gen = G1Point(curve.Gx, curve.Gy, curve_id)
+    table = fixed_base.build_fixed_base_table(curve_id.value, 3)
+    for _ in range(10):
+        s = random.randint(1, curve.n - 1)
+        assert G1Point(*table.mul(s), curve_id) == gen.scalar_mul(s)
+
+
+def test_fixed_base_table_persistence(tmp_path, monkeypatch):
+    monkeypatch.setattr(fixed_base, "CACHE_DIR", str(tmp_path))
+    table = fixed_base.build_fixed_base_table(CurveID.BN254.value, 4)
+    fixed_base.save_fixed_base_table(table)
+    loaded = fixed_base.load_fixed_base_table(CurveID.BN254.value, 4)
+    assert loaded == table
+    assert fixed_base.load_fixed_base_table(CurveID.BN254.value, 5) is None
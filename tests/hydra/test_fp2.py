@@ -0,0 +1,57 @@
+import random
+
+from garaga.algebra import Fp2
+from garaga.definitions import CurveID
+from garaga.modulo_circuit import WriteOps
+from garaga.precompiled_circuits.fp2 import Fp2Circuits
+from garaga.precompiled_circuits.miller_tower import MillerTowerCircuit
+
+
+def _circuit_and_inputs(curve_id: CurveID = CurveID.BN254):
+    circuit = Fp2Circuits("fp2", curve_id.value, compilation_mode=1)
+    X = circuit.write_elements(
+        [circuit.field.random(), circuit.field.random()], WriteOps.INPUT
+    )
+    Y = circuit.write_elements(
+        [circuit.field.random(), circuit.field.random()], WriteOps.INPUT
+    )
+    return circuit, X, Y
+
+
+def _expected(X, Y) -> list[int]:
+    xy = Fp2(X[0].felt, X[1].felt) * Fp2(Y[0].felt, Y[1].felt)
+    return [xy.a0.value, xy.a1.value]
+
+
+def test_fp2_mul(evaluate):
+    circuit, X, Y = _circuit_and_inputs()
+    res = circuit.fp2_mul(X, Y)
+    assert [r.value for r in res] == _expected(X, Y)
+    circuit.extend_output(res)
+    assert circuit.summarize()["MULMOD"] == 4
+
+    # Same instructions on other inputs.
+    p = circuit.field.p
+    rng = random.Random(0)
+    inputs = [rng.randrange(p) for _ in range(4)]
+    x = Fp2(circuit.field(inputs[0]), circuit.field(inputs[1]))
+    y = Fp2(circuit.field(inputs[2]), circuit.field(inputs[3]))
+    assert evaluate(circuit, inputs) == [(x * y).a0.value, (x * y).a1.value]
+
+
+def test_fp2_mul_skips_constant_zeros():
+    circuit, X, _ = _circuit_and_inputs()
+    Y = [circuit.set_or_get_constant(0), circuit.set_or_get_constant(240)]
+    res = circuit.fp2_mul(X, Y)
+    assert [r.value for r in res] == _expected(X, Y)
+    assert circuit.summarize()["MULMOD"] == 2
+
+
+def test_fp12_inverse():
+    for curve_id in (CurveID.BN254, CurveID.BLS12_381):
+        circuit = MillerTowerCircuit("inverse", curve_id.value, n_pairs=1)
+        a = circuit.write_elements(
+            [circuit.field.random() for _ in range(12)], WriteOps.INPUT
+        )
+        one = circuit.fp12_mul(a, circuit.fp12_inverse(a))
+        assert [x.value for x in one] == [1] + [0] * 11
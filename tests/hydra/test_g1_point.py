@@ -4,7 +4,9 @@ from garaga.definitions import (
     CURVES,
     CurveID,
     G1Point,
+    G1PointBatch,
     TwistedEdwardsCurve,
+    batch_is_in_prime_order_subgroup,
     is_generator,
 )
 
@@ -26,6 +28,26 @@ def test_weierstrass_to_twistededwards_and_back(curve_id):
     assert y_weierstrass == y_weierstrass_back
 
 
+@pytest.mark.parametrize("curve_id", [CurveID.ED25519])
+def test_weierstrass_to_twistededwards_batch(curve_id):
+    curve: TwistedEdwardsCurve = CURVES[curve_id.value]
+    points = [G1Point.gen_random_point(curve_id) for _ in range(10)]
+    points_weierstrass = [(p.x, p.y) for p in points]
+
+    points_twisted = curve.to_twistededwards_batch(points_weierstrass)
+    assert points_twisted == [
+        curve.to_twistededwards(x, y) for x, y in points_weierstrass
+    ]
+    assert curve.to_weierstrass_batch(points_twisted) == [
+        curve.to_weierstrass(x, y) for x, y in points_twisted
+    ]
+    assert curve.to_weierstrass_batch(points_twisted) == points_weierstrass
+    assert curve.to_weierstrass_batch([]) == []
+    with pytest.raises(ValueError):
+        # Neutral element (0, 1) has no affine Weierstrass image.
+        curve.to_weierstrass_batch(points_twisted[:2] + [(0, 1)])
+
+
 @pytest.mark.parametrize("curve_id", curve_ids)
 def test_fp_generator(curve_id):
     if curve_id == CurveID.BLS12_381:
@@ -119,6 +141,25 @@ def test_g1point_gen_random_point_not_in_subgroup(curve_id):
     p = G1Point.gen_random_point_not_in_subgroup(curve_id, force_gen=True)
     assert p.is_on_curve()
     assert not p.is_in_prime_order_subgroup()
+    assert not p.is_in_prime_order_subgroup(use_endomorphism=False)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g1point_subgroup_check_matches_naive(curve_id):
+    for _ in range(5):
+        p = G1Point.gen_random_point(curve_id)
+        assert p.is_in_prime_order_subgroup()
+        assert p.is_in_prime_order_subgroup(use_endomorphism=False)
+    if CURVES[curve_id.value].h == 1:
+        return
+    g = G1Point.get_nG(curve_id, 1)
+    for _ in range(5):
+        r = G1Point.gen_random_point_not_in_subgroup(curve_id, force_gen=True)
+        # Small order point added to a point of the subgroup.
+        t = r.scalar_mul(CURVES[curve_id.value].n)
+        q = g.add(t)
+        assert q.is_in_prime_order_subgroup() == t.is_infinity()
+        assert q.is_in_prime_order_subgroup(use_endomorphism=False) == t.is_infinity()
 
 
 @pytest.mark.parametrize("curve_id", curve_ids)
@@ -204,3 +245,32 @@ def test_g1point_scalar_mul_larger_than_order(curve_id):
     for p in random_points:
         result = p.scalar_mul(CURVES[curve_id.value].n + 1)
         assert result == p
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g1point_batch(curve_id):
+    points = [G1Point.gen_random_point(curve_id) for _ in range(5)]
+    points.append(G1Point.infinity(curve_id))
+    batch = G1PointBatch.from_points(points)
+    assert len(batch) == len(points)
+    assert batch.to_points() == points
+    assert batch[1] == points[1] and batch[-1] == points[-1]
+    assert batch.coordinates() == [v for p in points for v in (p.x, p.y)]
+    assert G1PointBatch(curve_id, memoryview(bytearray(batch.buffer))).to_points() == (
+        points
+    )
+    with pytest.raises(ValueError):
+        G1PointBatch(curve_id, batch.buffer[:-1])
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g1point_batch_subgroup_check(curve_id):
+    points = [G1Point.gen_random_point(curve_id) for _ in range(4)]
+    points.append(G1Point.infinity(curve_id))
+    assert batch_is_in_prime_order_subgroup(points) == [True] * 5
+    if CURVES[curve_id.value].h == 1:
+        return
+    # Small order component only.
+    bad = G1Point.gen_random_point_not_in_subgroup(curve_id, force_gen=True)
+    bad = points[0].add(bad.scalar_mul(CURVES[curve_id.value].n))
+    assert batch_is_in_prime_order_subgroup(points + [bad]) == [True] * 5 + [False]
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from garaga.definitions import CURVES, CurveID, G1G2Pair, G1Point, G2Point
+
+curve_ids = [CurveID.BN254, CurveID.BLS12_381]
+
+
+def gen_pairing_check_instance(curve_id, n_pairs):
+    # e(a_1 G1, b_1 G2) * ... * e(-(Σ a_i b_i) G1, G2) == 1
+    n = CURVES[curve_id.value].n
+    pairs = []
+    acc = 0
+    for _ in range(n_pairs - 1):
+        a, b = random.randint(1, n - 1), random.randint(1, n - 1)
+        pairs.append(G1G2Pair(G1Point.get_nG(curve_id, a), G2Point.get_nG(curve_id, b)))
+        acc += a * b
+    pairs.append(
+        G1G2Pair(G1Point.get_nG(curve_id, -acc % n), G2Point.get_nG(curve_id, 1))
+    )
+    return pairs
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_pair_batch(curve_id):
+    batches = [gen_pairing_check_instance(curve_id, k) for k in (2, 3, 4)]
+    batches.append(batches[0][:1])
+    results = G1G2Pair.pair_batch(batches)
+    assert len(results) == len(batches)
+    for pairs, res in zip(batches, results):
+        assert res == G1G2Pair.pair(pairs)
+    assert [res.value_coeffs == [1] + [0] * 11 for res in results] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_miller_batch(curve_id):
+    batches = [gen_pairing_check_instance(curve_id, k) for k in (2, 3)]
+    results = G1G2Pair.miller_batch(batches)
+    for pairs, res in zip(batches, results):
+        assert res == G1G2Pair.miller(pairs)
@@ -2,7 +2,12 @@ import random
 
 import pytest
 
-from garaga.definitions import CURVES, CurveID, G2Point
+from garaga.definitions import (
+    CURVES,
+    CurveID,
+    G2Point,
+    batch_is_in_prime_order_subgroup,
+)
 
 # List of curve IDs to test
 curve_ids = [CurveID.BN254, CurveID.BLS12_381]
@@ -29,6 +34,14 @@ def test_ng2(curve_id):
     assert nG == p
 
 
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_ng2_matches_scalar_mul(curve_id):
+    p = get_g2_generator_point(curve_id)
+    n = CURVES[curve_id.value].n
+    for s in [0, 2, 255, 256, n - 1] + [random.randint(1, n - 1) for _ in range(5)]:
+        assert G2Point.get_nG(curve_id, s) == p.scalar_mul(s)
+
+
 @pytest.mark.parametrize("curve_id", curve_ids)
 def test_g2point_infinity(curve_id):
     inf = G2Point.infinity(curve_id)
@@ -78,6 +91,21 @@ def test_g2point_msm(curve_id):
     scalars = [2, 3]
     result = G2Point.msm(points, scalars)
     assert result.is_on_curve()
+    assert result == p1.scalar_mul(5)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g2point_msm_vs_scalar_mul(curve_id):
+    n = CURVES[curve_id.value].n
+    points = [G2Point.gen_random_point(curve_id) for _ in range(6)]
+    points.append(G2Point((0, 0), (0, 0), curve_id))
+    scalars = [random.randint(1, n - 1) for _ in range(5)] + [0, 7]
+    expected = G2Point((0, 0), (0, 0), curve_id)
+    for p, s in zip(points, scalars):
+        expected = expected.add(p.scalar_mul(s))
+    assert G2Point.msm(points, scalars) == expected
+    # Cancelling terms sum to the point at infinity.
+    assert G2Point.msm([points[0], points[0]], [1, n - 1]).is_infinity()
 
 
 @pytest.mark.parametrize("curve_id", curve_ids)
@@ -147,3 +175,38 @@ def test_g2point_scalar_mul_larger_than_order_random_points(curve_id):
     for p in random_points:
         result = p.scalar_mul(CURVES[curve_id.value].n + 1)
         assert result == p
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g2point_psi(curve_id):
+    g = get_g2_generator_point(curve_id)
+    curve = CURVES[curve_id.value]
+    assert g.psi() == g.scalar_mul(curve.p % curve.n)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g2point_subgroup_check(curve_id):
+    for _ in range(3):
+        p = G2Point.gen_random_point(curve_id)
+        assert p.is_in_prime_order_subgroup()
+        assert p.is_in_prime_order_subgroup(use_endomorphism=False)
+        q = G2Point.gen_random_point_not_in_subgroup(curve_id)
+        assert q.is_on_curve()
+        assert not q.is_in_prime_order_subgroup()
+        assert not q.is_in_prime_order_subgroup(use_endomorphism=False)
+
+
+@pytest.mark.parametrize("curve_id", curve_ids)
+def test_g2point_batch_subgroup_check(curve_id):
+    points = [G2Point.gen_random_point(curve_id) for _ in range(4)]
+    points.append(G2Point.infinity(curve_id))
+    assert batch_is_in_prime_order_subgroup(points) == [True] * 5
+    bad = G2Point.gen_random_point_not_in_subgroup(curve_id)
+    assert batch_is_in_prime_order_subgroup(points[:2] + [bad] + points[2:]) == [
+        True,
+        True,
+        False,
+        True,
+        True,
+        True,
+    ]
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from garaga.definitions import CurveID
+from garaga.modulo_circuit import ModuloCircuit
+
+
+def _count_ops(circuit: ModuloCircuit) -> tuple[int, int]:
+    summary = circuit.summarize()
+    return summary["ADDMOD"], summary["MULMOD"]
+
+
+def _poly_value(coeffs: list[int], z: int, p: int) -> int:
+    return sum(c * pow(z, i, p) for i, c in enumerate(coeffs)) % p
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_eval_horner_dense(curve_id):
+    circuit = ModuloCircuit("test", curve_id.value)
+    p = circuit.field.p
+    coeffs = [random.randrange(2, p) for _ in range(6)]
+    poly = circuit.write_elements([circuit.field(c) for c in coeffs])
+    z = circuit.write_element(circuit.field(random.randrange(p)))
+    res = circuit.eval_horner(poly, z)
+    assert res.value == _poly_value(coeffs, z.value, p)
+    # Horner: 5 MUL + 5 ADD, no powers of z computed.
+    assert _count_ops(circuit) == (5, 5)
+    assert z.offset not in circuit.powers
+
+
+def test_eval_horner_reuses_cached_powers():
+    circuit = ModuloCircuit("test", CurveID.BN254.value)
+    p = circuit.field.p
+    z = circuit.write_element(circuit.field(7))
+    powers = circuit.get_powers(z, 5)
+    assert [x.value for x in powers] == [pow(7, i, p) for i in range(1, 6)]
+    assert _count_ops(circuit) == (0, 4)
+    # Cached powers are returned without new instructions.
+    assert circuit.get_powers(z, 3) == powers[:3]
+    assert _count_ops(circuit) == (0, 4)
+
+    # a0 + z^2 + a4*z^4: with the powers, 1 MUL + 2 ADD instead of 4 MUL + 2 ADD.
+    one, zero = circuit.set_or_get_constant(1), circuit.set_or_get_constant(0)
+    a0, a4 = circuit.write_elements([circuit.field(3), circuit.field(5)])
+    res = circuit.eval_horner([a0, zero, one, zero, a4], z)
+    assert res.value == _poly_value([3, 0, 1, 0, 5], 7, p)
+    assert _count_ops(circuit) == (2, 5)
+
+
+def test_eval_horner_sparse_without_powers():
+    circuit = ModuloCircuit("test", CurveID.BN254.value)
+    p = circuit.field.p
+    z = circuit.write_element(circuit.field(11))
+    zero = circuit.set_or_get_constant(0)
+    a = circuit.write_elements([circuit.field(c) for c in (2, 3)])
+    # a0 + a1*z^6: Horner needs 6 MUL + 1 ADD, powers 5 MUL for z^2..z^6 + 1 MUL + 1 ADD.
+    res = circuit.eval_horner([a[0]] + [zero] * 5 + [a[1]], z)
+    assert res.value == _poly_value([2, 0, 0, 0, 0, 0, 3], 11, p)
+    assert _count_ops(circuit) == (1, 6)
+    assert z.offset not in circuit.powers
+
+
+def test_eval_poly_registers_powers():
+    circuit = ModuloCircuit("test", CurveID.BLS12_381.value)
+    p = circuit.field.p
+    x = circuit.write_element(circuit.field(5))
+    x_powers = [x, circuit.square(x), circuit.mul(circuit.square(x), x)]
+    coeffs = circuit.write_elements([circuit.field(c) for c in (1, 2, 3, 4)])
+    res = circuit.eval_poly(coeffs, x_powers)
+    assert res.value == _poly_value([1, 2, 3, 4], 5, p)
+    assert circuit.powers[x.offset] == x_powers
+    zero = circuit.set_or_get_constant(0)
+    adds, muls = _count_ops(circuit)
+    res = circuit.eval_horner([coeffs[0], zero, zero, coeffs[3]], x)
+    assert res.value == _poly_value([1, 0, 0, 4], 5, p)
+    assert _count_ops(circuit) == (adds + 1, muls + 1)
+
+
+def test_eval_zero_poly():
+    circuit = ModuloCircuit("test", CurveID.BN254.value)
+    z = circuit.write_element(circuit.field(3))
+    circuit.get_powers(z, 2)
+    zero = circuit.set_or_get_constant(0)
+    assert circuit.eval_horner([zero, zero, zero], z).value == 0
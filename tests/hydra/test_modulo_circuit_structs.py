@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from garaga.definitions import CurveID, get_base_field
+from garaga.hints import io
+from garaga.modulo_circuit_structs import (
+    E12D,
+    G1PointCircuit,
+    Struct,
+    StructSpan,
+    u384,
+    u384Array,
+    u384Span,
+)
+
+
+def _divmod_split(x: int, n_limbs: int, base: int) -> list[int]:
+    coeffs = []
+    for n in range(n_limbs - 1, 0, -1):
+        q, x = divmod(x, base**n)
+        coeffs.append(q)
+    coeffs.append(x)
+    return coeffs[::-1]
+
+
+@pytest.mark.parametrize(
+    "n_limbs, base", [(4, 2**96), (3, 2**96), (2, 2**128), (1, 2**128), (3, 10**30)]
+)
+def test_bigint_split_array(n_limbs, base):
+    rng = random.Random(0)
+    # Values larger than base**n_limbs keep their high bits in the last limb.
+    values = [rng.randrange(-(2**400), 2**400) for _ in range(20)] + [0, 1]
+    expected = [limb for v in values for limb in _divmod_split(v, n_limbs, base)]
+    assert [io.bigint_split(v, n_limbs, base) for v in values] == [
+        _divmod_split(v, n_limbs, base) for v in values
+    ]
+    assert io.bigint_split_array(values, n_limbs, base) == expected
+    assert (
+        io.bigint_split_array(values, n_limbs, base, prepend_length=True)
+        == [len(values)] + expected
+    )
+    assert io.bigint_split_array([], n_limbs, base, prepend_length=True) == [0]
+
+
+@pytest.mark.parametrize("curve_id", [CurveID.BN254, CurveID.BLS12_381])
+def test_struct_calldata_is_split_in_batches(curve_id):
+    field = get_base_field(curve_id.value)
+    points = [
+        G1PointCircuit(f"p{i}", [field.random(), field.random()]) for i in range(5)
+    ]
+    span = StructSpan("points", points)
+    assert span.serialize_to_calldata() == [5] + [
+        limb for p in points for limb in p.serialize_to_calldata()
+    ]
+
+    # Runs of flat structs with different limbs, and structs with a length prefix.
+    members = [
+        u384("a", [field.random()]),
+        E12D("f", [field.random() for _ in range(12)]),
+        E12D("g", [field.random() for _ in range(12)]),
+        u384Span("s", [field.random() for _ in range(3)]),
+        u384Array("t", [field.random() for _ in range(2)]),
+        points[0],
+    ]
+    struct = Struct("Members", "members", members)
+    assert struct.serialize_to_calldata() == [
+        limb for m in members for limb in m.serialize_to_calldata()
+    ]
+    n_limbs = 3 if curve_id == CurveID.BN254 else 4
+    assert [m.calldata_n_limbs for m in members] == [4, n_limbs, n_limbs, None, None, 4]
@@ -28,6 +28,25 @@ pub fn nondeterministic_extension_field_mul_divmod<F: IsPrimeField + CurveParams
     (z_polyq, z_polyr)
 }
 
+// Returns (Qs, Rs, big_Q) where (Q_i, R_i) = nondeterministic_extension_field_mul_divmod(Ps_i),
+// and big_Q = Σ(c_i * Q_i) for the first len(rlc_coeffs) products.
+pub fn nondeterministic_extension_field_mul_divmod_batch<F: IsPrimeField + CurveParamsProvider<F>>(
+    ext_degree: usize,
+    products: Vec<Vec<Polynomial<F>>>,
+    rlc_coeffs: &[FieldElement<F>],
+) -> (Vec<Polynomial<F>>, Vec<Polynomial<F>>, Polynomial<F>) {
+    assert!(rlc_coeffs.len() <= products.len());
+    let (qs, rs): (Vec<_>, Vec<_>) = products
+        .into_iter()
+        .map(|ps| nondeterministic_extension_field_mul_divmod(ext_degree, ps))
+        .unzip();
+    let mut big_q = Polynomial::zero();
+    for (q, c) in qs.iter().zip(rlc_coeffs) {
+        big_q = &big_q + &q.scale_by_coeff(c);
+    }
+    (qs, rs, big_q)
+}
+
 pub fn nondeterministic_extension_field_div<F, E2, E6, E12>(
     x: Polynomial<F>,
     y: Polynomial<F>,
@@ -474,6 +493,36 @@ mod tests {
         assert_eq!(r, xr);
     }
 
+    #[test]
+    fn test_nondeterministic_extension_field_mul_divmod_batch() {
+        let poly = |seed: u64| {
+            Polynomial::new(
+                (0..12u64)
+                    .map(|k| FieldElement::<BN254PrimeField>::from(seed + k))
+                    .collect::<Vec<_>>(),
+            )
+        };
+        let products = (1..4u64)
+            .map(|i| (0..=i).map(|j| poly(i * 1000 + j * 100)).collect::<Vec<_>>())
+            .collect::<Vec<_>>();
+        let rlc_coeffs = [
+            FieldElement::<BN254PrimeField>::from(7),
+            FieldElement::<BN254PrimeField>::from(49),
+        ];
+        let (qs, rs, big_q) =
+            nondeterministic_extension_field_mul_divmod_batch(12, products.clone(), &rlc_coeffs);
+        let mut expected_big_q = Polynomial::zero();
+        for (i, ps) in products.into_iter().enumerate() {
+            let (q, r) = nondeterministic_extension_field_mul_divmod(12, ps);
+            if i < rlc_coeffs.len() {
+                expected_big_q = &expected_big_q + &q.scale_by_coeff(&rlc_coeffs[i]);
+            }
+            assert_eq!(qs[i].coefficients, q.coefficients);
+            assert_eq!(rs[i].coefficients, r.coefficients);
+        }
+        assert_eq!(big_q.coefficients, expected_big_q.coefficients);
+    }
+
     #[test]
     fn nondeterministic_extension_field_div_1() {
         let x = [
@@ -79,4 +79,46 @@ where
     pub fn compute_adding_slope(a: &Self, b: &Self) -> FieldElement<E2> {
         (&a.y - &b.y) / (&a.x - &b.x)
     }
+
+    pub fn add(&self, other: &Self) -> Self {
+        if self.is_infinity() {
+            return other.clone();
+        }
+        if other.is_infinity() {
+            return self.clone();
+        }
+
+        if self.x == other.x && self.y != other.y {
+            let zero = to_e2([FieldElement::zero(), FieldElement::zero()]);
+            return G2Point::new_unchecked(zero.clone(), zero);
+        }
+
+        let lambda = if self.eq(other) {
+            Self::compute_doubling_slope(self)
+        } else {
+            Self::compute_adding_slope(self, other)
+        };
+
+        let x3 = &lambda.square() - &self.x - &other.x;
+
+        let y3 = &lambda * &(&self.x - &x3) - &self.y;
+
+        G2Point::new_unchecked(x3, y3)
+    }
+
+    pub fn scalar_mul_neg_3(&self) -> Self {
+        let double_point = self.add(self);
+        let triple_point = self.add(&double_point);
+        triple_point.neg()
+    }
+}
+
+impl<F, E2> PartialEq for G2Point<F, E2>
+where
+    F: IsPrimeField + IsSubFieldOf<E2>,
+    E2: IsField<BaseType = [FieldElement<F>; 2]>,
+{
+    fn eq(&self, other: &Self) -> bool {
+        self.x == other.x && self.y == other.y
+    }
 }
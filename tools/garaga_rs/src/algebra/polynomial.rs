@@ -1,12 +1,12 @@
 use crate::definitions::FieldElement;
-use lambdaworks_math::field::traits::IsPrimeField;
+use lambdaworks_math::field::traits::{IsField, IsPrimeField};
 
 #[derive(Debug, Clone)]
-pub struct Polynomial<F: IsPrimeField> {
+pub struct Polynomial<F: IsField> {
     pub coefficients: Vec<FieldElement<F>>,
 }
 
-impl<F: IsPrimeField> Polynomial<F> {
+impl<F: IsField> Polynomial<F> {
     pub fn get_coefficients_ext_degree(&self, ext_degree: usize) -> Vec<FieldElement<F>> {
         assert!(self.coefficients.len() <= ext_degree);
         let mut coefficients = self.coefficients.clone();
@@ -28,7 +28,9 @@ impl<F: IsPrimeField> Polynomial<F> {
             coefficients: unpadded_coefficients,
         }
     }
+}
 
+impl<F: IsPrimeField> Polynomial<F> {
     pub fn print_as_sage_poly(&self) -> String {
         let var_name = 'x';
         if self.coefficients.is_empty()
@@ -63,7 +65,9 @@ impl<F: IsPrimeField> Polynomial<F> {
 
         string
     }
+}
 
+impl<F: IsField> Polynomial<F> {
     pub fn degree(&self) -> isize {
         self.coefficients
             .iter()
@@ -210,10 +214,10 @@ impl<F: IsPrimeField> Polynomial<F> {
     }
 }
 
-pub fn pad_with_zero_coefficients_to_length<F: IsPrimeField>(pa: &mut Polynomial<F>, n: usize) {
+pub fn pad_with_zero_coefficients_to_length<F: IsField>(pa: &mut Polynomial<F>, n: usize) {
     pa.coefficients.resize(n, FieldElement::zero());
 }
-pub fn pad_with_zero_coefficients<F: IsPrimeField>(
+pub fn pad_with_zero_coefficients<F: IsField>(
     pa: &Polynomial<F>,
     pb: &Polynomial<F>,
 ) -> (Polynomial<F>, Polynomial<F>) {
@@ -228,7 +232,7 @@ pub fn pad_with_zero_coefficients<F: IsPrimeField>(
     (pa, pb)
 }
 
-impl<F: IsPrimeField> std::ops::Add<&Polynomial<F>> for &Polynomial<F> {
+impl<F: IsField> std::ops::Add<&Polynomial<F>> for &Polynomial<F> {
     type Output = Polynomial<F>;
 
     fn add(self, a_polynomial: &Polynomial<F>) -> Self::Output {
@@ -243,7 +247,7 @@ impl<F: IsPrimeField> std::ops::Add<&Polynomial<F>> for &Polynomial<F> {
     }
 }
 
-impl<F: IsPrimeField> std::ops::Add for Polynomial<F> {
+impl<F: IsField> std::ops::Add for Polynomial<F> {
     type Output = Polynomial<F>;
 
     fn add(self, other: Polynomial<F>) -> Polynomial<F> {
@@ -261,7 +265,7 @@ impl<F: IsPrimeField> std::ops::Add for Polynomial<F> {
     }
 }
 
-impl<F: IsPrimeField> std::ops::Neg for Polynomial<F> {
+impl<F: IsField> std::ops::Neg for Polynomial<F> {
     type Output = Polynomial<F>;
 
     fn neg(self) -> Polynomial<F> {
@@ -269,7 +273,7 @@ impl<F: IsPrimeField> std::ops::Neg for Polynomial<F> {
     }
 }
 
-impl<F: IsPrimeField> std::ops::Sub for Polynomial<F> {
+impl<F: IsField> std::ops::Sub for Polynomial<F> {
     type Output = Polynomial<F>;
 
     fn sub(self, other: Polynomial<F>) -> Polynomial<F> {
@@ -277,7 +281,7 @@ impl<F: IsPrimeField> std::ops::Sub for Polynomial<F> {
     }
 }
 
-impl<F: IsPrimeField> PartialEq for Polynomial<F> {
+impl<F: IsField> PartialEq for Polynomial<F> {
     fn eq(&self, other: &Self) -> bool {
         if self.coefficients.len() != other.coefficients.len() {
             return false;
@@ -293,28 +297,28 @@ impl<F: IsPrimeField> PartialEq for Polynomial<F> {
     }
 }
 
-impl<F: IsPrimeField> std::ops::Mul<&Polynomial<F>> for &Polynomial<F> {
+impl<F: IsField> std::ops::Mul<&Polynomial<F>> for &Polynomial<F> {
     type Output = Polynomial<F>;
     fn mul(self, factor: &Polynomial<F>) -> Polynomial<F> {
         self.mul_with_ref(factor)
     }
 }
 
-impl<F: IsPrimeField> std::ops::Mul<Polynomial<F>> for Polynomial<F> {
+impl<F: IsField> std::ops::Mul<Polynomial<F>> for Polynomial<F> {
     type Output = Polynomial<F>;
     fn mul(self, factor: Polynomial<F>) -> Polynomial<F> {
         &self * &factor
     }
 }
 
-impl<F: IsPrimeField> std::ops::Mul<Polynomial<F>> for &Polynomial<F> {
+impl<F: IsField> std::ops::Mul<Polynomial<F>> for &Polynomial<F> {
     type Output = Polynomial<F>;
     fn mul(self, factor: Polynomial<F>) -> Polynomial<F> {
         self * &factor
     }
 }
 
-impl<F: IsPrimeField> std::ops::Mul<&Polynomial<F>> for Polynomial<F> {
+impl<F: IsField> std::ops::Mul<&Polynomial<F>> for Polynomial<F> {
     type Output = Polynomial<F>;
     fn mul(self, factor: &Polynomial<F>) -> Polynomial<F> {
         &self * factor
@@ -1,14 +1,14 @@
 use crate::algebra::polynomial::Polynomial;
 use crate::definitions::FieldElement;
-use lambdaworks_math::field::traits::IsPrimeField;
+use lambdaworks_math::field::traits::{IsField, IsPrimeField};
 
 #[derive(Debug, Clone)]
-pub struct RationalFunction<F: IsPrimeField> {
+pub struct RationalFunction<F: IsField> {
     pub numerator: Polynomial<F>,
     pub denominator: Polynomial<F>,
 }
 
-impl<F: IsPrimeField> RationalFunction<F> {
+impl<F: IsField> RationalFunction<F> {
     pub fn new(numerator: Polynomial<F>, denominator: Polynomial<F>) -> Self {
         Self {
             numerator,
@@ -39,7 +39,7 @@ impl<F: IsPrimeField> RationalFunction<F> {
     }
 }
 
-impl<F: IsPrimeField> std::ops::Add for RationalFunction<F> {
+impl<F: IsField> std::ops::Add for RationalFunction<F> {
     type Output = RationalFunction<F>;
 
     fn add(self, other: RationalFunction<F>) -> RationalFunction<F> {
@@ -52,12 +52,12 @@ impl<F: IsPrimeField> std::ops::Add for RationalFunction<F> {
 }
 
 #[derive(Debug, Clone)]
-pub struct FunctionFelt<F: IsPrimeField> {
+pub struct FunctionFelt<F: IsField> {
     pub a: RationalFunction<F>,
     pub b: RationalFunction<F>,
 }
 
-impl<F: IsPrimeField> FunctionFelt<F> {
+impl<F: IsField> FunctionFelt<F> {
     pub fn new(a: RationalFunction<F>, b: RationalFunction<F>) -> Self {
         Self { a, b }
     }
@@ -76,7 +76,9 @@ impl<F: IsPrimeField> FunctionFelt<F> {
             self.b.scale_by_coeff(coeff),
         )
     }
+}
 
+impl<F: IsPrimeField> FunctionFelt<F> {
     // def print_as_sage_poly(self, var: str = "x") -> str:
     //     return f"(({self.b.numerator.print_as_sage_poly(var)}) / ({self.b.denominator.print_as_sage_poly(var)}) * y + ({self.a.numerator.print_as_sage_poly(var)} / ({self.a.denominator.print_as_sage_poly(var)})"
 
@@ -91,7 +93,7 @@ impl<F: IsPrimeField> FunctionFelt<F> {
     }
 }
 
-impl<F: IsPrimeField> std::ops::Add for FunctionFelt<F> {
+impl<F: IsField> std::ops::Add for FunctionFelt<F> {
     type Output = FunctionFelt<F>;
 
     fn add(self, other: FunctionFelt<F>) -> FunctionFelt<F> {
@@ -4,7 +4,7 @@ use crate::definitions::{
     SECP256K1PrimeField, SECP256R1PrimeField, Stark252PrimeField, X25519PrimeField,
 };
 use crate::{
-    ecip::core::{neg_3_base_le, run_ecip},
+    ecip::core::{derive_ec_point_from_x, neg_3_base_le, run_ecip},
     io::{
         element_to_biguint, felt252_to_element, field_element_to_u384_limbs,
         field_elements_from_big_uints, padd_function_felt,
@@ -12,11 +12,7 @@ use crate::{
     },
     poseidon_transcript::CairoPoseidonTranscript,
 };
-use lambdaworks_crypto::hash::poseidon::{starknet::PoseidonCairoStark252, Poseidon};
-use lambdaworks_math::{
-    field::traits::{IsPrimeField, LegendreSymbol},
-    traits::ByteConversion,
-};
+use lambdaworks_math::{field::traits::IsPrimeField, traits::ByteConversion};
 
 use num_bigint::BigUint;
 
@@ -151,10 +147,10 @@ where
         scalars_high.push(BigUint::from(high));
     }
 
-    let (q_low, sum_dlog_div_low) = run_ecip::<F>(points, &scalars_low);
-    let (q_high, sum_dlog_div_high) = run_ecip::<F>(points, &scalars_high);
+    let (q_low, sum_dlog_div_low) = run_ecip(points, &scalars_low);
+    let (q_high, sum_dlog_div_high) = run_ecip(points, &scalars_high);
     let (q_high_shifted, sum_dlog_div_high_shifted) =
-        run_ecip::<F>(&[q_high.clone()], &[BigUint::from(1usize) << 128]);
+        run_ecip(&[q_high.clone()], &[BigUint::from(1usize) << 128]);
 
     let mut transcript = hash_inputs_points_scalars_and_result_points(
         points,
@@ -381,52 +377,6 @@ where
     transcript.state[0]
 }
 
-fn derive_ec_point_from_x<F>(
-    x_252: &FieldElement<Stark252PrimeField>,
-) -> (G1Point<F>, Vec<FieldElement<F>>)
-where
-    F: IsPrimeField + CurveParamsProvider<F>,
-    FieldElement<F>: ByteConversion,
-{
-    let params = F::get_curve_params();
-    let a = params.a;
-    let b = params.b;
-    let g = params.fp_generator;
-    let rhs_compute = |x: &FieldElement<F>| x * x * x + &a * x + &b;
-
-    let mut x_252 = *x_252;
-    let mut rhs = rhs_compute(&felt252_to_element(&x_252));
-    let mut g_rhs_roots = vec![];
-    let mut attempt = 0;
-    while rhs.legendre_symbol() != LegendreSymbol::One {
-        let g_rhs = &rhs * &g;
-        g_rhs_roots.push(sqrt(&g_rhs));
-        let mut state = [x_252, FieldElement::from(attempt), FieldElement::from(2)];
-        PoseidonCairoStark252::hades_permutation(&mut state);
-        x_252 = state[0];
-        rhs = rhs_compute(&felt252_to_element(&x_252));
-        attempt += 1;
-    }
-    let y = sqrt(&rhs);
-    (
-        G1Point::new_unchecked(felt252_to_element(&x_252), y),
-        g_rhs_roots,
-    )
-}
-
-fn sqrt<F>(value: &FieldElement<F>) -> FieldElement<F>
-where
-    F: IsPrimeField,
-    FieldElement<F>: ByteConversion,
-{
-    let (root1, root2) = value.sqrt().expect("there is no root");
-    if element_to_biguint(&root1) < element_to_biguint(&root2) {
-        root1
-    } else {
-        root2
-    }
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
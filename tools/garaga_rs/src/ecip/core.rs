@@ -1,18 +1,26 @@
 use crate::algebra::polynomial::Polynomial;
 use crate::definitions::FieldElement;
-use lambdaworks_math::field::traits::IsPrimeField;
+use lambdaworks_math::elliptic_curve::short_weierstrass::curves::bls12_381::field_extension::Degree2ExtensionField as BLS12381Degree2ExtensionField;
+use lambdaworks_math::elliptic_curve::short_weierstrass::curves::bn_254::field_extension::Degree2ExtensionField as BN254Degree2ExtensionField;
+use lambdaworks_math::field::traits::{IsField, IsPrimeField, IsSubFieldOf};
 use lambdaworks_math::traits::ByteConversion;
 
+use lambdaworks_crypto::hash::poseidon::{starknet::PoseidonCairoStark252, Poseidon};
+use lambdaworks_math::field::traits::LegendreSymbol;
+
 use crate::algebra::g1point::G1Point;
 use crate::algebra::rational_function::{FunctionFelt, RationalFunction};
 use crate::definitions::{
     BLS12381PrimeField, BN254PrimeField, CurveParamsProvider, GrumpkinPrimeField,
-    SECP256K1PrimeField, SECP256R1PrimeField, X25519PrimeField,
+    SECP256K1PrimeField, SECP256R1PrimeField, Stark252PrimeField, X25519PrimeField,
 };
 use crate::ecip::ff::FF;
+use crate::ecip::point::EcipPoint;
 use crate::io::{
-    field_elements_from_big_uints, field_elements_to_big_uints,
+    biguint_from_hex, e2_elements_to_big_uints, element_from_biguint, element_to_biguint,
+    felt252_to_element, field_elements_from_big_uints, field_elements_to_big_uints,
     parse_g1_points_from_flattened_field_elements_list,
+    parse_g2_points_from_flattened_field_elements_list,
 };
 
 use num_bigint::{BigInt, BigUint, ToBigInt};
@@ -45,12 +53,43 @@ where
     let elements = parse_fn(&values);
     let points = parse_g1_points_from_flattened_field_elements_list(&elements)?;
     let (q, sum_dlog) = run_ecip(&points, &scalars);
-    Ok(prepare_result(&q, &sum_dlog))
+    Ok(prepare_result(&q, &sum_dlog, field_elements_to_big_uints))
+}
+
+/// Same as zk_ecip_hint, for G2 points given as [x0, x1, y0, y1, ...].
+/// Q is returned as [x0, x1, y0, y1] and the Fp2 coefficients of sum_dlog as [c0_0, c0_1, ...].
+pub fn zk_ecip_hint_g2(
+    points: Vec<BigUint>,
+    scalars: Vec<BigUint>,
+    curve_id: usize,
+) -> Result<[Vec<BigUint>; 5], String> {
+    match curve_id {
+        0 => handle_curve_g2::<BN254PrimeField, BN254Degree2ExtensionField>(points, scalars),
+        1 => handle_curve_g2::<BLS12381PrimeField, BLS12381Degree2ExtensionField>(points, scalars),
+        _ => Err(String::from("Invalid curve ID for G2")),
+    }
 }
 
-fn construct_digits_vectors<F: IsPrimeField + CurveParamsProvider<F>>(
-    list: &[BigUint],
-) -> Vec<Vec<i8>> {
+fn handle_curve_g2<F, E2>(
+    values: Vec<BigUint>,
+    scalars: Vec<BigUint>,
+) -> Result<[Vec<BigUint>; 5], String>
+where
+    F: IsPrimeField + CurveParamsProvider<F> + IsSubFieldOf<E2>,
+    E2: IsField<BaseType = [FieldElement<F>; 2]>,
+    FieldElement<F>: ByteConversion,
+{
+    let elements = field_elements_from_big_uints::<F>(&values);
+    let points = parse_g2_points_from_flattened_field_elements_list::<F, E2>(&elements)?;
+    let (q, sum_dlog) = run_ecip(&points, &scalars);
+    Ok(prepare_result(
+        &q,
+        &sum_dlog,
+        e2_elements_to_big_uints::<F, E2>,
+    ))
+}
+
+fn construct_digits_vectors(list: &[BigUint]) -> Vec<Vec<i8>> {
     let mut dss_ = Vec::new();
 
     for scalar_biguint in list {
@@ -114,20 +153,17 @@ fn floor_division(a: BigInt, b: BigInt) -> BigInt {
     }
 }
 
-pub fn run_ecip<F>(points: &[G1Point<F>], scalars: &[BigUint]) -> (G1Point<F>, FunctionFelt<F>)
-where
-    F: IsPrimeField + CurveParamsProvider<F>,
-{
-    let dss = construct_digits_vectors::<F>(scalars);
+pub fn run_ecip<P: EcipPoint>(points: &[P], scalars: &[BigUint]) -> (P, FunctionFelt<P::Field>) {
+    let dss = construct_digits_vectors(scalars);
 
     // println!("Running ecip");
     let (q, divisors) = ecip_functions(points, dss);
     // println!("Calculating dlogs");
-    let dlogs: Vec<_> = divisors.iter().map(|d| dlog(d.clone())).collect();
+    let dlogs: Vec<_> = divisors.iter().map(|d| dlog::<P>(d.clone())).collect();
 
     let mut sum_dlog = dlogs[0].clone();
-    let minus_three = FieldElement::<F>::zero() - FieldElement::<F>::from(3);
-    let mut neg_3_power = FieldElement::<F>::one();
+    let minus_three = FieldElement::<P::Field>::zero() - FieldElement::<P::Field>::from(3);
+    let mut neg_3_power = FieldElement::<P::Field>::one();
     for dlog in dlogs.iter().skip(1) {
         neg_3_power *= minus_three.clone();
         sum_dlog = sum_dlog + dlog.clone().scale_by_coeff(neg_3_power.clone());
@@ -138,79 +174,94 @@ where
     (q, sum_dlog)
 }
 
-fn prepare_result<F>(q: &G1Point<F>, sum_dlog: &FunctionFelt<F>) -> [Vec<BigUint>; 5]
-where
-    F: IsPrimeField,
-    FieldElement<F>: ByteConversion,
-{
-    let q_list = &[q.x.clone(), q.y.clone()];
+fn prepare_result<P: EcipPoint>(
+    q: &P,
+    sum_dlog: &FunctionFelt<P::Field>,
+    to_big_uints: fn(&[FieldElement<P::Field>]) -> Vec<BigUint>,
+) -> [Vec<BigUint>; 5] {
+    let q_list = &[q.x().clone(), q.y().clone()];
     let a_num_list = &sum_dlog.a.numerator.coefficients;
     let a_den_list = &sum_dlog.a.denominator.coefficients;
     let b_num_list = &sum_dlog.b.numerator.coefficients;
     let b_den_list = &sum_dlog.b.denominator.coefficients;
     [
-        field_elements_to_big_uints(q_list),
-        field_elements_to_big_uints(a_num_list),
-        field_elements_to_big_uints(a_den_list),
-        field_elements_to_big_uints(b_num_list),
-        field_elements_to_big_uints(b_den_list),
+        to_big_uints(q_list),
+        to_big_uints(a_num_list),
+        to_big_uints(a_den_list),
+        to_big_uints(b_num_list),
+        to_big_uints(b_den_list),
     ]
 }
 
-fn line<F: IsPrimeField + CurveParamsProvider<F>>(p: G1Point<F>, q: G1Point<F>) -> FF<F> {
+fn line<P: EcipPoint>(p: P, q: P) -> FF<P::Field> {
     if p.is_infinity() {
         if q.is_infinity() {
-            return FF::new(vec![Polynomial::new(vec![FieldElement::one()])]);
+            return FF::new(vec![Polynomial::new(vec![FieldElement::one()])], P::y2());
         } else {
-            let qx = q.x.clone();
-            return FF::new(vec![Polynomial::new(vec![-qx, FieldElement::one()])]);
+            let qx = q.x().clone();
+            return FF::new(
+                vec![Polynomial::new(vec![-qx, FieldElement::one()])],
+                P::y2(),
+            );
         }
     }
     if q.is_infinity() {
-        let px = p.x.clone();
-        return FF::new(vec![Polynomial::new(vec![-px, FieldElement::one()])]);
+        let px = p.x().clone();
+        return FF::new(
+            vec![Polynomial::new(vec![-px, FieldElement::one()])],
+            P::y2(),
+        );
     }
 
-    let px = p.x.clone();
-    let py = p.y.clone();
-    let three: FieldElement<F> = FieldElement::from(3);
-    let two: FieldElement<F> = FieldElement::from(2);
+    let px = p.x().clone();
+    let py = p.y().clone();
+    let three: FieldElement<P::Field> = FieldElement::from(3);
+    let two: FieldElement<P::Field> = FieldElement::from(2);
     if p == q {
-        let m = (three * px.clone() * px.clone() + F::get_curve_params().a) / (two * py.clone());
+        let m = (three * px.clone() * px.clone() + P::curve_a()) / (two * py.clone());
         let b = py.clone() - m.clone() * px.clone();
-        return FF::new(vec![
-            Polynomial::new(vec![-b, -m]),
-            Polynomial::new(vec![FieldElement::one()]),
-        ]);
+        return FF::new(
+            vec![
+                Polynomial::new(vec![-b, -m]),
+                Polynomial::new(vec![FieldElement::one()]),
+            ],
+            P::y2(),
+        );
     }
 
     if p == q.neg() {
-        return FF::new(vec![Polynomial::new(vec![-px, FieldElement::one()])]);
+        return FF::new(
+            vec![Polynomial::new(vec![-px, FieldElement::one()])],
+            P::y2(),
+        );
     }
 
-    let qx = q.x.clone();
-    let qy = q.y.clone();
+    let qx = q.x().clone();
+    let qy = q.y().clone();
 
     let m = (py.clone() - qy.clone()) / (px.clone() - qx.clone());
     let b = qy - m.clone() * qx;
-    FF::new(vec![
-        Polynomial::new(vec![-b, -m]),
-        Polynomial::new(vec![FieldElement::one()]),
-    ])
+    FF::new(
+        vec![
+            Polynomial::new(vec![-b, -m]),
+            Polynomial::new(vec![FieldElement::one()]),
+        ],
+        P::y2(),
+    )
 }
 
-fn construct_function<F: IsPrimeField + CurveParamsProvider<F>>(ps: Vec<G1Point<F>>) -> FF<F> {
+fn construct_function<P: EcipPoint>(ps: Vec<P>) -> FF<P::Field> {
     if ps.is_empty() {
-        return FF::new(vec![Polynomial::new(vec![FieldElement::one()])]);
+        return FF::new(vec![Polynomial::new(vec![FieldElement::one()])], P::y2());
     }
 
-    let mut xs: Vec<(G1Point<F>, FF<F>)> = ps
+    let mut xs: Vec<(P, FF<P::Field>)> = ps
         .iter()
         .map(|p| (p.clone(), line(p.clone(), p.neg())))
         .collect();
 
     while xs.len() != 1 {
-        let mut xs2: Vec<(G1Point<F>, FF<F>)> = Vec::new();
+        let mut xs2: Vec<(P, FF<P::Field>)> = Vec::new();
 
         let x0 = if xs.len() % 2 != 0 {
             let x0 = xs[0].clone();
@@ -245,15 +296,11 @@ fn construct_function<F: IsPrimeField + CurveParamsProvider<F>>(ps: Vec<G1Point<
     xs.last().unwrap().1.normalize()
 }
 
-fn row_function<F: IsPrimeField + CurveParamsProvider<F>>(
-    ds: Vec<i8>,
-    ps: &[G1Point<F>],
-    q: G1Point<F>,
-) -> (FF<F>, G1Point<F>) {
+fn row_function<P: EcipPoint>(ds: Vec<i8>, ps: &[P], q: P) -> (FF<P::Field>, P) {
     let one = 1;
     let minus_one = -1;
 
-    let digits_points: Vec<G1Point<F>> = ds
+    let digits_points: Vec<P> = ds
         .iter()
         .zip(ps.iter())
         .map(|(&d, p)| {
@@ -262,10 +309,7 @@ fn row_function<F: IsPrimeField + CurveParamsProvider<F>>(
             } else if d == minus_one {
                 p.neg()
             } else {
-                G1Point {
-                    x: FieldElement::zero(),
-                    y: FieldElement::zero(),
-                }
+                P::infinity()
             }
         })
         .collect();
@@ -283,21 +327,18 @@ fn row_function<F: IsPrimeField + CurveParamsProvider<F>>(
     let mut div_ = vec![q_neg.clone(), q_neg.clone(), q_neg.clone(), q2.neg()];
     div_.extend(digits_points.iter().cloned());
 
-    let div: Vec<G1Point<F>> = div_.into_iter().filter(|p| !p.is_infinity()).collect();
+    let div: Vec<P> = div_.into_iter().filter(|p| !p.is_infinity()).collect();
 
     let d = construct_function(div);
 
     (d, q2)
 }
 
-fn ecip_functions<F: IsPrimeField + CurveParamsProvider<F>>(
-    bs: &[G1Point<F>],
-    dss: Vec<Vec<i8>>,
-) -> (G1Point<F>, Vec<FF<F>>) {
+fn ecip_functions<P: EcipPoint>(bs: &[P], dss: Vec<Vec<i8>>) -> (P, Vec<FF<P::Field>>) {
     let mut dss = dss;
     dss.reverse();
-    let mut q = G1Point::new_unchecked(FieldElement::zero(), FieldElement::zero());
-    let mut divisors: Vec<FF<F>> = Vec::new();
+    let mut q = P::infinity();
+    let mut divisors: Vec<FF<P::Field>> = Vec::new();
     for ds in dss.iter() {
         let (div, new_q) = row_function(ds.clone(), bs, q);
 
@@ -309,7 +350,7 @@ fn ecip_functions<F: IsPrimeField + CurveParamsProvider<F>>(
     (q, divisors)
 }
 
-fn dlog<F: IsPrimeField + CurveParamsProvider<F>>(d: FF<F>) -> FunctionFelt<F> {
+fn dlog<P: EcipPoint>(d: FF<P::Field>) -> FunctionFelt<P::Field> {
     let d = d.reduce();
     assert!(
         d.coeffs.len() == 2,
@@ -318,27 +359,29 @@ fn dlog<F: IsPrimeField + CurveParamsProvider<F>>(d: FF<F>) -> FunctionFelt<F> {
         d.coeffs
     );
 
-    let dx = FF::new(vec![
-        d.coeffs[0].differentiate(),
-        d.coeffs[1].differentiate(),
-    ]);
+    let dx = FF::new(
+        vec![d.coeffs[0].differentiate(), d.coeffs[1].differentiate()],
+        P::y2(),
+    );
 
     let dy = d.coeffs[1].clone();
 
-    let two_y = FF::<F>::new(vec![
-        Polynomial::<F>::zero(),
-        Polynomial::new(vec![FieldElement::<F>::from(2)]),
-    ]);
+    let two_y = FF::<P::Field>::new(
+        vec![
+            Polynomial::<P::Field>::zero(),
+            Polynomial::new(vec![FieldElement::<P::Field>::from(2)]),
+        ],
+        P::y2(),
+    );
 
     let poly = dy.clone()
-        * Polynomial::<F>::new(vec![
-            F::get_curve_params().a,
+        * Polynomial::<P::Field>::new(vec![
+            P::curve_a(),
             FieldElement::zero(),
             FieldElement::from(3),
         ]);
 
-    let u = dx.clone() * two_y.clone() + FF::new(vec![poly, Polynomial::zero()]);
-
+    let u = dx.clone() * two_y.clone() + FF::new(vec![poly, Polynomial::zero()], P::y2());
     let v = two_y * d.clone();
 
     let num = (u * v.clone().neg_y()).reduce();
@@ -376,3 +419,215 @@ fn dlog<F: IsPrimeField + CurveParamsProvider<F>>(d: FF<F>) -> FunctionFelt<F> {
         ),
     }
 }
+
+pub fn derive_ec_point_from_x_hint(
+    x: BigUint,
+    curve_id: usize,
+) -> Result<[Vec<BigUint>; 2], String> {
+    let stark_modulus =
+        biguint_from_hex(&Stark252PrimeField::modulus_minus_one().to_string()) + 1usize;
+    if x >= stark_modulus {
+        return Err(String::from("x must be a felt252"));
+    }
+    let x = element_from_biguint::<Stark252PrimeField>(&x);
+    match curve_id {
+        0 => Ok(handle_derive_ec_point_from_x::<BN254PrimeField>(&x)),
+        1 => Ok(handle_derive_ec_point_from_x::<BLS12381PrimeField>(&x)),
+        2 => Ok(handle_derive_ec_point_from_x::<SECP256K1PrimeField>(&x)),
+        3 => Ok(handle_derive_ec_point_from_x::<SECP256R1PrimeField>(&x)),
+        4 => Ok(handle_derive_ec_point_from_x::<X25519PrimeField>(&x)),
+        5 => Ok(handle_derive_ec_point_from_x::<GrumpkinPrimeField>(&x)),
+        _ => Err(String::from("Invalid curve ID")),
+    }
+}
+
+fn handle_derive_ec_point_from_x<F>(x: &FieldElement<Stark252PrimeField>) -> [Vec<BigUint>; 2]
+where
+    F: IsPrimeField + CurveParamsProvider<F>,
+    FieldElement<F>: ByteConversion,
+{
+    let (point, g_rhs_roots) = derive_ec_point_from_x::<F>(x);
+    [
+        field_elements_to_big_uints(&[point.x, point.y]),
+        field_elements_to_big_uints(&g_rhs_roots),
+    ]
+}
+
+/// Try-and-increment from a "random" x coordinate to a point of the curve, as checked by the
+/// Cairo derive_ec_point_from_X: while x^3 + ax + b is not a square, the square root of
+/// g * (x^3 + ax + b) is stored and x is updated to hades_permutation(x, attempt, 2)[0].
+/// Returns the point, with the smallest root as y, and the roots of the failed attempts.
+pub fn derive_ec_point_from_x<F>(
+    x_252: &FieldElement<Stark252PrimeField>,
+) -> (G1Point<F>, Vec<FieldElement<F>>)
+where
+    F: IsPrimeField + CurveParamsProvider<F>,
+    FieldElement<F>: ByteConversion,
+{
+    let params = F::get_curve_params();
+    let a = params.a;
+    let b = params.b;
+    let g = params.fp_generator;
+    let rhs_compute = |x: &FieldElement<F>| x * x * x + &a * x + &b;
+
+    let mut x_252 = *x_252;
+    let mut rhs = rhs_compute(&felt252_to_element(&x_252));
+    let mut g_rhs_roots = vec![];
+    let mut attempt = 0;
+    while rhs.legendre_symbol() == LegendreSymbol::MinusOne {
+        let g_rhs = &rhs * &g;
+        g_rhs_roots.push(sqrt(&g_rhs));
+        let mut state = [x_252, FieldElement::from(attempt), FieldElement::from(2)];
+        PoseidonCairoStark252::hades_permutation(&mut state);
+        x_252 = state[0];
+        rhs = rhs_compute(&felt252_to_element(&x_252));
+        attempt += 1;
+    }
+    let y = sqrt(&rhs);
+    (
+        G1Point::new_unchecked(felt252_to_element(&x_252), y),
+        g_rhs_roots,
+    )
+}
+
+fn sqrt<F>(value: &FieldElement<F>) -> FieldElement<F>
+where
+    F: IsPrimeField,
+    FieldElement<F>: ByteConversion,
+{
+    let (root1, root2) = value.sqrt().expect("there is no root");
+    if element_to_biguint(&root1) < element_to_biguint(&root2) {
+        root1
+    } else {
+        root2
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::algebra::g2point::G2Point;
+
+    #[test]
+    fn test_zk_ecip_hint_g2() {
+        let [x0, x1, y0, y1] = [
+            "0x1800deef121f1e76426a00665e5c4479674322d4f75edadd46debd5cd992f6ed",
+            "0x198e9393920d483a7260bfb731fb5d25f1aa493335a9e71297e485b7aef312c2",
+            "0x12c85ea5db8c6deb4aab71808dcb408fe3d1e7690c43d37b4ce6cc0166fa7daa",
+            "0x90689d0585ff075ec9e99ad690c3395bc4b313370b38ef355acdadcd122975b",
+        ]
+        .map(|v| FieldElement::<BN254PrimeField>::from_hex(v).unwrap());
+        let g = G2Point::<BN254PrimeField, BN254Degree2ExtensionField>::new(
+            [x0.clone(), x1.clone()],
+            [y0.clone(), y1.clone()],
+        )
+        .unwrap();
+        let g2 = g.add(&g);
+        let mut expected = g.clone();
+        for _ in 1..19 {
+            expected = expected.add(&g);
+        }
+
+        // 5 * G + 7 * 2G = 19 * G
+        let scalars = vec![BigUint::from(5u32), BigUint::from(7u32)];
+        let (q, _) = run_ecip(&[g.clone(), g2.clone()], &scalars);
+        assert!(q == expected);
+
+        let (g2_x, g2_y) = g2.get_coords();
+        let values = [x0, x1, y0, y1]
+            .into_iter()
+            .chain(g2_x)
+            .chain(g2_y)
+            .map(|v| element_to_biguint(&v))
+            .collect();
+        let result = zk_ecip_hint_g2(values, scalars, 0).unwrap();
+        let (q_x, q_y) = expected.get_coords();
+        let q_coords: Vec<BigUint> = q_x
+            .iter()
+            .chain(q_y.iter())
+            .map(element_to_biguint)
+            .collect();
+        assert_eq!(result[0], q_coords);
+
+        // sum_dlog computed by the Python path: zk_ecip_hint([G, 2G], [5, 7], use_rust=False).
+        let expected_sum_dlog: [&[&str]; 4] = [
+            &[
+                "0x2468045642d5f8902543e3d82432a3a55e76d378608d9baff6dc277c351dc5d1",
+                "0x35aecdaf5171cdb9d9a7f4a02e9755d689f9ce82f9d0387254154fc1a5c4319",
+                "0x1b7f633eab58655011f851acfc88bfbb1b998a45741a4267671ae5756f117acc",
+                "0x28592bf2f778e7917fbdf620167cfadcbeb7cf1b72a043b78d81afbe238b7bff",
+                "0x183227397098d014dc2822db40c0ac2ecbc0b548b438e5469e10460b6c3e7eab",
+                "0x0",
+            ],
+            &[
+                "0x252536f453adc946b3368783e969a7702e0d28bbe8ea83cea25c39b378cd03ff",
+                "0x2f43648d03c2e6bc2140dfa412d004bc97c34ed96c85241feb744d571afdfad7",
+                "0x15767e4804f4e80d5aa21e930c173515c5852decc140586e357b072d3a8528ae",
+                "0x2d0d1f53ce654cc2d2e85fad572749b1e191fa6b454345a916037579f4fc450e",
+                "0xb1f9126fbf686b75f2584cbfe523220b75263e2162e4e8a202cbdd0b53d0f9b",
+                "0x1bb6d111c4b968806ca72b555630bbe0eb9b7cdd0eb543a8698da9a22f47505",
+                "0x1",
+                "0x0",
+            ],
+            &[
+                "0x1a309075d0f6eef38c6a1be2c65420850cbfcc9fc66ff82beb073c6c29fc013e",
+                "0x10419b1d41497c91317d80f7537bdc0f054b4ed7de1dcd10c631144e4a1c57e6",
+                "0x20c34de2e73d151b5e9dc5e4d3811cf36d490242d56f6fe4ba6d82486e4b1b71",
+                "0x988a5e3c346b618d22da97f48a9cd9cef494483d48a8c6dec05b913f39c7381",
+                "0x18fb0e1f6bb4379251f59688628d5da77027b33d57dcee60185104c43091800b",
+                "0x305ad5a1d25fbb1503095e6e5e886485e00b16e0e6596a19b521157850ae1fec",
+                "0xde42e1085cee1501a6bba7e0f35596b2ded78f9274278a424801affbe612fa1",
+                "0x1df213dc286c0a333630c0cbd080d5f577c18fbf2ea45526bdb22c434f7bc03b",
+            ],
+            &[
+                "0x48483582b1134d475ebb090f2b69fd1c533c98d5b8091afe44b19b6b3984fb5",
+                "0x1a0196224af4bff77c4629f9cf3158ca93ad70e74da928dd97d0527f96edbbee",
+                "0x1484a4e281ab606d1d70ae2e333e7ae6109570b6e820ab9af87e9f7695b77648",
+                "0x177db438bdc46b5a886f3879a5ea021a15ae978514816a0da3c16d75e2e9b3f0",
+                "0x1db1386a531407ce6022bc5a8fddd9538e324af12ae48681a66a78b127c0e59e",
+                "0x284b0e7c730a31746286f9f10dd0ac177bc7cc8e9db6a4bb88b5d46ce41ceea1",
+                "0x1fd585c24134d3cb7ca45a6683c8b9d64c40840fda54a8e498a39478c4f13f9d",
+                "0x2fda783d3eb3e590ee6d8f5201a902b13f12ef5e51b23c72d0170a5da0c110a9",
+                "0x15767e4804f4e80d5aa21e930c173515c5852decc140586e357b072d3a8528ae",
+                "0x2d0d1f53ce654cc2d2e85fad572749b1e191fa6b454345a916037579f4fc450e",
+                "0xb1f9126fbf686b75f2584cbfe523220b75263e2162e4e8a202cbdd0b53d0f9b",
+                "0x1bb6d111c4b968806ca72b555630bbe0eb9b7cdd0eb543a8698da9a22f47505",
+                "0x1",
+                "0x0",
+            ],
+        ];
+        for (coeffs, expected) in result[1..].iter().zip(expected_sum_dlog) {
+            let expected: Vec<BigUint> = expected.iter().map(|v| biguint_from_hex(v)).collect();
+            assert_eq!(coeffs, &expected);
+        }
+    }
+
+    #[test]
+    fn test_derive_ec_point_from_x_hint() {
+        // Values of the derive_ec_point_from_X_BN254_0 test of ec_ops.cairo.
+        let x = BigUint::parse_bytes(
+            b"1007924606664371314454745651482312426967359991013948795084104590968267883012",
+            10,
+        )
+        .unwrap();
+        let [point, g_rhs_roots] = derive_ec_point_from_x_hint(x, 0).unwrap();
+        assert_eq!(
+            point,
+            [
+                biguint_from_hex(
+                    "0x2763f5473b1953eed10c0cb48d824856b668918ca77736f57333ec7243f64dc"
+                ),
+                biguint_from_hex(
+                    "0x15150916fc849dd870aa740aee8c937ce5a652ed598cfc33bd761e9f469d5cf1"
+                ),
+            ]
+        );
+        assert_eq!(
+            g_rhs_roots,
+            [biguint_from_hex(
+                "0x299198e451040cbf5002d67b9fa4c1219c100a470af0825548810253be61ac2"
+            )]
+        );
+        assert!(derive_ec_point_from_x_hint(BigUint::from(1u32) << 252, 0).is_err());
+    }
+}
@@ -1,24 +1,17 @@
 use crate::algebra::polynomial::Polynomial;
 use crate::definitions::FieldElement;
-use lambdaworks_math::field::traits::IsPrimeField;
+use lambdaworks_math::field::traits::{IsField, IsPrimeField};
 use std::ops::{Add, Mul};
 
-use crate::definitions::CurveParamsProvider;
-
 #[derive(Debug, Clone)]
-pub struct FF<F: IsPrimeField> {
+pub struct FF<F: IsField> {
     pub coeffs: Vec<Polynomial<F>>,
     pub y2: Polynomial<F>,
 }
 
-impl<F: IsPrimeField + CurveParamsProvider<F>> FF<F> {
-    pub fn new(coeffs: Vec<Polynomial<F>>) -> Self {
-        let curve_params = F::get_curve_params();
-        let a = curve_params.a;
-        let b = curve_params.b;
-
-        let y2 = Polynomial::new(vec![b, a, FieldElement::zero(), FieldElement::one()]);
-
+impl<F: IsField> FF<F> {
+    /// y2 is the right hand side x^3 + ax + b of the curve equation, see EcipPoint::y2.
+    pub fn new(coeffs: Vec<Polynomial<F>>, y2: Polynomial<F>) -> Self {
         FF { coeffs, y2 }
     }
 
@@ -111,7 +104,9 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> FF<F> {
             y2: self.y2.clone(),
         }
     }
+}
 
+impl<F: IsPrimeField> FF<F> {
     pub fn print_as_sage_poly(&self) -> String {
         let mut string = String::new();
         let coeffs = &self.coeffs;
@@ -136,7 +131,7 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> FF<F> {
     }
 }
 
-impl<F: IsPrimeField + CurveParamsProvider<F>> Add for FF<F> {
+impl<F: IsField> Add for FF<F> {
     type Output = Self;
 
     fn add(self, other: Self) -> Self::Output {
@@ -151,11 +146,11 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> Add for FF<F> {
             coeffs[i] = coeffs[i].clone() + other.coeffs[i].clone();
         }
 
-        FF::new(coeffs)
+        FF::new(coeffs, self.y2)
     }
 }
 
-impl<F: IsPrimeField + CurveParamsProvider<F>> Mul for FF<F> {
+impl<F: IsField> Mul for FF<F> {
     type Output = Self;
 
     fn mul(self, other: Self) -> Self::Output {
@@ -163,7 +158,7 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> Mul for FF<F> {
         let mut coeffs = vec![Polynomial::zero(); max_degree];
 
         if self.coeffs.is_empty() || other.coeffs.is_empty() {
-            return FF::new(vec![Polynomial::zero()]);
+            return FF::new(vec![Polynomial::zero()], self.y2);
         }
 
         for (i, self_poly) in self.coeffs.iter().enumerate() {
@@ -173,6 +168,6 @@ impl<F: IsPrimeField + CurveParamsProvider<F>> Mul for FF<F> {
             }
         }
 
-        FF::new(coeffs)
+        FF::new(coeffs, self.y2)
     }
 }
@@ -0,0 +1,118 @@
+use crate::algebra::extf_mul::to_e2;
+use crate::algebra::g1point::G1Point;
+use crate::algebra::g2point::G2Point;
+use crate::algebra::polynomial::Polynomial;
+use crate::definitions::{CurveParamsProvider, FieldElement};
+use lambdaworks_math::field::traits::{IsField, IsPrimeField, IsSubFieldOf};
+
+/// A point of a curve y^2 = x^3 + ax + b on which the ECIP hint can be computed.
+/// Implemented for G1 points (coordinates in Fp) and G2 points (coordinates in Fp2).
+pub trait EcipPoint: Clone + PartialEq {
+    type Field: IsField;
+
+    fn x(&self) -> &FieldElement<Self::Field>;
+    fn y(&self) -> &FieldElement<Self::Field>;
+    fn infinity() -> Self;
+    fn is_infinity(&self) -> bool;
+    fn neg(&self) -> Self;
+    fn add(&self, other: &Self) -> Self;
+    fn scalar_mul_neg_3(&self) -> Self;
+    fn curve_a() -> FieldElement<Self::Field>;
+    fn curve_b() -> FieldElement<Self::Field>;
+
+    /// y^2 = x^3 + ax + b, as a polynomial in x.
+    fn y2() -> Polynomial<Self::Field> {
+        Polynomial::new(vec![
+            Self::curve_b(),
+            Self::curve_a(),
+            FieldElement::zero(),
+            FieldElement::one(),
+        ])
+    }
+}
+
+impl<F: IsPrimeField + CurveParamsProvider<F>> EcipPoint for G1Point<F> {
+    type Field = F;
+
+    fn x(&self) -> &FieldElement<F> {
+        &self.x
+    }
+
+    fn y(&self) -> &FieldElement<F> {
+        &self.y
+    }
+
+    fn infinity() -> Self {
+        G1Point::new_unchecked(FieldElement::zero(), FieldElement::zero())
+    }
+
+    fn is_infinity(&self) -> bool {
+        G1Point::is_infinity(self)
+    }
+
+    fn neg(&self) -> Self {
+        G1Point::neg(self)
+    }
+
+    fn add(&self, other: &Self) -> Self {
+        G1Point::add(self, other)
+    }
+
+    fn scalar_mul_neg_3(&self) -> Self {
+        G1Point::scalar_mul_neg_3(self)
+    }
+
+    fn curve_a() -> FieldElement<F> {
+        F::get_curve_params().a
+    }
+
+    fn curve_b() -> FieldElement<F> {
+        F::get_curve_params().b
+    }
+}
+
+impl<F, E2> EcipPoint for G2Point<F, E2>
+where
+    F: IsPrimeField + CurveParamsProvider<F> + IsSubFieldOf<E2>,
+    E2: IsField<BaseType = [FieldElement<F>; 2]>,
+{
+    type Field = E2;
+
+    fn x(&self) -> &FieldElement<E2> {
+        &self.x
+    }
+
+    fn y(&self) -> &FieldElement<E2> {
+        &self.y
+    }
+
+    fn infinity() -> Self {
+        let zero = to_e2([FieldElement::zero(), FieldElement::zero()]);
+        G2Point::new_unchecked(zero.clone(), zero)
+    }
+
+    fn is_infinity(&self) -> bool {
+        G2Point::is_infinity(self)
+    }
+
+    fn neg(&self) -> Self {
+        G2Point::neg(self)
+    }
+
+    fn add(&self, other: &Self) -> Self {
+        G2Point::add(self, other)
+    }
+
+    fn scalar_mul_neg_3(&self) -> Self {
+        G2Point::scalar_mul_neg_3(self)
+    }
+
+    fn curve_a() -> FieldElement<E2> {
+        to_e2([F::get_curve_params().a, FieldElement::zero()])
+    }
+
+    fn curve_b() -> FieldElement<E2> {
+        let curve_params = F::get_curve_params();
+        to_e2([curve_params.b20, curve_params.b21])
+    }
+}
@@ -1,5 +1,6 @@
 use crate::algebra::{
-    g1g2pair::G1G2Pair, g1point::G1Point, g2point::G2Point, rational_function::FunctionFelt,
+    extf_mul::from_e2, g1g2pair::G1G2Pair, g1point::G1Point, g2point::G2Point,
+    rational_function::FunctionFelt,
 };
 use crate::definitions::{CurveParamsProvider, FieldElement, Stark252PrimeField};
 use lambdaworks_math::{
@@ -20,6 +21,24 @@ where
         .collect::<Result<Vec<_>, _>>()
 }
 
+pub fn parse_g2_points_from_flattened_field_elements_list<F, E2>(
+    values: &[FieldElement<F>],
+) -> Result<Vec<G2Point<F, E2>>, String>
+where
+    F: IsPrimeField + CurveParamsProvider<F> + IsSubFieldOf<E2>,
+    E2: IsField<BaseType = [FieldElement<F>; 2]>,
+{
+    values
+        .chunks(4)
+        .map(|chunk| {
+            G2Point::new(
+                [chunk[0].clone(), chunk[1].clone()],
+                [chunk[2].clone(), chunk[3].clone()],
+            )
+        })
+        .collect::<Result<Vec<_>, _>>()
+}
+
 pub fn parse_g1_g2_pairs_from_flattened_field_elements_list<F, E2>(
     values: &[FieldElement<F>],
 ) -> Result<Vec<G1G2Pair<F, E2>>, String>
@@ -81,6 +100,19 @@ where
     values.iter().map(element_to_biguint).collect()
 }
 
+pub fn e2_elements_to_big_uints<F, E2>(values: &[FieldElement<E2>]) -> Vec<BigUint>
+where
+    F: IsPrimeField + IsSubFieldOf<E2>,
+    E2: IsField<BaseType = [FieldElement<F>; 2]>,
+    FieldElement<F>: ByteConversion,
+{
+    values
+        .iter()
+        .flat_map(|x| from_e2(x.clone()))
+        .map(|x| element_to_biguint(&x))
+        .collect()
+}
+
 pub fn element_to_biguint<F>(x: &FieldElement<F>) -> BigUint
 where
     F: IsPrimeField,
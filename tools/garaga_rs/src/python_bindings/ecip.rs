@@ -3,11 +3,38 @@ use crate::ecip;
 #[pyfunction]
 pub fn zk_ecip_hint(
     py: Python,
-    flattened_g1_points_list: &Bound<'_, PyList>,
+    flattened_g1_points_list: &Bound<'_, PyAny>,
     scalars_list: &Bound<'_, PyList>,
     curve_id: usize,
 ) -> PyResult<PyObject> {
-    let list_values = flattened_g1_points_list
+    let list_values = extract_biguint_list(flattened_g1_points_list)?;
+
+    let list_scalars = scalars_list
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<BigUint>, _>>()?;
+
+    // Released so that independent hints can be computed concurrently from Python threads.
+    let v = py
+        .allow_threads(|| ecip::core::zk_ecip_hint(list_values, list_scalars, curve_id))
+        .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)?;
+
+    let inner_lists: Vec<_> = v
+        .into_iter()
+        .map(|x| PyList::new(py, x))
+        .collect::<PyResult<_>>()?;
+    let py_list = PyList::new(py, inner_lists)?;
+    Ok(py_list.into())
+}
+
+#[pyfunction]
+pub fn zk_ecip_hint_g2(
+    py: Python,
+    flattened_g2_points_list: &Bound<'_, PyList>,
+    scalars_list: &Bound<'_, PyList>,
+    curve_id: usize,
+) -> PyResult<PyObject> {
+    let list_values = flattened_g2_points_list
         .into_iter()
         .map(|x| x.extract())
         .collect::<Result<Vec<BigUint>, _>>()?;
@@ -17,7 +44,21 @@ pub fn zk_ecip_hint(
         .map(|x| x.extract())
         .collect::<Result<Vec<BigUint>, _>>()?;
 
-    let v = ecip::core::zk_ecip_hint(list_values, list_scalars, curve_id)
+    let v = py
+        .allow_threads(|| ecip::core::zk_ecip_hint_g2(list_values, list_scalars, curve_id))
+        .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)?;
+
+    let inner_lists: Vec<_> = v
+        .into_iter()
+        .map(|x| PyList::new(py, x))
+        .collect::<PyResult<_>>()?;
+    let py_list = PyList::new(py, inner_lists)?;
+    Ok(py_list.into())
+}
+
+#[pyfunction]
+pub fn derive_ec_point_from_x(py: Python, x: BigUint, curve_id: usize) -> PyResult<PyObject> {
+    let v = ecip::core::derive_ec_point_from_x_hint(x, curve_id)
         .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)?;
 
     let inner_lists: Vec<_> = v
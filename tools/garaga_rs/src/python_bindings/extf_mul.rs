@@ -58,3 +58,77 @@ where
     let py_tuple = PyTuple::new(py, [q_list, r_list])?;
     Ok(py_tuple.into())
 }
+
+#[pyfunction]
+pub fn nondeterministic_extension_field_mul_divmod_batch(
+    py: Python,
+    curve_id: usize,
+    ext_degree: usize,
+    py_products: &Bound<'_, PyList>,
+    py_rlc_coeffs: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    let products = py_products
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<Vec<Vec<BigUint>>>, _>>()?;
+    let rlc_coeffs = py_rlc_coeffs
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<BigUint>, _>>()?;
+    if rlc_coeffs.len() > products.len() {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "{} rlc coefficients for {} products",
+            rlc_coeffs.len(),
+            products.len()
+        )));
+    }
+    let curve_id = CurveID::try_from(curve_id).unwrap();
+    match curve_id {
+        CurveID::BN254 => handle_extension_field_mul_divmod_batch::<BN254PrimeField>(
+            py, ext_degree, products, rlc_coeffs,
+        ),
+        CurveID::BLS12_381 => handle_extension_field_mul_divmod_batch::<BLS12381PrimeField>(
+            py, ext_degree, products, rlc_coeffs,
+        ),
+        _ => panic!("Curve ID {} not supported", curve_id as usize),
+    }
+}
+
+fn handle_extension_field_mul_divmod_batch<F>(
+    py: Python,
+    ext_degree: usize,
+    products: Vec<Vec<Vec<BigUint>>>,
+    rlc_coeffs: Vec<BigUint>,
+) -> PyResult<PyObject>
+where
+    F: IsPrimeField + CurveParamsProvider<F>,
+    FieldElement<F>: ByteConversion,
+{
+    let products = products
+        .iter()
+        .map(|ps| {
+            ps.iter()
+                .map(|coeffs| Polynomial::new(field_elements_from_big_uints::<F>(coeffs)))
+                .collect::<Vec<_>>()
+        })
+        .collect::<Vec<_>>();
+    let rlc_coeffs = field_elements_from_big_uints::<F>(&rlc_coeffs);
+    let (qs, rs, big_q) = py.allow_threads(|| {
+        extf_mul::nondeterministic_extension_field_mul_divmod_batch(
+            ext_degree,
+            products,
+            &rlc_coeffs,
+        )
+    });
+    let to_biguints = |p: Polynomial<F>| {
+        p.coefficients
+            .into_iter()
+            .map(|x| BigUint::from_bytes_be(&x.to_bytes_be()))
+            .collect::<Vec<BigUint>>()
+    };
+    let qs = PyList::new(py, qs.into_iter().map(to_biguints))?;
+    let rs = PyList::new(py, rs.into_iter().map(to_biguints))?;
+    let big_q = PyList::new(py, to_biguints(big_q))?;
+    let py_tuple = PyTuple::new(py, [qs, rs, big_q])?;
+    Ok(py_tuple.into())
+}
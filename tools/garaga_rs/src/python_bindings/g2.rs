@@ -1,4 +1,8 @@
 use super::*;
+use ark_ec::scalar_mul::fixed_base::FixedBase;
+use ark_ec::short_weierstrass::{Affine, Projective, SWCurveConfig};
+use ark_ec::{CurveGroup, Group, VariableBaseMSM};
+use std::sync::OnceLock;
 
 #[pyfunction]
 pub fn g2_add(
@@ -118,3 +122,151 @@ pub fn g2_scalar_mul(
 
     panic!("Curve ID {} not supported", curve_id);
 }
+
+// Window size of the fixed-base generator tables: a multiplication costs
+// ceil(scalar_size / 8) = 32 mixed additions and no doublings.
+const G2_GENERATOR_WINDOW_SIZE: usize = 8;
+
+static BN254_G2_GENERATOR_TABLE: OnceLock<Vec<Vec<ark_bn254::G2Affine>>> = OnceLock::new();
+static BLS12_381_G2_GENERATOR_TABLE: OnceLock<Vec<Vec<ark_bls12_381::G2Affine>>> = OnceLock::new();
+
+fn g2_generator_table<P: SWCurveConfig>() -> Vec<Vec<Affine<P>>> {
+    let scalar_size = <P::ScalarField as PrimeField>::MODULUS_BIT_SIZE as usize;
+    FixedBase::get_window_table(
+        scalar_size,
+        G2_GENERATOR_WINDOW_SIZE,
+        Projective::<P>::generator(),
+    )
+}
+
+fn g2_generator_windowed_mul<P: SWCurveConfig>(table: &[Vec<Affine<P>>], k: BigUint) -> Affine<P> {
+    let scalar_size = <P::ScalarField as PrimeField>::MODULUS_BIT_SIZE as usize;
+    let outerc = (scalar_size + G2_GENERATOR_WINDOW_SIZE - 1) / G2_GENERATOR_WINDOW_SIZE;
+    let k = P::ScalarField::from(k);
+    FixedBase::windowed_mul::<Projective<P>>(outerc, G2_GENERATOR_WINDOW_SIZE, table, &k)
+        .into_affine()
+}
+
+#[pyfunction]
+pub fn g2_generator_mul(
+    py: Python,
+    curve_id: usize,
+    py_int: &Bound<'_, PyInt>,
+) -> PyResult<PyObject> {
+    let k: BigUint = py_int.extract()?;
+
+    if curve_id == CURVE_BN254 {
+        let table = BN254_G2_GENERATOR_TABLE.get_or_init(g2_generator_table);
+        let c = g2_generator_windowed_mul(table, k);
+        let py_tuple = PyTuple::new(
+            py,
+            [
+                BigUint::from(c.x.c0.into_bigint()),
+                BigUint::from(c.x.c1.into_bigint()),
+                BigUint::from(c.y.c0.into_bigint()),
+                BigUint::from(c.y.c1.into_bigint()),
+            ],
+        );
+        return Ok(py_tuple?.into());
+    }
+
+    if curve_id == CURVE_BLS12_381 {
+        let table = BLS12_381_G2_GENERATOR_TABLE.get_or_init(g2_generator_table);
+        let c = g2_generator_windowed_mul(table, k);
+        let py_tuple = PyTuple::new(
+            py,
+            [
+                BigUint::from(c.x.c0.into_bigint()),
+                BigUint::from(c.x.c1.into_bigint()),
+                BigUint::from(c.y.c0.into_bigint()),
+                BigUint::from(c.y.c1.into_bigint()),
+            ],
+        );
+        return Ok(py_tuple?.into());
+    }
+
+    panic!("Curve ID {} not supported", curve_id);
+}
+
+fn g2_msm_pippenger<P: SWCurveConfig>(bases: &[Affine<P>], scalars: &[BigUint]) -> Affine<P> {
+    let scalars: Vec<P::ScalarField> = scalars
+        .iter()
+        .map(|k| P::ScalarField::from(k.clone()))
+        .collect();
+    // Pippenger bucket method, window size chosen by arkworks from the number of points.
+    Projective::<P>::msm_unchecked(bases, &scalars).into_affine()
+}
+
+#[pyfunction]
+pub fn g2_msm(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    py_list_2: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    assert!(py_list_1.len() % 4 == 0, "invalid length");
+    assert!(
+        py_list_1.len() / 4 == py_list_2.len(),
+        "points and scalars lengths mismatch"
+    );
+    let scalars: Vec<BigUint> = py_list_2
+        .into_iter()
+        .map(|x| x.extract())
+        .collect::<Result<Vec<BigUint>, _>>()?;
+
+    if curve_id == CURVE_BN254 {
+        use ark_bn254::{Fq, Fq2, G2Affine};
+        let mut bases = Vec::new();
+        for i in (0..py_list_1.len()).step_by(4) {
+            let a_0: BigUint = py_list_1.get_item(i)?.extract()?;
+            let a_1: BigUint = py_list_1.get_item(i + 1)?.extract()?;
+            let a_2: BigUint = py_list_1.get_item(i + 2)?.extract()?;
+            let a_3: BigUint = py_list_1.get_item(i + 3)?.extract()?;
+            let a = G2Affine::new(
+                Fq2::new(Fq::from(a_0), Fq::from(a_1)),
+                Fq2::new(Fq::from(a_2), Fq::from(a_3)),
+            );
+            bases.push(a);
+        }
+        let c = g2_msm_pippenger(&bases, &scalars);
+        let py_tuple = PyTuple::new(
+            py,
+            [
+                BigUint::from(c.x.c0.into_bigint()),
+                BigUint::from(c.x.c1.into_bigint()),
+                BigUint::from(c.y.c0.into_bigint()),
+                BigUint::from(c.y.c1.into_bigint()),
+            ],
+        );
+        return Ok(py_tuple?.into());
+    }
+
+    if curve_id == CURVE_BLS12_381 {
+        use ark_bls12_381::{Fq, Fq2, G2Affine};
+        let mut bases = Vec::new();
+        for i in (0..py_list_1.len()).step_by(4) {
+            let a_0: BigUint = py_list_1.get_item(i)?.extract()?;
+            let a_1: BigUint = py_list_1.get_item(i + 1)?.extract()?;
+            let a_2: BigUint = py_list_1.get_item(i + 2)?.extract()?;
+            let a_3: BigUint = py_list_1.get_item(i + 3)?.extract()?;
+            let a = G2Affine::new(
+                Fq2::new(Fq::from(a_0), Fq::from(a_1)),
+                Fq2::new(Fq::from(a_2), Fq::from(a_3)),
+            );
+            bases.push(a);
+        }
+        let c = g2_msm_pippenger(&bases, &scalars);
+        let py_tuple = PyTuple::new(
+            py,
+            [
+                BigUint::from(c.x.c0.into_bigint()),
+                BigUint::from(c.x.c1.into_bigint()),
+                BigUint::from(c.y.c0.into_bigint()),
+                BigUint::from(c.y.c1.into_bigint()),
+            ],
+        );
+        return Ok(py_tuple?.into());
+    }
+
+    panic!("Curve ID {} not supported", curve_id);
+}
@@ -8,20 +8,14 @@ use pyo3::types::PyList;
 #[pyfunction(signature = (proof, vk, curve_id, image_id=None, journal=None))]
 pub fn get_groth16_calldata(
     py: Python,
-    proof: &Bound<'_, PyList>,
-    vk: &Bound<'_, PyList>,
+    proof: &Bound<'_, PyAny>,
+    vk: &Bound<'_, PyAny>,
     curve_id: usize,
     image_id: Option<&[u8]>,
     journal: Option<&[u8]>,
 ) -> PyResult<PyObject> {
-    let proof_values = proof
-        .into_iter()
-        .map(|x| x.extract())
-        .collect::<Result<Vec<BigUint>, _>>()?;
-    let vk_values = vk
-        .into_iter()
-        .map(|x| x.extract())
-        .collect::<Result<Vec<BigUint>, _>>()?;
+    let proof_values = extract_biguint_list(proof)?;
+    let vk_values = extract_biguint_list(vk)?;
 
     // Handle optional parameters
     let image_id_values = image_id.map(|id| id.to_vec());
@@ -18,6 +18,7 @@ use lambdaworks_math::{field::traits::IsPrimeField, traits::ByteConversion};
 use crate::definitions::{BLS12381PrimeField, BN254PrimeField, FieldElement, Stark252PrimeField};
 use num_bigint::BigUint;
 use pyo3::{
+    buffer::PyBuffer,
     prelude::*,
     types::{PyBytes, PyInt, PyList, PyTuple},
 };
@@ -25,12 +26,54 @@ use pyo3::{
 const CURVE_BN254: usize = 0;
 const CURVE_BLS12_381: usize = 1;
 
+// Size in bytes of an integer in a packed buffer (garaga.definitions.PACKED_INT_BYTES).
+const PACKED_INT_BYTES: usize = 48;
+
+// Extracts a list of integers given either as a Python list of ints, or as an object supporting
+// the buffer protocol (bytes, bytearray, memoryview, ...) holding PACKED_INT_BYTES little-endian
+// bytes per integer, such as G1PointBatch.buffer.
+fn extract_biguint_list(obj: &Bound<'_, PyAny>) -> PyResult<Vec<BigUint>> {
+    if let Ok(py_list) = obj.downcast::<PyList>() {
+        return py_list
+            .into_iter()
+            .map(|x| x.extract())
+            .collect::<Result<Vec<BigUint>, _>>();
+    }
+    let buffer = PyBuffer::<u8>::get(obj)?;
+    if buffer.len_bytes() % PACKED_INT_BYTES != 0 {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Buffer length must be a multiple of {} bytes",
+            PACKED_INT_BYTES
+        )));
+    }
+    let values = match buffer.as_slice(obj.py()) {
+        // Contiguous buffer: read in place.
+        Some(cells) => cells
+            .chunks(PACKED_INT_BYTES)
+            .map(|chunk| {
+                let bytes: Vec<u8> = chunk.iter().map(|cell| cell.get()).collect();
+                BigUint::from_bytes_le(&bytes)
+            })
+            .collect(),
+        None => buffer
+            .to_vec(obj.py())?
+            .chunks(PACKED_INT_BYTES)
+            .map(BigUint::from_bytes_le)
+            .collect(),
+    };
+    Ok(values)
+}
+
 #[pymodule]
 fn garaga_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(g2::g2_add, m)?)?;
     m.add_function(wrap_pyfunction!(g2::g2_scalar_mul, m)?)?;
+    m.add_function(wrap_pyfunction!(g2::g2_generator_mul, m)?)?;
+    m.add_function(wrap_pyfunction!(g2::g2_msm, m)?)?;
     m.add_function(wrap_pyfunction!(pairing::multi_pairing, m)?)?;
     m.add_function(wrap_pyfunction!(pairing::multi_miller_loop, m)?)?;
+    m.add_function(wrap_pyfunction!(pairing::multi_pairing_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(pairing::multi_miller_loop_batch, m)?)?;
     m.add_function(wrap_pyfunction!(
         final_exp_witness::get_final_exp_witness,
         m
@@ -40,7 +83,13 @@ fn garaga_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
         extf_mul::nondeterministic_extension_field_mul_divmod,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(
+        extf_mul::nondeterministic_extension_field_mul_divmod_batch,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(ecip::zk_ecip_hint, m)?)?;
+    m.add_function(wrap_pyfunction!(ecip::zk_ecip_hint_g2, m)?)?;
+    m.add_function(wrap_pyfunction!(ecip::derive_ec_point_from_x, m)?)?;
     m.add_function(wrap_pyfunction!(msm::msm_calldata_builder, m)?)?;
     m.add_function(wrap_pyfunction!(mpc_calldata::mpc_calldata_builder, m)?)?;
     m.add_function(wrap_pyfunction!(groth16_calldata::get_groth16_calldata, m)?)?;
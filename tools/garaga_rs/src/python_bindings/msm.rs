@@ -4,7 +4,7 @@ use super::*;
 #[allow(clippy::too_many_arguments)]
 pub fn msm_calldata_builder(
     py: Python,
-    py_list1: &Bound<'_, PyList>,
+    py_list1: &Bound<'_, PyAny>,
     py_list2: &Bound<'_, PyList>,
     curve_id: usize,
     include_digits_decomposition: bool,
@@ -12,10 +12,7 @@ pub fn msm_calldata_builder(
     serialize_as_pure_felt252_array: bool,
     risc0_mode: bool,
 ) -> PyResult<PyObject> {
-    let values = py_list1
-        .into_iter()
-        .map(|x| x.extract())
-        .collect::<Result<Vec<BigUint>, _>>()?;
+    let values = extract_biguint_list(py_list1)?;
     let scalars = py_list2
         .into_iter()
         .map(|x| x.extract())
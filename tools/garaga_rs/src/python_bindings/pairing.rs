@@ -1,4 +1,5 @@
 use super::*;
+use ark_ec::short_weierstrass::{Affine, SWCurveConfig};
 
 #[pyfunction]
 pub fn multi_pairing(
@@ -181,3 +182,216 @@ pub fn multi_miller_loop(
 
     panic!("Curve ID {} not supported", curve_id);
 }
+
+// Batched API: many independent pairing instances are parsed while holding the GIL, then
+// computed on a pool of scoped threads with the GIL released.
+
+type PairingInstance<E> = (Vec<<E as Pairing>::G1Affine>, Vec<<E as Pairing>::G2Affine>);
+
+fn parse_pairing_instance<P1: SWCurveConfig, P2: SWCurveConfig>(
+    py_list: &Bound<'_, PyAny>,
+    g1: fn(BigUint, BigUint) -> Affine<P1>,
+    g2: fn(BigUint, BigUint, BigUint, BigUint) -> Affine<P2>,
+) -> PyResult<(Vec<Affine<P1>>, Vec<Affine<P2>>)> {
+    let py_list = py_list.downcast::<PyList>()?;
+    if py_list.len() % 6 != 0 {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "invalid length",
+        ));
+    }
+    let mut a_list = Vec::new();
+    let mut b_list = Vec::new();
+    for i in (0..py_list.len()).step_by(6) {
+        let a_0: BigUint = py_list.get_item(i)?.extract()?;
+        let a_1: BigUint = py_list.get_item(i + 1)?.extract()?;
+        let b_0: BigUint = py_list.get_item(i + 2)?.extract()?;
+        let b_1: BigUint = py_list.get_item(i + 3)?.extract()?;
+        let b_2: BigUint = py_list.get_item(i + 4)?.extract()?;
+        let b_3: BigUint = py_list.get_item(i + 5)?.extract()?;
+        a_list.push(g1(a_0, a_1));
+        b_list.push(g2(b_0, b_1, b_2, b_3));
+    }
+    Ok((a_list, b_list))
+}
+
+fn is_valid_pairing_instance<P1: SWCurveConfig, P2: SWCurveConfig>(
+    a_list: &[Affine<P1>],
+    b_list: &[Affine<P2>],
+) -> bool {
+    a_list
+        .iter()
+        .all(|a| a.is_on_curve() && a.is_in_correct_subgroup_assuming_on_curve())
+        && b_list
+            .iter()
+            .all(|b| b.is_on_curve() && b.is_in_correct_subgroup_assuming_on_curve())
+}
+
+// Runs the (point validation +) multi pairing or multi Miller loop of every instance.
+// Returns the index of the first invalid instance on error.
+fn multi_pairing_batch_inner<E, P1, P2>(
+    instances: Vec<PairingInstance<E>>,
+    miller_loop_only: bool,
+) -> Result<Vec<E::TargetField>, usize>
+where
+    E: Pairing<G1Affine = Affine<P1>, G2Affine = Affine<P2>>,
+    P1: SWCurveConfig,
+    P2: SWCurveConfig,
+{
+    let n_threads = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(instances.len())
+        .max(1);
+    let chunk_size = instances.len().div_ceil(n_threads).max(1);
+    let mut results: Vec<Option<E::TargetField>> = vec![None; instances.len()];
+    std::thread::scope(|s| {
+        for (instances, results) in instances
+            .chunks(chunk_size)
+            .zip(results.chunks_mut(chunk_size))
+        {
+            s.spawn(move || {
+                for ((a_list, b_list), result) in instances.iter().zip(results.iter_mut()) {
+                    if !is_valid_pairing_instance(a_list, b_list) {
+                        continue;
+                    }
+                    *result = Some(if miller_loop_only {
+                        E::multi_miller_loop(a_list.clone(), b_list.clone()).0
+                    } else {
+                        E::multi_pairing(a_list.clone(), b_list.clone()).0
+                    });
+                }
+            });
+        }
+    });
+    results
+        .into_iter()
+        .enumerate()
+        .map(|(i, r)| r.ok_or(i))
+        .collect()
+}
+
+fn multi_pairing_batch_impl(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+    miller_loop_only: bool,
+) -> PyResult<PyObject> {
+    let invalid_instance = |i: usize| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "instance {} contains a point not in the prime order subgroup",
+            i
+        ))
+    };
+
+    if curve_id == CURVE_BN254 {
+        use ark_bn254::{Bn254, Fq, Fq12, Fq2, G1Affine, G2Affine};
+        let instances = py_list_1
+            .iter()
+            .map(|x| {
+                parse_pairing_instance(
+                    &x,
+                    |a_0, a_1| G1Affine::new_unchecked(Fq::from(a_0), Fq::from(a_1)),
+                    |b_0, b_1, b_2, b_3| {
+                        G2Affine::new_unchecked(
+                            Fq2::new(Fq::from(b_0), Fq::from(b_1)),
+                            Fq2::new(Fq::from(b_2), Fq::from(b_3)),
+                        )
+                    },
+                )
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        let cs = py
+            .allow_threads(|| multi_pairing_batch_inner::<Bn254, _, _>(instances, miller_loop_only))
+            .map_err(invalid_instance)?;
+        fn to(v: Fq12) -> [BigUint; 12] {
+            [
+                BigUint::from(v.c0.c0.c0.into_bigint()),
+                BigUint::from(v.c0.c0.c1.into_bigint()),
+                BigUint::from(v.c0.c1.c0.into_bigint()),
+                BigUint::from(v.c0.c1.c1.into_bigint()),
+                BigUint::from(v.c0.c2.c0.into_bigint()),
+                BigUint::from(v.c0.c2.c1.into_bigint()),
+                BigUint::from(v.c1.c0.c0.into_bigint()),
+                BigUint::from(v.c1.c0.c1.into_bigint()),
+                BigUint::from(v.c1.c1.c0.into_bigint()),
+                BigUint::from(v.c1.c1.c1.into_bigint()),
+                BigUint::from(v.c1.c2.c0.into_bigint()),
+                BigUint::from(v.c1.c2.c1.into_bigint()),
+            ]
+        }
+        let py_list = PyList::new(
+            py,
+            cs.into_iter()
+                .map(|c| PyList::new(py, to(c)))
+                .collect::<PyResult<Vec<_>>>()?,
+        );
+        return Ok(py_list?.into());
+    }
+
+    if curve_id == CURVE_BLS12_381 {
+        use ark_bls12_381::{Bls12_381, Fq, Fq12, Fq2, G1Affine, G2Affine};
+        let instances = py_list_1
+            .iter()
+            .map(|x| {
+                parse_pairing_instance(
+                    &x,
+                    |a_0, a_1| G1Affine::new_unchecked(Fq::from(a_0), Fq::from(a_1)),
+                    |b_0, b_1, b_2, b_3| {
+                        G2Affine::new_unchecked(
+                            Fq2::new(Fq::from(b_0), Fq::from(b_1)),
+                            Fq2::new(Fq::from(b_2), Fq::from(b_3)),
+                        )
+                    },
+                )
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        let cs = py
+            .allow_threads(|| {
+                multi_pairing_batch_inner::<Bls12_381, _, _>(instances, miller_loop_only)
+            })
+            .map_err(invalid_instance)?;
+        fn to(v: Fq12) -> [BigUint; 12] {
+            [
+                BigUint::from(v.c0.c0.c0.into_bigint()),
+                BigUint::from(v.c0.c0.c1.into_bigint()),
+                BigUint::from(v.c0.c1.c0.into_bigint()),
+                BigUint::from(v.c0.c1.c1.into_bigint()),
+                BigUint::from(v.c0.c2.c0.into_bigint()),
+                BigUint::from(v.c0.c2.c1.into_bigint()),
+                BigUint::from(v.c1.c0.c0.into_bigint()),
+                BigUint::from(v.c1.c0.c1.into_bigint()),
+                BigUint::from(v.c1.c1.c0.into_bigint()),
+                BigUint::from(v.c1.c1.c1.into_bigint()),
+                BigUint::from(v.c1.c2.c0.into_bigint()),
+                BigUint::from(v.c1.c2.c1.into_bigint()),
+            ]
+        }
+        let py_list = PyList::new(
+            py,
+            cs.into_iter()
+                .map(|c| PyList::new(py, to(c)))
+                .collect::<PyResult<Vec<_>>>()?,
+        );
+        return Ok(py_list?.into());
+    }
+
+    panic!("Curve ID {} not supported", curve_id);
+}
+
+#[pyfunction]
+pub fn multi_pairing_batch(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    multi_pairing_batch_impl(py, curve_id, py_list_1, false)
+}
+
+#[pyfunction]
+pub fn multi_miller_loop_batch(
+    py: Python,
+    curve_id: usize,
+    py_list_1: &Bound<'_, PyList>,
+) -> PyResult<PyObject> {
+    multi_pairing_batch_impl(py, curve_id, py_list_1, true)
+}